@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+# Clients may store responses but must revalidate every time; a matching ETag costs a 304.
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+def strong_etag(*parts: Any) -> str:
+    digest = hashlib.sha256(json.dumps(parts, default=str, separators=(",", ":")).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True when ``If-None-Match`` lists ``etag`` (weak comparison, as RFC 9110 requires) or ``*``."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def cache_headers(etag: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL}
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers=cache_headers(etag))
+
+
+def json_response(body: bytes, etag: Optional[str] = None) -> Response:
+    return Response(content=body, media_type="application/json", headers=cache_headers(etag) if etag else None)
@@ -1,16 +1,48 @@
 from __future__ import annotations
 
-from datetime import timedelta
+import base64
+import json
+from datetime import datetime, timedelta
+from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Query, Request
 
 from app import db
-from app.schemas import ArticleListResponse, ArticleOut, DeleteArticleResponse, SaveResponse
+from app.api.http_cache import etag_matches, json_response, not_modified, strong_etag
+from app.schemas import ArticleListResponse, DeleteArticleResponse, SaveResponse
+from app.serialization import article_list_body, article_payload
+from app.services.events import ARTICLES_DELETED, ARTICLES_UPSERTED
 from app.utils import to_iso_utc, utc_now
 
 router = APIRouter(tags=["articles"])
 
 
+def encode_cursor(row) -> str:
+    """Opaque page cursor for the row a page ended on (its listing sort key)."""
+    key = [row["published_at_utc"], row["updated_at_utc"], row["id"]]
+    return base64.urlsafe_b64encode(json.dumps(key, separators=(",", ":")).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def window_cutoff(now_utc: datetime, window_hours: int, bucket_seconds: int) -> datetime:
+    """Window start rounded down to ``bucket_seconds`` so polls within a bucket share a cache key."""
+    cutoff = now_utc - timedelta(hours=window_hours)
+    if bucket_seconds <= 1:
+        return cutoff
+    epoch_seconds = int(cutoff.timestamp())
+    return datetime.fromtimestamp(epoch_seconds - epoch_seconds % bucket_seconds, tz=cutoff.tzinfo)
+
+
+def decode_cursor(cursor: str) -> tuple[str, str, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as exc:
+        raise HTTPException(status_code=400, detail="invalid cursor") from exc
+    if not (isinstance(key, list) and len(key) == 3 and all(isinstance(part, str) for part in key)):
+        raise HTTPException(status_code=400, detail="invalid cursor")
+    return key[0], key[1], key[2]
+
+
 @router.get("/articles", response_model=ArticleListResponse)
 def list_articles(
     request: Request,
@@ -19,59 +51,71 @@ def list_articles(
     source_id: str | None = Query(default=None),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
+    include_total: bool = Query(default=True),
 ):
     settings = request.app.state.settings
+    cache = request.app.state.article_cache
     effective_window = window_hours if window_hours > 0 else settings.ingestion_window_hours
-    cutoff_iso = to_iso_utc(utc_now() - timedelta(hours=effective_window))
+    cutoff_iso = to_iso_utc(window_cutoff(utc_now(), effective_window, settings.article_cache_ttl_seconds))
+
+    after = decode_cursor(cursor) if cursor else None
+    if after is not None and offset:
+        raise HTTPException(status_code=400, detail="cursor and offset cannot be combined")
+
+    with db.connection(settings.db_path, readonly=True) as conn:
+        cache_key = (db.data_version(conn), cutoff_iso, saved, source_id, limit, offset, cursor, include_total)
+        etag = strong_etag("articles", *cache_key)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return json_response(cached, etag)
 
-    with db.connection(settings.db_path) as conn:
         total, rows = db.list_articles(
             conn,
             cutoff_iso_utc=cutoff_iso,
             saved=saved,
             source_id=source_id,
-            limit=limit,
+            # One extra row tells whether another page exists.
+            limit=limit + 1,
             offset=offset,
+            after=after,
+            include_total=include_total,
         )
 
-    items = [
-        ArticleOut(
-            id=row["id"],
-            source_id=row["source_id"],
-            source_name=row["source_name"],
-            title=row["title"],
-            url=row["url"],
-            canonical_url=row["canonical_url"],
-            published_at_utc=row["published_at_utc"],
-            snippet=row["snippet"] or "",
-            image_url=row["image_url"],
-            is_saved=bool(row["is_saved"]),
-            first_seen_at_utc=row["first_seen_at_utc"],
-            last_seen_at_utc=row["last_seen_at_utc"],
-        )
-        for row in rows
-    ]
-    return ArticleListResponse(total=total, items=items)
+    next_cursor = encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+    rows = rows[:limit]
 
+    # response_model still documents the schema; the body is encoded directly from the rows.
+    body = article_list_body(total, rows, next_cursor)
+    cache.put(cache_key, body)
+    return json_response(body, etag)
 
-@router.post("/articles/{article_id}/save", response_model=SaveResponse)
-def save_article(article_id: str, request: Request):
+
+def _set_saved(request: Request, article_id: str, is_saved: bool) -> SaveResponse:
     settings = request.app.state.settings
     with db.connection(settings.db_path) as conn:
-        updated = db.set_article_saved(conn, article_id=article_id, is_saved=True)
+        updated = db.set_article_saved(conn, article_id=article_id, is_saved=is_saved)
+        rows = db.get_articles(conn, [article_id]) if updated else []
     if not updated:
         raise HTTPException(status_code=404, detail="article not found")
-    return SaveResponse(article_id=article_id, is_saved=True)
+    if rows:
+        request.app.state.events.publish(
+            ARTICLES_UPSERTED,
+            {"source_id": rows[0]["source_id"], "inserted": 0, "updated": 1, "items": [article_payload(rows[0])]},
+        )
+    return SaveResponse(article_id=article_id, is_saved=is_saved)
+
+
+@router.post("/articles/{article_id}/save", response_model=SaveResponse)
+def save_article(article_id: str, request: Request):
+    return _set_saved(request, article_id, True)
 
 
 @router.delete("/articles/{article_id}/save", response_model=SaveResponse)
 def unsave_article(article_id: str, request: Request):
-    settings = request.app.state.settings
-    with db.connection(settings.db_path) as conn:
-        updated = db.set_article_saved(conn, article_id=article_id, is_saved=False)
-    if not updated:
-        raise HTTPException(status_code=404, detail="article not found")
-    return SaveResponse(article_id=article_id, is_saved=False)
+    return _set_saved(request, article_id, False)
 
 
 @router.delete("/articles/{article_id}", response_model=DeleteArticleResponse)
@@ -81,4 +125,5 @@ def delete_article(article_id: str, request: Request):
         deleted = db.delete_article(conn, article_id=article_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="article not found")
+    request.app.state.events.publish(ARTICLES_DELETED, {"ids": [article_id]})
     return DeleteArticleResponse(article_id=article_id, deleted=True)
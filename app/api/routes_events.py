@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import AsyncIterator, Optional
+
+from fastapi import APIRouter, Header, Request
+from fastapi.responses import StreamingResponse
+
+from app.serialization import dumps
+from app.services.events import Event, EventBus
+
+router = APIRouter(tags=["events"])
+
+# Idle streams send a comment this often so proxies keep the connection open and
+# disconnected clients are noticed.
+HEARTBEAT_SECONDS = 15.0
+RECONNECT_DELAY_MS = 3000
+
+
+def format_event(event: Event) -> bytes:
+    return b"id: %d\nevent: %s\ndata: %s\n\n" % (event.id, event.type.encode("ascii"), dumps(event.data))
+
+
+async def event_stream(
+    request: Request, bus: EventBus, last_event_id: Optional[int], heartbeat_seconds: float = HEARTBEAT_SECONDS
+) -> AsyncIterator[bytes]:
+    subscription = bus.subscribe(last_event_id)
+    try:
+        yield b"retry: %d\n\n" % RECONNECT_DELAY_MS
+        while True:
+            event = await subscription.get(timeout=heartbeat_seconds)
+            if event is not None:
+                yield format_event(event)
+            elif await request.is_disconnected():
+                break
+            else:
+                yield b": keepalive\n\n"
+    finally:
+        subscription.close()
+
+
+def _parse_event_id(raw: Optional[str]) -> Optional[int]:
+    try:
+        return int(raw) if raw else None
+    except ValueError:
+        return None
+
+
+@router.get("/events")
+async def events(request: Request, last_event_id: Optional[str] = Header(default=None)):
+    """Server-sent events: article upserts/deletes/prunes and ingestion run changes."""
+    stream = event_stream(request, request.app.state.events, _parse_event_id(last_event_id))
+    return StreamingResponse(
+        stream,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,19 +1,16 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Query, Request
 
-from app.schemas import SourceHealthOut, SourceHealthResponse
+from app.schemas import CacheStatsOut, SourceHealthOut, SourceHealthResponse
 from app.utils import to_iso_utc, utc_now
 
 router = APIRouter(tags=["health"])
 
 
 @router.get("/sources/health", response_model=SourceHealthResponse)
-def sources_health(request: Request):
-    settings = request.app.state.settings
-    adapters = request.app.state.adapters
-
-    checks = [adapter.check_health(settings) for adapter in adapters]
+def sources_health(request: Request, refresh: bool = Query(default=False)):
+    snapshot = request.app.state.health_monitor.snapshot(refresh=refresh)
     sources = [
         SourceHealthOut(
             source_id=check.source_id,
@@ -22,7 +19,17 @@ def sources_health(request: Request):
             checked_at_utc=check.checked_at_utc,
             detail=check.detail,
         )
-        for check in checks
+        for check in snapshot.checks
     ]
 
-    return SourceHealthResponse(timestamp_utc=to_iso_utc(utc_now()), sources=sources)
+    return SourceHealthResponse(
+        timestamp_utc=to_iso_utc(utc_now()),
+        checked_at_utc=snapshot.checked_at_utc,
+        age_seconds=round(snapshot.age_seconds(), 3),
+        sources=sources,
+    )
+
+
+@router.get("/cache/stats", response_model=CacheStatsOut)
+def cache_stats(request: Request):
+    return CacheStatsOut(**request.app.state.article_cache.stats())
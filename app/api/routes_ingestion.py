@@ -1,32 +1,47 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request, Response
 
+from app.api.http_cache import etag_matches, json_response, not_modified, strong_etag
 from app.schemas import IngestionRunOut, IngestionStatusResponse, TriggerResponse
 
 router = APIRouter(tags=["ingestion"])
 
 
-@router.post("/ingestion/run", response_model=TriggerResponse)
-def run_ingestion(request: Request):
+@router.post("/ingestion/run", response_model=TriggerResponse, status_code=202)
+def run_ingestion(request: Request, response: Response):
     service = request.app.state.ingestion_service
-    accepted, run, message = service.run_once(trigger="manual")
+    accepted, run, message = service.start_run(trigger="manual")
 
     if not accepted:
         raise HTTPException(status_code=409, detail=message)
 
+    response.headers["Location"] = str(request.url_for("ingestion_run", run_id=run["id"]).path)
     return TriggerResponse(accepted=True, message=message, run=IngestionRunOut(**run))
 
 
+@router.get("/ingestion/runs/{run_id}", response_model=IngestionRunOut, name="ingestion_run")
+def ingestion_run(run_id: str, request: Request):
+    run = request.app.state.ingestion_service.get_run(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="ingestion run not found")
+
+    etag = strong_etag("ingestion_run", run)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return json_response(IngestionRunOut(**run).model_dump_json().encode("utf-8"), etag)
+
+
 @router.get("/ingestion/status", response_model=IngestionStatusResponse)
 def ingestion_status(request: Request):
     service = request.app.state.ingestion_service
     snapshot = service.latest_status()
 
-    if snapshot["last_run"] is None:
-        return IngestionStatusResponse(running=snapshot["running"], last_run=None)
+    # The run row carries its own progress, so the snapshot itself is the version.
+    etag = strong_etag("ingestion_status", snapshot)
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
-    return IngestionStatusResponse(
-        running=snapshot["running"],
-        last_run=IngestionRunOut(**snapshot["last_run"]),
-    )
+    last_run = IngestionRunOut(**snapshot["last_run"]) if snapshot["last_run"] is not None else None
+    body = IngestionStatusResponse(running=snapshot["running"], last_run=last_run).model_dump_json()
+    return json_response(body.encode("utf-8"), etag)
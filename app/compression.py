@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import mimetypes
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except Exception:  # pragma: no cover - brotli is optional; gzip is always available
+    brotli = None
+
+DEFAULT_MIN_BYTES = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+# Precompressed files are built once at startup, so spend the CPU on the smallest output.
+STATIC_GZIP_LEVEL = 9
+STATIC_BROTLI_QUALITY = 11
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "image/svg+xml")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+def available_encodings() -> tuple[str, ...]:
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: Optional[str], offered: tuple[str, ...]) -> Optional[str]:
+    """Pick the first of ``offered`` (server preference order) the client accepts with q > 0."""
+    if not accept_encoding:
+        return None
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    for encoding in offered:
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > 0:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: str, *, static: bool = False) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=STATIC_BROTLI_QUALITY if static else BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=STATIC_GZIP_LEVEL if static else GZIP_LEVEL, mtime=0)
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    return bool(content_type) and content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    """Negotiated br/gzip for complete responses of at least ``min_bytes``.
+
+    Streaming responses (``more_body``, e.g. server-sent events) and responses that
+    already carry ``Content-Encoding`` (precompressed files) pass through untouched.
+    A strong ETag becomes weak once the body is re-encoded.
+    """
+
+    def __init__(self, app: ASGIApp, min_bytes: Optional[int] = None):
+        self.app = app
+        self.min_bytes = min_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"), available_encodings())
+        min_bytes = self._min_bytes(scope)
+        start_message: Optional[Message] = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if "content-encoding" in headers or not is_compressible(headers.get("content-type")):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start_message = message
+                return
+
+            if passthrough or start_message is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            start, start_message = start_message, None
+            body = message.get("body", b"")
+            response_headers = MutableHeaders(raw=start["headers"])
+            response_headers.add_vary_header("Accept-Encoding")
+            if message.get("more_body", False) or encoding is None or len(body) < min_bytes:
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            compressed = compress(body, encoding)
+            response_headers["Content-Encoding"] = encoding
+            response_headers["Content-Length"] = str(len(compressed))
+            etag = response_headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                response_headers["ETag"] = f"W/{etag}"
+            await send(start)
+            await send({"type": "http.response.body", "body": compressed, "more_body": False})
+
+        await self.app(scope, receive, send_compressed)
+
+    def _min_bytes(self, scope: Scope) -> int:
+        if self.min_bytes is not None:
+            return self.min_bytes
+        settings = getattr(scope["app"].state, "settings", None) if "app" in scope else None
+        return settings.compression_min_bytes if settings is not None else DEFAULT_MIN_BYTES
+
+
+@dataclass(frozen=True)
+class PrecompressedFile:
+    media_type: str
+    etag: str
+    content_hash: str
+    variants: dict[str, bytes] = field(default_factory=dict)
+
+    def body(self, accept_encoding: Optional[str]) -> tuple[bytes, Optional[str]]:
+        encoding = negotiate_encoding(accept_encoding, tuple(name for name in self.variants if name != "identity"))
+        return self.variants[encoding or "identity"], encoding
+
+
+def precompress_file(content: bytes, filename: str) -> PrecompressedFile:
+    media_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    if media_type.startswith("text/"):
+        media_type += "; charset=utf-8"
+    content_hash = hashlib.sha256(content).hexdigest()[:16]
+
+    variants = {"identity": content}
+    if is_compressible(media_type):
+        for encoding in available_encodings():
+            compressed = compress(content, encoding, static=True)
+            if len(compressed) < len(content):
+                variants[encoding] = compressed
+    return PrecompressedFile(media_type=media_type, etag=f'"{content_hash}"', content_hash=content_hash, variants=variants)
+
+
+class DashboardBundle:
+    """Dashboard HTML and assets, read and precompressed once at startup.
+
+    Asset URLs in the HTML get a ``?v=<content hash>`` suffix; requests carrying the
+    current hash are served as immutable, everything else must revalidate.
+    """
+
+    def __init__(self, html: Optional[PrecompressedFile], assets: dict[str, PrecompressedFile]):
+        self.html = html
+        self.assets = assets
+
+    @classmethod
+    def load(cls, html_path: Path, assets_dir: Path, assets_url_prefix: str) -> "DashboardBundle":
+        assets: dict[str, PrecompressedFile] = {}
+        if assets_dir.is_dir():
+            for path in sorted(assets_dir.rglob("*")):
+                if path.is_file():
+                    name = path.relative_to(assets_dir).as_posix()
+                    assets[name] = precompress_file(path.read_bytes(), path.name)
+
+        html = None
+        if html_path.is_file():
+            text = html_path.read_text(encoding="utf-8")
+            for name, asset in assets.items():
+                url = f"{assets_url_prefix}/{name}"
+                text = text.replace(f'"{url}"', f'"{url}?v={asset.content_hash}"')
+            html = precompress_file(text.encode("utf-8"), html_path.name)
+        return cls(html, assets)
@@ -34,6 +34,13 @@ def _as_int(name: str, default: int) -> int:
     return int(raw)
 
 
+def _as_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None or raw == "":
+        return default
+    return float(raw)
+
+
 def _as_bool(name: str, default: bool) -> bool:
     raw = os.getenv(name)
     if raw is None:
@@ -75,10 +82,36 @@ class Settings:
     user_agent: str
     request_timeout_seconds: int
     request_retries: int
+    http_pool_connections: int
+    http_pool_maxsize: int
     ingestion_window_hours: int
     max_items_per_source: int
     article_meta_fetch_budget: int
+    article_meta_concurrency: int
+    article_meta_deadline_seconds: int
+    article_meta_max_bytes: int
+    html_parser: str
+    source_fetch_concurrency: int
+    fetch_engine: str
+    async_max_connections: int
+    host_requests_per_second: float
+    host_burst: int
+    respect_robots_txt: bool
+    robots_cache_seconds: int
+    politeness_max_delay_seconds: int
+    article_cache_size: int
+    article_cache_ttl_seconds: int
+    compression_min_bytes: int
+    health_cache_ttl_seconds: int
+    health_refresh_interval_seconds: int
+    health_check_concurrency: int
+    ingestion_lease_ttl_seconds: int
     scheduler_enabled: bool
+    scheduler_mode: str
+    scheduler_tick_seconds: int
+    poll_min_interval_seconds: int
+    poll_max_interval_seconds: int
+    poll_jitter_ratio: float
     schedule_hour_utc: int
     schedule_minute_utc: int
     app_host: str
@@ -103,10 +136,36 @@ def load_settings(env_path: str = DEFAULT_ENV_PATH) -> Settings:
         ),
         request_timeout_seconds=_as_int("REQUEST_TIMEOUT_SECONDS", 15),
         request_retries=_as_int("REQUEST_RETRIES", 2),
+        http_pool_connections=_as_int("HTTP_POOL_CONNECTIONS", 4),
+        http_pool_maxsize=_as_int("HTTP_POOL_MAXSIZE", 8),
         ingestion_window_hours=_as_int("INGESTION_WINDOW_HOURS", 24),
         max_items_per_source=_as_int("MAX_ITEMS_PER_SOURCE", 50),
         article_meta_fetch_budget=_as_int("ARTICLE_META_FETCH_BUDGET", 8),
+        article_meta_concurrency=_as_int("ARTICLE_META_CONCURRENCY", 4),
+        article_meta_deadline_seconds=_as_int("ARTICLE_META_DEADLINE_SECONDS", 30),
+        article_meta_max_bytes=_as_int("ARTICLE_META_MAX_BYTES", 262144),
+        html_parser=os.getenv("HTML_PARSER", "html.parser"),
+        source_fetch_concurrency=_as_int("SOURCE_FETCH_CONCURRENCY", 5),
+        fetch_engine=os.getenv("FETCH_ENGINE", "threads").strip().lower(),
+        async_max_connections=_as_int("ASYNC_MAX_CONNECTIONS", 200),
+        host_requests_per_second=_as_float("HOST_REQUESTS_PER_SECOND", 2.0),
+        host_burst=_as_int("HOST_BURST", 4),
+        respect_robots_txt=_as_bool("RESPECT_ROBOTS_TXT", True),
+        robots_cache_seconds=_as_int("ROBOTS_CACHE_SECONDS", 3600),
+        politeness_max_delay_seconds=_as_int("POLITENESS_MAX_DELAY_SECONDS", 60),
+        article_cache_size=_as_int("ARTICLE_CACHE_SIZE", 256),
+        article_cache_ttl_seconds=_as_int("ARTICLE_CACHE_TTL_SECONDS", 30),
+        compression_min_bytes=_as_int("COMPRESSION_MIN_BYTES", 1024),
+        health_cache_ttl_seconds=_as_int("HEALTH_CACHE_TTL_SECONDS", 900),
+        health_refresh_interval_seconds=_as_int("HEALTH_REFRESH_INTERVAL_SECONDS", 300),
+        health_check_concurrency=_as_int("HEALTH_CHECK_CONCURRENCY", 8),
+        ingestion_lease_ttl_seconds=_as_int("INGESTION_LEASE_TTL_SECONDS", 120),
         scheduler_enabled=_as_bool("SCHEDULER_ENABLED", scheduler_default),
+        scheduler_mode=os.getenv("SCHEDULER_MODE", "adaptive").strip().lower(),
+        scheduler_tick_seconds=_as_int("SCHEDULER_TICK_SECONDS", 60),
+        poll_min_interval_seconds=_as_int("POLL_MIN_INTERVAL_SECONDS", 900),
+        poll_max_interval_seconds=_as_int("POLL_MAX_INTERVAL_SECONDS", 86400),
+        poll_jitter_ratio=_as_float("POLL_JITTER_RATIO", 0.1),
         schedule_hour_utc=_as_int("SCHEDULE_HOUR_UTC", 0),
         schedule_minute_utc=_as_int("SCHEDULE_MINUTE_UTC", 15),
         app_host=os.getenv("APP_HOST", "0.0.0.0"),
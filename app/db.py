@@ -4,10 +4,11 @@ import errno
 import json
 import logging
 import sqlite3
+import threading
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Callable, Iterable, Iterator, Optional, Sequence, Union
 
 from app.models import NormalizedArticle, SourceConfig
 
@@ -54,11 +55,25 @@ CREATE TABLE IF NOT EXISTS ingestion_runs (
   error_count INTEGER NOT NULL DEFAULT 0,
   notes TEXT
 );
+
+CREATE TABLE IF NOT EXISTS http_validators (
+  url TEXT PRIMARY KEY,
+  etag TEXT,
+  last_modified TEXT,
+  updated_at_utc TEXT NOT NULL
+);
 """
 
 
-@contextmanager
-def connection(db_path: str):
+# Pragmas applied once per pooled connection. WAL lets dashboard reads proceed while an
+# ingestion write is open; NORMAL sync is durable across app crashes in WAL mode.
+BUSY_TIMEOUT_MS = 5000
+MMAP_SIZE_BYTES = 64 * 1024 * 1024
+CACHE_SIZE_KIB = 16 * 1024
+READER_CONNECTIONS = 4
+
+
+def _open_connection(db_path: str) -> sqlite3.Connection:
     effective_db_path = db_path
 
     try:
@@ -98,18 +113,256 @@ def connection(db_path: str):
         conn = sqlite3.connect(effective_db_path, check_same_thread=False)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON")
-    try:
+    conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE_BYTES}")
+    conn.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KIB}")
+    return conn
+
+
+class ConnectionPool:
+    """Long-lived connections for one database file: a single writer plus a few readers.
+
+    SQLite allows one writer at a time, so the writer is handed out under a lock
+    (re-entrant; only the outermost block commits). Readers are ``query_only`` and
+    shared through an idle stack, opened on demand up to ``max_readers``.
+    """
+
+    def __init__(self, db_path: str, *, max_readers: int = READER_CONNECTIONS):
+        self.db_path = db_path
+        self.max_readers = max(1, max_readers)
+        self._writer: Optional[sqlite3.Connection] = None
+        self._writer_lock = threading.RLock()
+        self._writer_depth = 0
+        self._idle_readers: list[sqlite3.Connection] = []
+        self._all_readers: list[sqlite3.Connection] = []
+        self._readers_available = threading.Condition()
+        self._closed = False
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = _open_connection(self.db_path)
+            conn = self._writer
+            self._writer_depth += 1
+            try:
+                yield conn
+                if self._writer_depth == 1:
+                    conn.commit()
+            except Exception:
+                if self._writer_depth == 1:
+                    conn.rollback()
+                raise
+            finally:
+                self._writer_depth -= 1
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        conn = self._checkout_reader()
+        try:
+            yield conn
+        finally:
+            # End the implicit read snapshot so the next borrower sees fresh data.
+            conn.rollback()
+            with self._readers_available:
+                self._idle_readers.append(conn)
+                self._readers_available.notify()
+
+    def close(self) -> None:
+        with self._writer_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+        with self._readers_available:
+            self._closed = True
+            for conn in self._all_readers:
+                conn.close()
+            self._idle_readers.clear()
+            self._all_readers.clear()
+
+    def _checkout_reader(self) -> sqlite3.Connection:
+        with self._readers_available:
+            while True:
+                if self._idle_readers:
+                    return self._idle_readers.pop()
+                if len(self._all_readers) < self.max_readers:
+                    break
+                self._readers_available.wait()
+            conn = _open_connection(self.db_path)
+            conn.execute("PRAGMA query_only = ON")
+            self._all_readers.append(conn)
+            return conn
+
+
+_POOLS: dict[str, ConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_pool(db_path: str) -> ConnectionPool:
+    with _POOLS_LOCK:
+        pool = _POOLS.get(db_path)
+        if pool is None:
+            pool = ConnectionPool(db_path)
+            _POOLS[db_path] = pool
+        return pool
+
+
+def close_pools() -> None:
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
+@contextmanager
+def connection(db_path: str, *, readonly: bool = False) -> Iterator[sqlite3.Connection]:
+    """Borrow a pooled connection; the writer commits on success and rolls back on error."""
+    pool = get_pool(db_path)
+    with (pool.reader() if readonly else pool.writer()) as conn:
         yield conn
-        conn.commit()
-    except Exception:
-        conn.rollback()
-        raise
-    finally:
-        conn.close()
+
+
+# Ordered schema migrations; the index of the last applied one is kept in PRAGMA user_version.
+# Statements must be idempotent (IF NOT EXISTS) so a database created before versioning, or a
+# second worker racing the first at startup, can safely re-run them. A step may instead be a
+# callable that builds its SQL from the current schema (ALTER TABLE has no IF NOT EXISTS).
+Migration = Union[str, Callable[[sqlite3.Connection], str]]
+
+
+def _add_missing_columns(table: str, columns: tuple[tuple[str, str], ...]) -> Callable[[sqlite3.Connection], str]:
+    def build(conn: sqlite3.Connection) -> str:
+        existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        return "\n".join(
+            f"ALTER TABLE {table} ADD COLUMN {name} {definition};"
+            for name, definition in columns
+            if name not in existing
+        )
+
+    return build
+
+
+MIGRATIONS: tuple[Migration, ...] = (
+    SCHEMA_SQL,
+    """
+    -- list_articles: window/all views order by recency; source filter seeks by source first.
+    CREATE INDEX IF NOT EXISTS idx_articles_published
+      ON articles (published_at_utc DESC, updated_at_utc DESC);
+    CREATE INDEX IF NOT EXISTS idx_articles_source_published
+      ON articles (source_id, published_at_utc DESC, updated_at_utc DESC);
+    -- saved views and retention cleanup (is_saved = 0 AND published_at_utc < cutoff).
+    CREATE INDEX IF NOT EXISTS idx_articles_saved_published
+      ON articles (is_saved, published_at_utc DESC, updated_at_utc DESC);
+    -- latest_ingestion_run
+    CREATE INDEX IF NOT EXISTS idx_ingestion_runs_started
+      ON ingestion_runs (started_at_utc);
+    """,
+    """
+    -- Keyset pagination orders by (published_at_utc, updated_at_utc, id); extend the
+    -- listing indexes with id so seeks and ordering never need a sort step.
+    DROP INDEX IF EXISTS idx_articles_published;
+    DROP INDEX IF EXISTS idx_articles_source_published;
+    DROP INDEX IF EXISTS idx_articles_saved_published;
+    CREATE INDEX IF NOT EXISTS idx_articles_listing
+      ON articles (published_at_utc DESC, updated_at_utc DESC, id DESC);
+    CREATE INDEX IF NOT EXISTS idx_articles_source_listing
+      ON articles (source_id, published_at_utc DESC, updated_at_utc DESC, id DESC);
+    CREATE INDEX IF NOT EXISTS idx_articles_saved_listing
+      ON articles (is_saved, published_at_utc DESC, updated_at_utc DESC, id DESC);
+    """,
+    """
+    -- Single-row counter bumped by every article write; read-side caches key on it.
+    CREATE TABLE IF NOT EXISTS data_version (
+      id INTEGER PRIMARY KEY CHECK (id = 1),
+      version INTEGER NOT NULL
+    );
+    INSERT OR IGNORE INTO data_version (id, version) VALUES (1, 0);
+    """,
+    # Live progress of background runs, polled via GET /api/ingestion/runs/{id}.
+    _add_missing_columns(
+        "ingestion_runs",
+        (
+            ("sources_total", "INTEGER NOT NULL DEFAULT 0"),
+            ("sources_done", "INTEGER NOT NULL DEFAULT 0"),
+            ("records_so_far", "INTEGER NOT NULL DEFAULT 0"),
+        ),
+    ),
+    """
+    -- Cross-process mutual exclusion (one row per lease name, e.g. 'ingestion').
+    CREATE TABLE IF NOT EXISTS leases (
+      name TEXT PRIMARY KEY,
+      owner TEXT NOT NULL,
+      acquired_at_utc TEXT NOT NULL,
+      heartbeat_at_utc TEXT NOT NULL,
+      expires_at_utc TEXT NOT NULL
+    );
+    """,
+    """
+    -- Adaptive polling: when each source is next due and the interval that produced it.
+    CREATE TABLE IF NOT EXISTS source_schedule (
+      source_id TEXT PRIMARY KEY REFERENCES sources(id),
+      interval_seconds INTEGER NOT NULL,
+      next_due_at_utc TEXT NOT NULL,
+      last_polled_at_utc TEXT,
+      last_outcome TEXT
+    );
+    CREATE INDEX IF NOT EXISTS idx_source_schedule_due
+      ON source_schedule (next_due_at_utc);
+    """,
+    """
+    -- Change events shared by every worker on this database; each one tails the table
+    -- and fans new rows out to its own SSE subscribers (see app/services/events.py).
+    CREATE TABLE IF NOT EXISTS events (
+      id INTEGER PRIMARY KEY AUTOINCREMENT,
+      type TEXT NOT NULL,
+      data TEXT NOT NULL,
+      created_at_utc TEXT NOT NULL
+    );
+    """,
+)
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def data_version(conn: sqlite3.Connection) -> int:
+    row = conn.execute("SELECT version FROM data_version WHERE id = 1").fetchone()
+    return int(row["version"]) if row else 0
+
+
+def bump_data_version(conn: sqlite3.Connection) -> None:
+    """Mark article data as changed; call inside the writing transaction."""
+    conn.execute("UPDATE data_version SET version = version + 1 WHERE id = 1")
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    return int(conn.execute("PRAGMA user_version").fetchone()[0])
 
 
 def init_db(conn: sqlite3.Connection) -> None:
-    conn.executescript(SCHEMA_SQL)
+    current = schema_version(conn)
+    if current >= SCHEMA_VERSION:
+        return
+
+    for version in range(current + 1, SCHEMA_VERSION + 1):
+        migration = MIGRATIONS[version - 1]
+        sql = migration(conn) if callable(migration) else migration
+        try:
+            conn.executescript(
+                f"""
+                BEGIN IMMEDIATE;
+                {sql}
+                PRAGMA user_version = {version};
+                COMMIT;
+                """
+            )
+        except sqlite3.OperationalError:
+            conn.rollback()
+            # A worker racing this one at startup applied the step between the two reads.
+            if schema_version(conn) >= version:
+                continue
+            raise
+        logger.info("db_migrated version=%s", version)
 
 
 def seed_sources(conn: sqlite3.Connection, sources: Iterable[SourceConfig], now_utc: str) -> None:
@@ -140,20 +393,50 @@ def seed_sources(conn: sqlite3.Connection, sources: Iterable[SourceConfig], now_
         )
 
 
+UPSERT_ARTICLE_SQL = """
+INSERT INTO articles (
+    id, canonical_url, title, url, source_id, published_at_utc, snippet, image_url,
+    is_saved, first_seen_at_utc, last_seen_at_utc, created_at_utc, updated_at_utc
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0, ?, ?, ?, ?)
+ON CONFLICT(canonical_url) DO UPDATE SET
+    title = excluded.title,
+    url = excluded.url,
+    source_id = excluded.source_id,
+    published_at_utc = excluded.published_at_utc,
+    snippet = excluded.snippet,
+    image_url = excluded.image_url,
+    last_seen_at_utc = excluded.last_seen_at_utc,
+    updated_at_utc = excluded.updated_at_utc
+"""
+
+
 def upsert_article(conn: sqlite3.Connection, article: NormalizedArticle, now_utc: str) -> str:
-    existing = conn.execute(
-        "SELECT id FROM articles WHERE canonical_url = ?",
-        (article.canonical_url,),
-    ).fetchone()
+    inserted, _ = upsert_articles(conn, [article], now_utc)
+    return "inserted" if inserted else "updated"
 
-    if existing is None:
-        conn.execute(
-            """
-            INSERT INTO articles (
-                id, canonical_url, title, url, source_id, published_at_utc, snippet, image_url,
-                is_saved, first_seen_at_utc, last_seen_at_utc, created_at_utc, updated_at_utc
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0, ?, ?, ?, ?)
-            """,
+
+def upsert_articles(
+    conn: sqlite3.Connection,
+    articles: Sequence[NormalizedArticle],
+    now_utc: str,
+) -> tuple[int, int]:
+    """Upsert a batch by canonical URL in one statement; returns ``(inserted, updated)``.
+
+    Inserted rows are counted as rows whose rowid is above the table's max rowid before
+    the batch (SQLite hands out ``max(rowid) + 1``), so a URL repeated within the batch
+    counts as one insert plus updates, exactly as row-by-row upserts would.
+    """
+    if not articles:
+        return 0, 0
+
+    if not conn.in_transaction:
+        # Hold the write lock from the max(rowid) read on, so another worker's insert or
+        # delete cannot land in between and skew the inserted/updated split.
+        conn.execute("BEGIN IMMEDIATE")
+    max_rowid = conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM articles").fetchone()[0]
+    conn.executemany(
+        UPSERT_ARTICLE_SQL,
+        [
             (
                 article.id,
                 article.canonical_url,
@@ -167,36 +450,52 @@ def upsert_article(conn: sqlite3.Connection, article: NormalizedArticle, now_utc
                 article.last_seen_at_utc,
                 now_utc,
                 now_utc,
-            ),
-        )
-        return "inserted"
-
-    conn.execute(
-        """
-        UPDATE articles
-        SET title = ?,
-            url = ?,
-            source_id = ?,
-            published_at_utc = ?,
-            snippet = ?,
-            image_url = ?,
-            last_seen_at_utc = ?,
-            updated_at_utc = ?
-        WHERE canonical_url = ?
-        """,
-        (
-            article.title,
-            article.url,
-            article.source_id,
-            article.published_at_utc,
-            article.snippet,
-            article.image_url,
-            article.last_seen_at_utc,
-            now_utc,
-            article.canonical_url,
-        ),
+            )
+            for article in articles
+        ],
     )
-    return "updated"
+    inserted = conn.execute("SELECT COUNT(*) FROM articles WHERE rowid > ?", (max_rowid,)).fetchone()[0]
+    bump_data_version(conn)
+    return inserted, len(articles) - inserted
+
+
+ARTICLE_COLUMNS_SQL = """
+    a.id,
+    a.source_id,
+    s.name AS source_name,
+    a.title,
+    a.url,
+    a.canonical_url,
+    a.published_at_utc,
+    a.snippet,
+    a.image_url,
+    a.is_saved,
+    a.first_seen_at_utc,
+    a.last_seen_at_utc,
+    a.updated_at_utc
+"""
+# Stays well under SQLite's bound-parameter limit.
+ID_LOOKUP_CHUNK = 500
+
+
+def get_articles(conn: sqlite3.Connection, article_ids: Sequence[str]) -> list[sqlite3.Row]:
+    """Rows shaped like :func:`list_articles` rows for ``article_ids`` (missing ids are skipped)."""
+    rows: list[sqlite3.Row] = []
+    for start in range(0, len(article_ids), ID_LOOKUP_CHUNK):
+        chunk = list(article_ids[start : start + ID_LOOKUP_CHUNK])
+        rows.extend(
+            conn.execute(
+                f"""
+                SELECT {ARTICLE_COLUMNS_SQL}
+                FROM articles a
+                INNER JOIN sources s ON s.id = a.source_id
+                WHERE a.id IN ({", ".join("?" * len(chunk))})
+                ORDER BY a.published_at_utc DESC, a.updated_at_utc DESC, a.id DESC
+                """,
+                chunk,
+            ).fetchall()
+        )
+    return rows
 
 
 def list_articles(
@@ -206,8 +505,15 @@ def list_articles(
     saved: str,
     source_id: Optional[str],
     limit: int,
-    offset: int,
+    offset: int = 0,
+    after: Optional[tuple[str, str, str]] = None,
+    include_total: bool = True,
 ):
+    """Return ``(total, rows)``; ``total`` is None when ``include_total`` is False.
+
+    ``after`` is the ``(published_at_utc, updated_at_utc, id)`` of the last row of the
+    previous page. Seeking past it costs the same on any page, unlike ``offset``.
+    """
     where_clauses = []
     params: list[object] = []
 
@@ -226,45 +532,46 @@ def list_articles(
         params.append(cutoff_iso_utc)
     elif cutoff_iso_utc and saved == "all":
         # In all-mode, include active-window items plus any saved items regardless of age.
-        where_clauses.append("(a.is_saved = 1 OR a.published_at_utc >= ?)")
+        # Unary + keeps the planner walking the listing index in order (retention leaves
+        # only saved rows past the cutoff) instead of OR-merging two indexes and sorting.
+        where_clauses.append("(+a.is_saved = 1 OR a.published_at_utc >= ?)")
         params.append(cutoff_iso_utc)
 
     where_sql = ""
     if where_clauses:
         where_sql = "WHERE " + " AND ".join(where_clauses)
 
-    total_row = conn.execute(
-        f"""
-        SELECT COUNT(*) AS total
-        FROM articles a
-        {where_sql}
-        """,
-        tuple(params),
-    ).fetchone()
-    total = int(total_row["total"] if total_row else 0)
+    total = None
+    if include_total:
+        total_row = conn.execute(
+            f"""
+            SELECT COUNT(*) AS total
+            FROM articles a
+            {where_sql}
+            """,
+            tuple(params),
+        ).fetchone()
+        total = int(total_row["total"] if total_row else 0)
+
+    page_clauses = list(where_clauses)
+    page_params = list(params)
+    if after is not None:
+        page_clauses.append("(a.published_at_utc, a.updated_at_utc, a.id) < (?, ?, ?)")
+        page_params.extend(after)
+    page_where_sql = ""
+    if page_clauses:
+        page_where_sql = "WHERE " + " AND ".join(page_clauses)
 
     rows = conn.execute(
         f"""
-        SELECT
-            a.id,
-            a.source_id,
-            s.name AS source_name,
-            a.title,
-            a.url,
-            a.canonical_url,
-            a.published_at_utc,
-            a.snippet,
-            a.image_url,
-            a.is_saved,
-            a.first_seen_at_utc,
-            a.last_seen_at_utc
+        SELECT {ARTICLE_COLUMNS_SQL}
         FROM articles a
         INNER JOIN sources s ON s.id = a.source_id
-        {where_sql}
-        ORDER BY a.published_at_utc DESC, a.updated_at_utc DESC
+        {page_where_sql}
+        ORDER BY a.published_at_utc DESC, a.updated_at_utc DESC, a.id DESC
         LIMIT ? OFFSET ?
         """,
-        tuple([*params, limit, offset]),
+        tuple([*page_params, limit, offset]),
     ).fetchall()
 
     return total, rows
@@ -275,6 +582,8 @@ def set_article_saved(conn: sqlite3.Connection, article_id: str, is_saved: bool)
         "UPDATE articles SET is_saved = ?, updated_at_utc = ? WHERE id = ?",
         (1 if is_saved else 0, datetime.utcnow().replace(microsecond=0).isoformat() + "Z", article_id),
     )
+    if result.rowcount > 0:
+        bump_data_version(conn)
     return result.rowcount > 0
 
 
@@ -283,17 +592,33 @@ def delete_article(conn: sqlite3.Connection, article_id: str) -> bool:
         "DELETE FROM articles WHERE id = ?",
         (article_id,),
     )
+    if result.rowcount > 0:
+        bump_data_version(conn)
     return result.rowcount > 0
 
 
-def create_ingestion_run(conn: sqlite3.Connection, run_id: str, started_at_utc: str, notes: Optional[dict] = None) -> None:
+def create_ingestion_run(
+    conn: sqlite3.Connection,
+    run_id: str,
+    started_at_utc: str,
+    notes: Optional[dict] = None,
+    *,
+    sources_total: int = 0,
+) -> None:
     conn.execute(
         """
         INSERT INTO ingestion_runs (
-            id, started_at_utc, status, new_count, updated_count, skipped_count, error_count, notes
-        ) VALUES (?, ?, 'running', 0, 0, 0, 0, ?)
+            id, started_at_utc, status, new_count, updated_count, skipped_count, error_count, notes, sources_total
+        ) VALUES (?, ?, 'running', 0, 0, 0, 0, ?, ?)
         """,
-        (run_id, started_at_utc, json.dumps(notes or {})),
+        (run_id, started_at_utc, json.dumps(notes or {}), sources_total),
+    )
+
+
+def update_ingestion_progress(conn: sqlite3.Connection, run_id: str, *, sources_done: int, records_so_far: int) -> None:
+    conn.execute(
+        "UPDATE ingestion_runs SET sources_done = ?, records_so_far = ? WHERE id = ?",
+        (sources_done, records_so_far, run_id),
     )
 
 
@@ -337,7 +662,8 @@ def complete_ingestion_run(
 def get_ingestion_run(conn: sqlite3.Connection, run_id: str):
     return conn.execute(
         """
-        SELECT id, started_at_utc, completed_at_utc, status, new_count, updated_count, skipped_count, error_count, notes
+        SELECT id, started_at_utc, completed_at_utc, status, new_count, updated_count, skipped_count, error_count, notes,
+               sources_total, sources_done, records_so_far
         FROM ingestion_runs
         WHERE id = ?
         """,
@@ -348,7 +674,8 @@ def get_ingestion_run(conn: sqlite3.Connection, run_id: str):
 def latest_ingestion_run(conn: sqlite3.Connection):
     return conn.execute(
         """
-        SELECT id, started_at_utc, completed_at_utc, status, new_count, updated_count, skipped_count, error_count, notes
+        SELECT id, started_at_utc, completed_at_utc, status, new_count, updated_count, skipped_count, error_count, notes,
+               sources_total, sources_done, records_so_far
         FROM ingestion_runs
         ORDER BY started_at_utc DESC
         LIMIT 1
@@ -356,14 +683,172 @@ def latest_ingestion_run(conn: sqlite3.Connection):
     ).fetchone()
 
 
+def fail_running_ingestion_runs(conn: sqlite3.Connection, *, completed_at_utc: str, reason: str) -> int:
+    """Close runs left ``running`` by a worker that died; call only while holding the ingestion lease."""
+    result = conn.execute(
+        """
+        UPDATE ingestion_runs
+        SET status = 'failed', completed_at_utc = ?, notes = json_set(COALESCE(notes, '{}'), '$.abandoned', ?)
+        WHERE status = 'running'
+        """,
+        (completed_at_utc, reason),
+    )
+    return result.rowcount
+
+
+def acquire_lease(conn: sqlite3.Connection, name: str, owner: str, *, now_utc: str, expires_at_utc: str) -> bool:
+    """Take ``name`` if it is free, expired or already ours; returns whether ``owner`` now holds it."""
+    result = conn.execute(
+        """
+        INSERT INTO leases (name, owner, acquired_at_utc, heartbeat_at_utc, expires_at_utc)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(name) DO UPDATE SET
+            owner = excluded.owner,
+            acquired_at_utc = excluded.acquired_at_utc,
+            heartbeat_at_utc = excluded.heartbeat_at_utc,
+            expires_at_utc = excluded.expires_at_utc
+        WHERE leases.owner = excluded.owner OR leases.expires_at_utc <= excluded.acquired_at_utc
+        """,
+        (name, owner, now_utc, now_utc, expires_at_utc),
+    )
+    return result.rowcount > 0
+
+
+def renew_lease(conn: sqlite3.Connection, name: str, owner: str, *, now_utc: str, expires_at_utc: str) -> bool:
+    result = conn.execute(
+        "UPDATE leases SET heartbeat_at_utc = ?, expires_at_utc = ? WHERE name = ? AND owner = ?",
+        (now_utc, expires_at_utc, name, owner),
+    )
+    return result.rowcount > 0
+
+
+def release_lease(conn: sqlite3.Connection, name: str, owner: str) -> bool:
+    result = conn.execute("DELETE FROM leases WHERE name = ? AND owner = ?", (name, owner))
+    return result.rowcount > 0
+
+
+def get_lease(conn: sqlite3.Connection, name: str):
+    return conn.execute(
+        "SELECT name, owner, acquired_at_utc, heartbeat_at_utc, expires_at_utc FROM leases WHERE name = ?",
+        (name,),
+    ).fetchone()
+
+
+def list_source_schedule(conn: sqlite3.Connection) -> list[sqlite3.Row]:
+    return conn.execute(
+        """
+        SELECT source_id, interval_seconds, next_due_at_utc, last_polled_at_utc, last_outcome
+        FROM source_schedule
+        ORDER BY next_due_at_utc
+        """
+    ).fetchall()
+
+
+def save_source_schedule(
+    conn: sqlite3.Connection,
+    source_id: str,
+    *,
+    interval_seconds: int,
+    next_due_at_utc: str,
+    last_polled_at_utc: Optional[str] = None,
+    last_outcome: Optional[str] = None,
+) -> None:
+    """Upsert a source's schedule; poll fields left as None keep their stored values."""
+    conn.execute(
+        """
+        INSERT INTO source_schedule (source_id, interval_seconds, next_due_at_utc, last_polled_at_utc, last_outcome)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(source_id) DO UPDATE SET
+            interval_seconds = excluded.interval_seconds,
+            next_due_at_utc = excluded.next_due_at_utc,
+            last_polled_at_utc = COALESCE(excluded.last_polled_at_utc, source_schedule.last_polled_at_utc),
+            last_outcome = COALESCE(excluded.last_outcome, source_schedule.last_outcome)
+        """,
+        (source_id, interval_seconds, next_due_at_utc, last_polled_at_utc, last_outcome),
+    )
+
+
+def count_articles_published_since(conn: sqlite3.Connection, cutoff_iso_utc: str) -> dict[str, int]:
+    """Articles per source published at or after ``cutoff_iso_utc`` (sources with none are absent)."""
+    rows = conn.execute(
+        """
+        SELECT source_id, COUNT(*) AS published
+        FROM articles
+        WHERE published_at_utc >= ?
+        GROUP BY source_id
+        """,
+        (cutoff_iso_utc,),
+    ).fetchall()
+    return {row["source_id"]: int(row["published"]) for row in rows}
+
+
+def append_event(conn: sqlite3.Connection, event_type: str, data: str, *, now_utc: str, retain: int) -> int:
+    """Insert an event (``data`` is JSON text) and trim the table to the newest ``retain`` rows."""
+    event_id = conn.execute(
+        "INSERT INTO events (type, data, created_at_utc) VALUES (?, ?, ?)",
+        (event_type, data, now_utc),
+    ).lastrowid
+    conn.execute("DELETE FROM events WHERE id <= ?", (event_id - retain,))
+    return int(event_id)
+
+
+def events_after(conn: sqlite3.Connection, after_id: int) -> list[sqlite3.Row]:
+    return conn.execute(
+        "SELECT id, type, data FROM events WHERE id > ? ORDER BY id",
+        (after_id,),
+    ).fetchall()
+
+
+def recent_events(conn: sqlite3.Connection, limit: int) -> list[sqlite3.Row]:
+    rows = conn.execute(
+        "SELECT id, type, data FROM events ORDER BY id DESC LIMIT ?",
+        (limit,),
+    ).fetchall()
+    return rows[::-1]
+
+
 def cleanup_unsaved_older_than(conn: sqlite3.Connection, cutoff_iso_utc: str) -> int:
     result = conn.execute(
         "DELETE FROM articles WHERE is_saved = 0 AND published_at_utc < ?",
         (cutoff_iso_utc,),
     )
+    if result.rowcount > 0:
+        bump_data_version(conn)
     return int(result.rowcount)
 
 
+def get_http_validator(conn: sqlite3.Connection, url: str):
+    return conn.execute(
+        "SELECT url, etag, last_modified, updated_at_utc FROM http_validators WHERE url = ?",
+        (url,),
+    ).fetchone()
+
+
+def save_http_validator(
+    conn: sqlite3.Connection,
+    url: str,
+    *,
+    etag: Optional[str],
+    last_modified: Optional[str],
+    now_utc: str,
+) -> None:
+    if not etag and not last_modified:
+        conn.execute("DELETE FROM http_validators WHERE url = ?", (url,))
+        return
+
+    conn.execute(
+        """
+        INSERT INTO http_validators (url, etag, last_modified, updated_at_utc)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(url) DO UPDATE SET
+            etag = excluded.etag,
+            last_modified = excluded.last_modified,
+            updated_at_utc = excluded.updated_at_utc
+        """,
+        (url, etag, last_modified, now_utc),
+    )
+
+
 def bootstrap_database(db_path: str, sources: Iterable[SourceConfig], now_iso_utc: str) -> None:
     with connection(db_path) as conn:
         init_db(conn)
@@ -0,0 +1,428 @@
+from __future__ import annotations
+
+import asyncio
+import codecs
+import threading
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Iterable, Mapping, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+try:
+    import httpx
+except Exception:  # pragma: no cover
+    httpx = None
+
+from app import db
+from app.config import Settings
+from app.politeness import HostPoliteness, parse_retry_after
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# 429/503 are retried by the clients themselves so Retry-After throttles the whole host.
+THROTTLE_STATUSES = (429, 503)
+RETRY_BACKOFF_FACTOR = 0.4
+STREAM_CHUNK_BYTES = 16 * 1024
+# Servers that refuse HEAD answer one of these; the probe retries with a one-byte ranged GET.
+PROBE_FALLBACK_STATUSES = (403, 405, 501)
+PROBE_RANGE = "bytes=0-0"
+
+# Streaming consumers return True once they have read enough of the body.
+ChunkConsumer = Callable[[str], bool]
+ByteConsumer = Callable[[bytes], bool]
+
+
+def _backoff_seconds(attempt: int) -> float:
+    return RETRY_BACKOFF_FACTOR * (2 ** attempt)
+
+
+def host_key(url: str) -> str:
+    parsed = urlparse(url)
+    scheme = (parsed.scheme or "https").lower()
+    netloc = parsed.netloc.lower()
+    if (scheme, netloc.rpartition(":")[2]) in {("https", "443"), ("http", "80")}:
+        netloc = netloc.rpartition(":")[0]
+    return f"{scheme}://{netloc}"
+
+
+def _incremental_decoder(encoding: Optional[str]):
+    try:
+        return codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+    except LookupError:
+        return codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+
+def _pump(chunks: Iterable[bytes], consume: ByteConsumer, max_bytes: Optional[int]) -> bool:
+    """Push chunks into ``consume``; returns True only when the whole body was read."""
+    received = 0
+    for chunk in chunks:
+        received += len(chunk)
+        if consume(chunk) or (max_bytes is not None and received >= max_bytes):
+            return False
+    return True
+
+
+async def _apump(chunks: AsyncIterator[bytes], consume: ByteConsumer, max_bytes: Optional[int]) -> bool:
+    received = 0
+    async for chunk in chunks:
+        received += len(chunk)
+        if consume(chunk) or (max_bytes is not None and received >= max_bytes):
+            return False
+    return True
+
+
+def load_validator_headers(db_path: str, url: str) -> dict[str, str]:
+    with db.connection(db_path, readonly=True) as conn:
+        row = db.get_http_validator(conn, url)
+    if row is None:
+        return {}
+
+    headers = {}
+    if row["etag"]:
+        headers["If-None-Match"] = row["etag"]
+    if row["last_modified"]:
+        headers["If-Modified-Since"] = row["last_modified"]
+    return headers
+
+
+@dataclass(frozen=True)
+class HttpValidators:
+    """ETag/Last-Modified from a conditional 200, to replay as If-None-Match/If-Modified-Since.
+
+    The clients never persist these themselves: the caller saves them once the body
+    has been parsed and its articles written, so a failed run is fetched again in full
+    instead of being answered with a 304.
+    """
+
+    url: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @classmethod
+    def from_headers(cls, url: str, headers: Mapping[str, str]) -> "HttpValidators":
+        return cls(url, etag=headers.get("ETag"), last_modified=headers.get("Last-Modified"))
+
+    def save(self, conn, *, now_utc: str) -> None:
+        db.save_http_validator(conn, self.url, etag=self.etag, last_modified=self.last_modified, now_utc=now_utc)
+
+
+class NotModified(Exception):
+    """Raised by conditional requests when the server answers 304."""
+
+    def __init__(self, url: str):
+        super().__init__(f"not modified: {url}")
+        self.url = url
+
+
+class HttpClient:
+    """Shared, long-lived HTTP sessions keyed by scheme+host.
+
+    Each host gets its own ``requests.Session`` whose connection pool keeps
+    sockets alive between calls, so repeated feed/listing/meta/health requests
+    against the same site reuse the already-resolved, already-handshaken
+    TCP+TLS connection instead of opening a new one per request.
+    """
+
+    def __init__(self, settings: Settings, politeness: Optional[HostPoliteness] = None):
+        self.settings = settings
+        self.politeness = politeness or HostPoliteness(settings)
+        self._sessions: dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def session_for(self, url: str) -> requests.Session:
+        key = host_key(url)
+        session = self._sessions.get(key)
+        if session is not None:
+            return session
+
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._build_session()
+                self._sessions[key] = session
+            return session
+
+    def get_text(self, url: str) -> str:
+        return self._open(url).text
+
+    def get_conditional(self, url: str) -> tuple[str, HttpValidators]:
+        """GET ``url`` replaying the persisted validators; returns the body and the new ones.
+
+        A 304 raises :class:`NotModified`.
+        """
+        response = self._open(url, conditional=True)
+        return response.text, HttpValidators.from_headers(url, response.headers)
+
+    def stream_bytes(
+        self,
+        url: str,
+        consume: ByteConsumer,
+        *,
+        conditional: bool = False,
+        max_bytes: Optional[int] = None,
+    ) -> HttpValidators:
+        """Feed raw body chunks to ``consume`` until it returns True, the body ends or ``max_bytes`` is read.
+
+        The connection is closed as soon as the consumer is satisfied, so the rest
+        of the body is never transferred. Returns the response's validators.
+        """
+        with self._open(url, conditional=conditional, stream=True) as response:
+            _pump(response.iter_content(chunk_size=STREAM_CHUNK_BYTES), consume, max_bytes)
+            return HttpValidators.from_headers(url, response.headers)
+
+    def stream_text(self, url: str, consume: ChunkConsumer, *, max_bytes: int) -> None:
+        """Like :meth:`stream_bytes`, but chunks are decoded with the response charset."""
+        with self._open(url, stream=True) as response:
+            decoder = _incremental_decoder(response.encoding)
+            if _pump(
+                response.iter_content(chunk_size=STREAM_CHUNK_BYTES),
+                lambda chunk: consume(decoder.decode(chunk)),
+                max_bytes,
+            ):
+                consume(decoder.decode(b"", final=True))
+
+    def probe(self, url: str) -> int:
+        """Check that ``url`` answers without downloading it; returns the final status.
+
+        Sends HEAD, falling back to ``GET`` with ``Range: bytes=0-0`` for servers that
+        reject HEAD. Error statuses raise ``requests.HTTPError``.
+        """
+        headers = {"User-Agent": self.settings.user_agent}
+        response = self._send(url, headers, method="HEAD")
+        response.close()
+        if response.status_code in PROBE_FALLBACK_STATUSES:
+            response = self._send(url, {**headers, "Range": PROBE_RANGE}, stream=True)
+            response.close()
+        response.raise_for_status()
+        return response.status_code
+
+    def _open(self, url: str, *, conditional: bool = False, stream: bool = False) -> requests.Response:
+        headers = {"User-Agent": self.settings.user_agent}
+        if conditional:
+            headers.update(load_validator_headers(self.settings.db_path, url))
+
+        response = self._send(url, headers, stream=stream)
+        if conditional and response.status_code == 304:
+            response.close()
+            raise NotModified(url)
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            response.close()
+            raise
+        return response
+
+    def _send(
+        self, url: str, headers: dict[str, str], *, stream: bool = False, method: str = "GET"
+    ) -> requests.Response:
+        """Every request goes through here: robots.txt, the host token bucket, then Retry-After."""
+        host = host_key(url)
+        self._ensure_robots(host)
+        self.politeness.check_allowed(host, url)
+
+        for attempt in range(self.settings.request_retries + 1):
+            wait_seconds = self.politeness.reserve(host)
+            if wait_seconds > 0:
+                time.sleep(wait_seconds)
+
+            send = getattr(self.session_for(url), method.lower())
+            response = send(
+                url,
+                headers=headers,
+                allow_redirects=True,
+                timeout=self.settings.request_timeout_seconds,
+                stream=stream,
+            )
+            if response.status_code not in THROTTLE_STATUSES or attempt == self.settings.request_retries:
+                return response
+
+            retry_after = parse_retry_after(response.headers)
+            self.politeness.penalize(host, retry_after if retry_after is not None else _backoff_seconds(attempt))
+            response.close()
+        return response
+
+    def _ensure_robots(self, host: str) -> None:
+        if not self.politeness.needs_robots(host):
+            return
+        with self.politeness.robots_lock(host):
+            if not self.politeness.needs_robots(host):
+                return
+            try:
+                response = self.session_for(host).get(
+                    f"{host}/robots.txt",
+                    headers={"User-Agent": self.settings.user_agent},
+                    timeout=self.settings.request_timeout_seconds,
+                )
+                robots_text = response.text if response.status_code == 200 else None
+            except requests.RequestException:
+                robots_text = None
+            self.politeness.set_robots(host, robots_text)
+
+    def close(self) -> None:
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def _build_session(self) -> requests.Session:
+        retries = Retry(
+            total=self.settings.request_retries,
+            connect=self.settings.request_retries,
+            read=self.settings.request_retries,
+            status=self.settings.request_retries,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=tuple(status for status in RETRY_STATUSES if status not in THROTTLE_STATUSES),
+            allowed_methods=("GET", "HEAD"),
+        )
+        adapter = HTTPAdapter(
+            max_retries=retries,
+            pool_connections=self.settings.http_pool_connections,
+            pool_maxsize=self.settings.http_pool_maxsize,
+            pool_block=False,
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["Connection"] = "keep-alive"
+        return session
+
+
+class AsyncHttpClient:
+    """Event-loop counterpart of :class:`HttpClient` built on ``httpx.AsyncClient``.
+
+    One client multiplexes every in-flight request over per-host keep-alive pools,
+    so hundreds of concurrent fetches cost coroutines rather than threads. It is
+    bound to the event loop that first uses it.
+    """
+
+    def __init__(self, settings: Settings, politeness: Optional[HostPoliteness] = None):
+        if httpx is None:
+            raise RuntimeError("FETCH_ENGINE=async requires the httpx package")
+        self.settings = settings
+        self.politeness = politeness or HostPoliteness(settings)
+        self._robots_locks: dict[str, asyncio.Lock] = {}
+        self._client = httpx.AsyncClient(
+            headers={"User-Agent": settings.user_agent},
+            timeout=settings.request_timeout_seconds,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=settings.async_max_connections,
+                max_keepalive_connections=settings.http_pool_maxsize * settings.http_pool_connections,
+            ),
+            transport=httpx.AsyncHTTPTransport(retries=settings.request_retries),
+        )
+
+    async def get_text(self, url: str) -> str:
+        response = await self._open(url)
+        return response.text
+
+    async def get_conditional(self, url: str) -> tuple[str, HttpValidators]:
+        response = await self._open(url, conditional=True)
+        return response.text, HttpValidators.from_headers(url, response.headers)
+
+    async def stream_bytes(
+        self,
+        url: str,
+        consume: ByteConsumer,
+        *,
+        conditional: bool = False,
+        max_bytes: Optional[int] = None,
+    ) -> HttpValidators:
+        response = await self._open(url, conditional=conditional, stream=True)
+        try:
+            await _apump(response.aiter_bytes(STREAM_CHUNK_BYTES), consume, max_bytes)
+        finally:
+            await response.aclose()
+        return HttpValidators.from_headers(url, response.headers)
+
+    async def stream_text(self, url: str, consume: ChunkConsumer, *, max_bytes: int) -> None:
+        response = await self._open(url, stream=True)
+        try:
+            decoder = _incremental_decoder(response.charset_encoding)
+            if await _apump(
+                response.aiter_bytes(STREAM_CHUNK_BYTES),
+                lambda chunk: consume(decoder.decode(chunk)),
+                max_bytes,
+            ):
+                consume(decoder.decode(b"", final=True))
+        finally:
+            await response.aclose()
+
+    async def probe(self, url: str) -> int:
+        """Async :meth:`HttpClient.probe`: HEAD, then a one-byte ranged GET if HEAD is refused."""
+        response = await self._get_with_retries(url, {}, method="HEAD")
+        if response.status_code in PROBE_FALLBACK_STATUSES:
+            response = await self._get_with_retries(url, {"Range": PROBE_RANGE}, stream=True)
+            await response.aclose()
+        response.raise_for_status()
+        return response.status_code
+
+    async def _open(self, url: str, *, conditional: bool = False, stream: bool = False):
+        headers: dict[str, str] = {}
+        if conditional:
+            headers.update(await asyncio.to_thread(load_validator_headers, self.settings.db_path, url))
+
+        response = await self._get_with_retries(url, headers, stream=stream)
+        try:
+            if conditional and response.status_code == 304:
+                raise NotModified(url)
+            response.raise_for_status()
+        except Exception:
+            await response.aclose()
+            raise
+        return response
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _get_with_retries(
+        self, url: str, headers: dict[str, str], *, stream: bool = False, method: str = "GET"
+    ):
+        # Same policy as the sync client: robots.txt and the shared host bucket first,
+        # then Retry-After/backoff on throttling statuses, plain backoff on 5xx.
+        host = host_key(url)
+        await self._ensure_robots(host)
+        self.politeness.check_allowed(host, url)
+
+        response: Optional["httpx.Response"] = None
+        for attempt in range(self.settings.request_retries + 1):
+            wait_seconds = self.politeness.reserve(host)
+            if wait_seconds > 0:
+                await asyncio.sleep(wait_seconds)
+
+            request = self._client.build_request(method, url, headers=headers)
+            response = await self._client.send(request, stream=stream)
+            if response.status_code not in RETRY_STATUSES or attempt == self.settings.request_retries:
+                return response
+            await response.aclose()
+
+            if response.status_code in THROTTLE_STATUSES:
+                retry_after = parse_retry_after(response.headers)
+                self.politeness.penalize(host, retry_after if retry_after is not None else _backoff_seconds(attempt))
+            else:
+                await asyncio.sleep(_backoff_seconds(attempt))
+        return response
+
+    async def _ensure_robots(self, host: str) -> None:
+        if not self.politeness.needs_robots(host):
+            return
+        lock = self._robots_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            if not self.politeness.needs_robots(host):
+                return
+            try:
+                response = await self._client.get(f"{host}/robots.txt")
+                robots_text = response.text if response.status_code == 200 else None
+            except httpx.HTTPError:
+                robots_text = None
+            self.politeness.set_robots(host, robots_text)
@@ -4,17 +4,29 @@ import logging
 import os
 from pathlib import Path
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import FileResponse, RedirectResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import RedirectResponse
 
 from app import db
+from app.api.http_cache import etag_matches
 from app.api.routes_articles import router as articles_router
+from app.api.routes_events import router as events_router
 from app.api.routes_health import router as health_router
 from app.api.routes_ingestion import router as ingestion_router
+from app.compression import (
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    CompressionMiddleware,
+    DashboardBundle,
+    PrecompressedFile,
+)
 from app.config import Settings, load_settings
+from app.http_client import HttpClient
+from app.services.events import EventBus
+from app.services.health_monitor import SourceHealthMonitor
 from app.services.ingestion import IngestionService
-from app.services.scheduler import DailyUtcScheduler
+from app.services.result_cache import ResultCache
+from app.services.scheduler import AdaptivePollScheduler, DailyUtcScheduler
 from app.source_adapters.registry import build_source_adapters
 from app.utils import to_iso_utc, utc_now
 
@@ -25,13 +37,9 @@ app = FastAPI(title="Coffee News Ingestion API", version="1.0.0")
 BASE_DIR = Path(__file__).resolve().parent.parent
 DASHBOARD_FILE = BASE_DIR / "frontend" / "scrape_dashboard_profile.html"
 DASHBOARD_ASSETS_DIR = BASE_DIR / "frontend" / "assets"
+DASHBOARD_ASSETS_URL = "/dashboard-assets"
 
-if DASHBOARD_ASSETS_DIR.exists():
-    app.mount(
-        "/dashboard-assets",
-        StaticFiles(directory=str(DASHBOARD_ASSETS_DIR)),
-        name="dashboard-assets",
-    )
+app.add_middleware(CompressionMiddleware)
 
 
 @app.on_event("startup")
@@ -52,25 +60,48 @@ def startup_event() -> None:
         now_iso_utc=to_iso_utc(utc_now()),
     )
 
-    ingestion_service = IngestionService(settings=settings, adapters=adapters)
+    http = HttpClient(settings)
+    events = EventBus(db_path=settings.db_path)
+    events.start()
+    ingestion_service = IngestionService(settings=settings, adapters=adapters, http=http, events=events)
+
+    scheduler: AdaptivePollScheduler | DailyUtcScheduler
+    if settings.scheduler_mode == "daily":
+        scheduler = DailyUtcScheduler(
+            hour_utc=settings.schedule_hour_utc,
+            minute_utc=settings.schedule_minute_utc,
+            callback=lambda: ingestion_service.run_once(trigger="scheduler"),
+        )
+    else:
+        scheduler = AdaptivePollScheduler(
+            ingestion_service=ingestion_service,
+            policy=ingestion_service.poll_policy,
+            tick_seconds=settings.scheduler_tick_seconds,
+        )
 
-    scheduler = DailyUtcScheduler(
-        hour_utc=settings.schedule_hour_utc,
-        minute_utc=settings.schedule_minute_utc,
-        callback=lambda: ingestion_service.run_once(trigger="scheduler"),
-    )
+    health_monitor = SourceHealthMonitor(settings, adapters, politeness=http.politeness)
 
     if settings.scheduler_enabled:
         scheduler.start()
+        health_monitor.start()
         logger.info(
-            "scheduler_started hour_utc=%s minute_utc=%s",
+            "scheduler_started mode=%s poll_interval_seconds=%s-%s hour_utc=%s minute_utc=%s health_refresh_seconds=%s",
+            settings.scheduler_mode,
+            settings.poll_min_interval_seconds,
+            settings.poll_max_interval_seconds,
             settings.schedule_hour_utc,
             settings.schedule_minute_utc,
+            settings.health_refresh_interval_seconds,
         )
 
     app.state.settings = settings
     app.state.adapters = adapters
+    app.state.http = http
+    app.state.events = events
     app.state.ingestion_service = ingestion_service
+    app.state.health_monitor = health_monitor
+    app.state.article_cache = ResultCache(settings.article_cache_size)
+    app.state.dashboard = DashboardBundle.load(DASHBOARD_FILE, DASHBOARD_ASSETS_DIR, DASHBOARD_ASSETS_URL)
     app.state.scheduler = scheduler
 
 
@@ -79,6 +110,19 @@ def shutdown_event() -> None:
     scheduler = getattr(app.state, "scheduler", None)
     if scheduler:
         scheduler.stop()
+    ingestion_service = getattr(app.state, "ingestion_service", None)
+    if ingestion_service:
+        ingestion_service.shutdown()
+    health_monitor = getattr(app.state, "health_monitor", None)
+    if health_monitor:
+        health_monitor.stop()
+    events = getattr(app.state, "events", None)
+    if events:
+        events.stop()
+    http = getattr(app.state, "http", None)
+    if http:
+        http.close()
+    db.close_pools()
 
 
 @app.get("/")
@@ -86,17 +130,39 @@ def root() -> RedirectResponse:
     return RedirectResponse(url="/dashboard", status_code=307)
 
 
+def _precompressed_response(request: Request, file: PrecompressedFile, cache_control: str) -> Response:
+    headers = {"ETag": file.etag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+    if etag_matches(request, file.etag):
+        return Response(status_code=304, headers=headers)
+    body, encoding = file.body(request.headers.get("accept-encoding"))
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type=file.media_type, headers=headers)
+
+
 @app.get("/dashboard", include_in_schema=False)
 @app.get("/dashboard/", include_in_schema=False)
-def dashboard() -> FileResponse:
-    if not DASHBOARD_FILE.exists():
+def dashboard(request: Request) -> Response:
+    html = request.app.state.dashboard.html
+    if html is None:
         raise HTTPException(status_code=404, detail="dashboard file not found")
-    return FileResponse(str(DASHBOARD_FILE))
+    # Revalidated on every load so new asset hashes are picked up; a 304 costs no body.
+    return _precompressed_response(request, html, REVALIDATE_CACHE_CONTROL)
+
+
+@app.get(DASHBOARD_ASSETS_URL + "/{asset_path:path}", include_in_schema=False)
+def dashboard_asset(asset_path: str, request: Request) -> Response:
+    asset = request.app.state.dashboard.assets.get(asset_path)
+    if asset is None:
+        raise HTTPException(status_code=404, detail="asset not found")
+    versioned = request.query_params.get("v") == asset.content_hash
+    return _precompressed_response(request, asset, IMMUTABLE_CACHE_CONTROL if versioned else REVALIDATE_CACHE_CONTROL)
 
 
 app.include_router(articles_router, prefix="/api")
 app.include_router(ingestion_router, prefix="/api")
 app.include_router(health_router, prefix="/api")
+app.include_router(events_router, prefix="/api")
 
 
 if __name__ == "__main__":
@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
+from app.utils import article_id_from_canonical
+
 
 @dataclass(frozen=True)
 class SourceConfig:
@@ -19,16 +21,26 @@ class SourceConfig:
     time_selector: str = "time"
     snippet_selector: str = "p"
     image_selector: str = "img"
+    # Per-source override of Settings.html_parser (e.g. "lxml" for a source whose markup it parses identically).
+    html_parser: Optional[str] = None
 
 
 @dataclass(frozen=True)
 class RawArticle:
+    """An article as fetched. ``url`` and ``image_url`` are already canonical (adapters
+    run them through ``canonicalize_url``), so ``article_id`` is hashed once, here."""
+
     source_id: str
     title: str
     url: str
     published_at_utc: Optional[datetime]
     snippet: str = ""
     image_url: Optional[str] = None
+    article_id: str = ""
+
+    def __post_init__(self) -> None:
+        if not self.article_id:
+            object.__setattr__(self, "article_id", article_id_from_canonical(self.url))
 
 
 @dataclass(frozen=True)
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+from urllib.robotparser import RobotFileParser
+
+from app.config import Settings
+from app.utils import utc_now
+
+
+class RobotsDisallowed(Exception):
+    def __init__(self, url: str):
+        super().__init__(f"disallowed by robots.txt: {url}")
+        self.url = url
+
+
+class HostThrottled(Exception):
+    def __init__(self, host: str, wait_seconds: float):
+        super().__init__(f"host throttled for {wait_seconds:.0f}s: {host}")
+        self.host = host
+        self.wait_seconds = wait_seconds
+
+
+@dataclass
+class _HostState:
+    tokens: float
+    updated_at: float
+    blocked_until: float = 0.0
+    crawl_delay: Optional[float] = None
+    robots: Optional[RobotFileParser] = None
+    robots_expires_at: float = 0.0
+    robots_lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    raw = headers.get("Retry-After")
+    if not raw:
+        return None
+    raw = raw.strip()
+    if raw.isdigit():
+        return float(raw)
+    try:
+        return max(0.0, (parsedate_to_datetime(raw) - utc_now()).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class HostPoliteness:
+    """Per-host token buckets plus robots.txt rules, shared by every HTTP client.
+
+    ``reserve`` is non-blocking: it books a slot and returns how long the caller must
+    wait, so the threaded engine can ``time.sleep`` and the async engine can
+    ``asyncio.sleep`` on the same schedule.
+    """
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self._hosts: dict[str, _HostState] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, host: str) -> float:
+        with self._lock:
+            state = self._state(host)
+            now = time.monotonic()
+            rate = self._rate(state)
+            capacity = 1.0 if state.crawl_delay else float(max(1, self.settings.host_burst))
+
+            state.tokens = min(capacity, state.tokens + (now - state.updated_at) * rate)
+            state.updated_at = now
+            state.tokens -= 1.0
+
+            wait_seconds = 0.0 if state.tokens >= 0 else -state.tokens / rate
+            wait_seconds = max(wait_seconds, state.blocked_until - now)
+            if wait_seconds > self.settings.politeness_max_delay_seconds:
+                # Give the slot back; the caller fails fast instead of stalling the run.
+                state.tokens += 1.0
+                raise HostThrottled(host, wait_seconds)
+            return wait_seconds
+
+    def penalize(self, host: str, retry_after_seconds: float) -> None:
+        with self._lock:
+            state = self._state(host)
+            state.blocked_until = max(state.blocked_until, time.monotonic() + retry_after_seconds)
+
+    def needs_robots(self, host: str) -> bool:
+        if not self.settings.respect_robots_txt:
+            return False
+        with self._lock:
+            state = self._state(host)
+            return state.robots is None or state.robots_expires_at <= time.monotonic()
+
+    def robots_lock(self, host: str) -> threading.Lock:
+        with self._lock:
+            return self._state(host).robots_lock
+
+    def set_robots(self, host: str, robots_text: Optional[str]) -> None:
+        """Cache robots.txt for ``host``; ``None`` (missing/unreachable) allows everything."""
+        parser = RobotFileParser()
+        parser.parse((robots_text or "").splitlines())
+        crawl_delay = parser.crawl_delay(self.settings.user_agent) if robots_text else None
+
+        with self._lock:
+            state = self._state(host)
+            state.robots = parser
+            state.robots_expires_at = time.monotonic() + self.settings.robots_cache_seconds
+            state.crawl_delay = float(crawl_delay) if crawl_delay else None
+
+    def check_allowed(self, host: str, url: str) -> None:
+        if not self.settings.respect_robots_txt:
+            return
+        with self._lock:
+            robots = self._state(host).robots
+        if robots is not None and not robots.can_fetch(self.settings.user_agent, url):
+            raise RobotsDisallowed(url)
+
+    def _rate(self, state: _HostState) -> float:
+        rate = max(0.001, self.settings.host_requests_per_second)
+        if state.crawl_delay:
+            rate = min(rate, 1.0 / state.crawl_delay)
+        return rate
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = _HostState(tokens=float(max(1, self.settings.host_burst)), updated_at=time.monotonic())
+            self._hosts[host] = state
+        return state
@@ -21,8 +21,11 @@ class ArticleOut(BaseModel):
 
 
 class ArticleListResponse(BaseModel):
-    total: int
+    # None when the request passed include_total=false.
+    total: Optional[int] = None
     items: list[ArticleOut]
+    # Opaque keyset cursor for the next page; None on the last page.
+    next_cursor: Optional[str] = None
 
 
 class SaveResponse(BaseModel):
@@ -44,6 +47,9 @@ class IngestionRunOut(BaseModel):
     updated_count: int
     skipped_count: int
     error_count: int
+    sources_total: int = 0
+    sources_done: int = 0
+    records_so_far: int = 0
     notes: dict[str, Any] = Field(default_factory=dict)
 
 
@@ -68,4 +74,13 @@ class SourceHealthOut(BaseModel):
 
 class SourceHealthResponse(BaseModel):
     timestamp_utc: str
+    checked_at_utc: str
+    age_seconds: float
     sources: list[SourceHealthOut]
+
+
+class CacheStatsOut(BaseModel):
+    entries: int
+    max_entries: int
+    hits: int
+    misses: int
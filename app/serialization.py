@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from typing import Any, Iterable, Optional
+
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None
+
+
+def dumps(payload: Any) -> bytes:
+    """Compact UTF-8 JSON, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def article_payload(row: sqlite3.Row) -> dict[str, Any]:
+    """One ``ArticleOut`` as a plain dict, straight from a ``db.list_articles`` row.
+
+    Field order and coercions mirror ``ArticleOut`` exactly; the parity test in
+    ``tests/test_article_serialization.py`` keeps the two in step.
+    """
+    return {
+        "id": row["id"],
+        "source_id": row["source_id"],
+        "source_name": row["source_name"],
+        "title": row["title"],
+        "url": row["url"],
+        "canonical_url": row["canonical_url"],
+        "published_at_utc": row["published_at_utc"],
+        "snippet": row["snippet"] or "",
+        "image_url": row["image_url"],
+        "is_saved": bool(row["is_saved"]),
+        "first_seen_at_utc": row["first_seen_at_utc"],
+        "last_seen_at_utc": row["last_seen_at_utc"],
+    }
+
+
+def article_list_body(total: Optional[int], rows: Iterable[sqlite3.Row], next_cursor: Optional[str]) -> bytes:
+    """Serialized ``ArticleListResponse`` without building a Pydantic model per row."""
+    return dumps(
+        {
+            "total": total,
+            "items": [article_payload(row) for row in rows],
+            "next_cursor": next_cursor,
+        }
+    )
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from app import db
+from app.serialization import dumps
+from app.utils import to_iso_utc, utc_now
+
+logger = logging.getLogger(__name__)
+
+EVENT_REPLAY_SIZE = 256
+SUBSCRIBER_QUEUE_SIZE = 512
+# How often a shared bus picks up events written by other workers.
+EVENT_POLL_SECONDS = 1.0
+RESYNC_EVENT = "resync"
+ARTICLES_UPSERTED = "articles.upserted"
+ARTICLES_DELETED = "articles.deleted"
+ARTICLES_PRUNED = "articles.pruned"
+INGESTION_RUN = "ingestion.run"
+
+
+@dataclass(frozen=True)
+class Event:
+    id: int
+    type: str
+    data: dict[str, Any] = field(default_factory=dict)
+
+
+class Subscription:
+    """One subscriber's bounded queue, fed on the subscriber's own event loop."""
+
+    def __init__(self, bus: "EventBus", loop: asyncio.AbstractEventLoop, max_pending: int, last_event_id: int = 0):
+        self.bus = bus
+        self.loop = loop
+        self.last_event_id = last_event_id
+        self._queue: asyncio.Queue[Event] = asyncio.Queue(maxsize=max_pending)
+
+    async def get(self, timeout: float) -> Optional[Event]:
+        """Next event, or None if nothing arrived within ``timeout`` seconds."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self.bus.unsubscribe(self)
+
+    def offer(self, event: Event) -> None:
+        if event.type == RESYNC_EVENT:
+            # The client reloads; ids from before a restart no longer hide newer events.
+            self.last_event_id = event.id
+        elif event.id <= self.last_event_id:
+            return  # already seen, e.g. resumed with an id this worker had not polled yet
+        else:
+            self.last_event_id = event.id
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # A client this far behind reloads instead of replaying its backlog.
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(self.bus.resync_event())
+
+
+class EventBus:
+    """Fan-out of change events to streaming (SSE) subscribers.
+
+    ``publish`` may be called from any thread; events reach each subscriber's
+    event loop through a bounded queue. The last ``replay_size`` events are kept
+    so a reconnecting client can resume from its ``Last-Event-ID``; one that has
+    fallen further behind gets a ``resync`` event and should reload from the REST
+    endpoints.
+
+    With ``db_path`` the bus is shared by every worker on that database: events
+    are appended to the ``events`` table, which assigns their ids, and each
+    worker tails it (right after its own publishes, and every ``poll_seconds``
+    from ``start()``), so a stream on any worker sees every worker's changes and
+    event ids survive restarts. Without it, events and ids live in this process
+    only, and ids from before a restart trigger a ``resync``.
+    """
+
+    def __init__(
+        self,
+        replay_size: int = EVENT_REPLAY_SIZE,
+        max_pending: int = SUBSCRIBER_QUEUE_SIZE,
+        *,
+        db_path: Optional[str] = None,
+        poll_seconds: float = EVENT_POLL_SECONDS,
+    ):
+        self.max_pending = max_pending
+        self.db_path = db_path
+        self.poll_seconds = poll_seconds
+        self._recent: deque[Event] = deque(maxlen=replay_size)
+        self._subscribers: set[Subscription] = set()
+        self._last_id = 0
+        # Re-entrant: events are numbered, recorded and fanned out in one critical section.
+        self._lock = threading.RLock()
+        self._poll_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        if db_path is not None:
+            with db.connection(db_path, readonly=True) as conn:
+                for row in db.recent_events(conn, replay_size):
+                    self._recent.append(_row_to_event(row))
+            self._last_id = self._recent[-1].id if self._recent else 0
+
+    def publish(self, event_type: str, data: dict[str, Any]) -> Event:
+        if self.db_path is None:
+            with self._lock:
+                event = Event(self._last_id + 1, event_type, data)
+                self._dispatch(event)
+            return event
+
+        with db.connection(self.db_path) as conn:
+            event_id = db.append_event(
+                conn,
+                event_type,
+                dumps(data).decode("utf-8"),
+                now_utc=to_iso_utc(utc_now()),
+                retain=self._recent.maxlen,
+            )
+        # Deliver it now, in id order with anything other workers wrote meanwhile.
+        self.poll()
+        return Event(event_id, event_type, data)
+
+    def poll(self) -> int:
+        """Dispatch events other workers appended since the last poll; returns how many."""
+        if self.db_path is None:
+            return 0
+        with self._poll_lock:
+            with db.connection(self.db_path, readonly=True) as conn:
+                rows = db.events_after(conn, self._last_id)
+            if rows and self._last_id and rows[0]["id"] > self._last_id + 1:
+                # Rows this worker never saw were already trimmed; its clients must reload.
+                self._fan_out(self.resync_event())
+            for row in rows:
+                self._dispatch(_row_to_event(row))
+            return len(rows)
+
+    def start(self) -> None:
+        if self.db_path is None or (self._thread and self._thread.is_alive()):
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run_loop, name="event-relay", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+
+    def subscribe(self, last_event_id: Optional[int] = None) -> Subscription:
+        """Register a subscriber on the running event loop, replaying what it missed."""
+        subscription = Subscription(self, asyncio.get_running_loop(), self.max_pending, last_event_id or 0)
+        with self._lock:
+            backlog = self._missed_since(last_event_id)
+            self._subscribers.add(subscription)
+        for event in backlog:
+            subscription.offer(event)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def resync_event(self) -> Event:
+        with self._lock:
+            return Event(self._last_id, RESYNC_EVENT)
+
+    def _dispatch(self, event: Event) -> None:
+        # Fanned out under the lock too, so every subscriber's loop receives ids in order.
+        with self._lock:
+            self._last_id = event.id
+            self._recent.append(event)
+            self._fan_out(event)
+
+    def _fan_out(self, event: Event) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event)
+            except RuntimeError:
+                # The subscriber's loop is closed; it can no longer be reached.
+                self.unsubscribe(subscription)
+
+    def _missed_since(self, last_event_id: Optional[int]) -> list[Event]:
+        if last_event_id is None or last_event_id == self._last_id:
+            return []
+        if last_event_id > self._last_id:
+            # A shared bus has simply not polled that far yet; the relay delivers the rest.
+            return [] if self.db_path is not None else [Event(self._last_id, RESYNC_EVENT)]
+        oldest = self._recent[0].id if self._recent else self._last_id + 1
+        if last_event_id < oldest - 1:
+            return [Event(self._last_id, RESYNC_EVENT)]
+        return [event for event in self._recent if event.id > last_event_id]
+
+    def _run_loop(self) -> None:
+        while not self._stop_event.wait(timeout=self.poll_seconds):
+            try:
+                self.poll()
+            except Exception:  # pragma: no cover
+                logger.exception("event_poll_failed")
+
+
+def _row_to_event(row) -> Event:
+    return Event(row["id"], row["type"], json.loads(row["data"]))
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+from app.config import Settings
+from app.http_client import AsyncHttpClient
+from app.models import SourceHealth
+from app.politeness import HostPoliteness
+from app.source_adapters.async_base import AsyncSourceAdapter
+from app.source_adapters.base import BaseSourceAdapter
+from app.utils import to_iso_utc, utc_now
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class HealthSnapshot:
+    checks: tuple[SourceHealth, ...]
+    checked_at_utc: str
+    checked_at_monotonic: float
+
+    def age_seconds(self) -> float:
+        return max(0.0, time.monotonic() - self.checked_at_monotonic)
+
+
+class SourceHealthMonitor:
+    """Source health checks probed concurrently and served from a TTL cache.
+
+    ``snapshot()`` returns the cached result and only probes when there is none yet,
+    it is older than ``health_cache_ttl_seconds`` or a refresh is forced. Concurrent
+    callers share one refresh. ``start()`` keeps the snapshot warm from a background
+    thread so requests normally never wait on the network.
+
+    With ``FETCH_ENGINE=async`` the probes run as coroutines on one event loop
+    (like ingestion's fetches); pass the sync client's ``politeness`` so both
+    engines draw on the same per-host budget.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        adapters: list[BaseSourceAdapter],
+        politeness: Optional[HostPoliteness] = None,
+    ):
+        self.settings = settings
+        self.adapters = adapters
+        self.politeness = politeness
+        self._snapshot: Optional[HealthSnapshot] = None
+        self._refresh_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def snapshot(self, *, refresh: bool = False) -> HealthSnapshot:
+        current = self._snapshot
+        if refresh or current is None or current.age_seconds() > self.settings.health_cache_ttl_seconds:
+            return self.refresh()
+        return current
+
+    def refresh(self) -> HealthSnapshot:
+        requested_at = time.monotonic()
+        with self._refresh_lock:
+            current = self._snapshot
+            if current is not None and current.checked_at_monotonic >= requested_at:
+                # Another caller finished a refresh while this one waited for the lock.
+                return current
+
+            started = time.perf_counter()
+            checks = self._probe_all()
+            snapshot = HealthSnapshot(
+                checks=tuple(checks),
+                checked_at_utc=to_iso_utc(utc_now()),
+                checked_at_monotonic=time.monotonic(),
+            )
+            self._snapshot = snapshot
+
+        logger.info(
+            "health_refreshed sources=%s failing=%s elapsed_ms=%.1f",
+            len(checks),
+            sum(1 for check in checks if check.status != "ok"),
+            (time.perf_counter() - started) * 1000,
+        )
+        return snapshot
+
+    def start(self) -> None:
+        if self.settings.health_refresh_interval_seconds <= 0:
+            return
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run_loop, name="source-health-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+
+    def _probe_all(self) -> list[SourceHealth]:
+        if not self.adapters:
+            return []
+        if self.settings.fetch_engine == "async":
+            return asyncio.run(self._probe_all_async())
+        workers = max(1, min(self.settings.health_check_concurrency, len(self.adapters)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="health-probe") as pool:
+            return list(pool.map(lambda adapter: adapter.check_health(self.settings), self.adapters))
+
+    async def _probe_all_async(self) -> list[SourceHealth]:
+        limit = asyncio.Semaphore(max(1, self.settings.health_check_concurrency))
+
+        async def probe(adapter: AsyncSourceAdapter) -> SourceHealth:
+            async with limit:
+                return await adapter.check_health(self.settings)
+
+        async with AsyncHttpClient(self.settings, politeness=self.politeness) as http:
+            return list(await asyncio.gather(*(probe(AsyncSourceAdapter(adapter, http)) for adapter in self.adapters)))
+
+    def _run_loop(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self.refresh()
+            except Exception:  # pragma: no cover
+                logger.exception("health_refresh_failed")
+            if self._stop_event.wait(timeout=self.settings.health_refresh_interval_seconds):
+                break
@@ -1,52 +1,186 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
+import queue
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import asdict
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Callable, Collection, Iterator
 from uuid import uuid4
 
 from app import db
 from app.config import Settings
+from app.http_client import AsyncHttpClient, HttpClient
 from app.models import NormalizedArticle, RawArticle
+from app.serialization import article_payload
+from app.services.events import ARTICLES_PRUNED, ARTICLES_UPSERTED, INGESTION_RUN, EventBus
+from app.services.lease import DbLease, LeaseLost
 from app.services.retention import apply_retention
-from app.utils import article_id_from_canonical, canonicalize_url, to_iso_utc, utc_now
+from app.services.scheduler import (
+    POLL_ERROR,
+    POLL_NEW,
+    POLL_NOT_MODIFIED,
+    POLL_UNCHANGED,
+    AdaptivePollPolicy,
+)
+from app.source_adapters.async_base import AsyncSourceAdapter
+from app.source_adapters.base import FETCH_ERROR_SUFFIX, NOT_MODIFIED_WARNING, FetchResult
+from app.utils import to_iso_utc, utc_now
+
+logger = logging.getLogger(__name__)
+
+INGESTION_LEASE = "ingestion"
 
 
 class IngestionService:
-    def __init__(self, settings: Settings, adapters: list[Any]):
+    def __init__(
+        self,
+        settings: Settings,
+        adapters: list[Any],
+        http: HttpClient | None = None,
+        events: EventBus | None = None,
+        lease: DbLease | None = None,
+        poll_policy: AdaptivePollPolicy | None = None,
+    ):
         self.settings = settings
         self.adapters = adapters
+        self.http = http or HttpClient(settings)
+        self.events = events
+        # Every run, scheduled or manual, reschedules the sources it polled.
+        self.poll_policy = poll_policy or AdaptivePollPolicy.from_settings(settings)
+        # The lease makes runs exclusive across worker processes; the lock within this one.
+        self.lease = lease or DbLease(settings.db_path, INGESTION_LEASE, ttl_seconds=settings.ingestion_lease_ttl_seconds)
+        for adapter in self.adapters:
+            adapter.use_http_client(self.http)
         self._lock = threading.Lock()
+        # Manual triggers run here so the request returns at once; the lock keeps it to one run.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ingestion-run")
 
     def is_running(self) -> bool:
-        return self._lock.locked()
+        """True while this process or any other worker holds the ingestion lease."""
+        return self._lock.locked() or self.lease.holder() is not None
 
-    def run_once(self, *, trigger: str = "manual") -> tuple[bool, dict[str, Any] | None, str]:
-        acquired = self._lock.acquire(blocking=False)
-        if not acquired:
+    def run_once(
+        self,
+        *,
+        trigger: str = "manual",
+        source_ids: Collection[str] | None = None,
+        select_sources: Callable[[], Collection[str]] | None = None,
+    ) -> tuple[bool, dict[str, Any] | None, str]:
+        """Run ingestion to completion on the calling thread (scheduler, CLI).
+
+        ``source_ids`` limits the run to those sources; by default every source is
+        fetched. ``select_sources`` instead picks them once the lease is held, so the
+        adaptive scheduler decides what is due while no other worker can poll it.
+        """
+        if not self._acquire(trigger):
             return False, None, "ingestion already running"
+        try:
+            adapters = self._select_adapters(select_sources() if select_sources is not None else source_ids)
+            if not adapters:
+                return False, None, "no sources selected"
+            run_id, started_at = self._record_run(trigger, adapters)
+            result = self._execute_run(run_id=run_id, started_at=started_at, trigger=trigger, adapters=adapters)
+            return True, result, "ok"
+        finally:
+            self._end_run()
+
+    def start_run(self, *, trigger: str = "manual") -> tuple[bool, dict[str, Any] | None, str]:
+        """Queue a run on the background executor and return its freshly created ``running`` row."""
+        begun = self._begin_run(trigger, self.adapters)
+        if begun is None:
+            return False, None, "ingestion already running"
+
+        run_id, started_at = begun
+        try:
+            self._executor.submit(self._run_in_background, run_id, started_at, trigger, self.adapters)
+        except Exception:
+            self._end_run()
+            raise
+        return True, self.get_run(run_id), "started"
 
+    def get_run(self, run_id: str) -> dict[str, Any] | None:
+        with db.connection(self.settings.db_path, readonly=True) as conn:
+            row = db.get_ingestion_run(conn, run_id)
+        return _run_row_to_dict(row) if row else None
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _select_adapters(self, source_ids: Collection[str] | None) -> list[Any]:
+        if source_ids is None:
+            return self.adapters
+        wanted = set(source_ids)
+        return [adapter for adapter in self.adapters if adapter.source.id in wanted]
+
+    def _begin_run(self, trigger: str, adapters: list[Any]) -> tuple[str, datetime] | None:
+        """Take the run lock and lease and record the run; the caller calls ``_end_run`` when done."""
+        if not self._acquire(trigger):
+            return None
+        try:
+            return self._record_run(trigger, adapters)
+        except Exception:
+            self._end_run()
+            raise
+
+    def _acquire(self, trigger: str) -> bool:
+        """Take the run lock and lease; on success the caller calls ``_end_run`` when done."""
+        if not self._lock.acquire(blocking=False):
+            return False
+        try:
+            acquired = self.lease.acquire()
+        except Exception:
+            self._lock.release()
+            raise
+        if not acquired:
+            self._lock.release()
+            logger.info("ingestion_skipped trigger=%s reason=lease_held", trigger)
+        return acquired
+
+    def _record_run(self, trigger: str, adapters: list[Any]) -> tuple[str, datetime]:
         run_id = str(uuid4())
         started_at = utc_now()
         started_iso = to_iso_utc(started_at)
+        with db.connection(self.settings.db_path) as conn:
+            # Holding the lease means no other run is live; any "running" row is an orphan.
+            abandoned = db.fail_running_ingestion_runs(
+                conn,
+                completed_at_utc=started_iso,
+                reason=f"lease expired: {self.lease.recovered_from}" if self.lease.recovered_from else "worker stopped",
+            )
+            db.create_ingestion_run(
+                conn,
+                run_id,
+                started_iso,
+                notes={"trigger": trigger, "warnings": []},
+                sources_total=len(adapters),
+            )
+        if abandoned:
+            logger.warning("ingestion_runs_abandoned count=%s", abandoned)
+        if self.events is not None:
+            self._publish_run(self.get_run(run_id))
+        return run_id, started_at
 
+    def _end_run(self) -> None:
         try:
-            with db.connection(self.settings.db_path) as conn:
-                db.create_ingestion_run(
-                    conn,
-                    run_id,
-                    started_iso,
-                    notes={"trigger": trigger, "warnings": []},
-                )
-
-            result = self._execute_run(run_id=run_id, started_at=started_at, trigger=trigger)
-            return True, result, "ok"
+            self.lease.release()
         finally:
             self._lock.release()
 
-    def _execute_run(self, *, run_id: str, started_at: datetime, trigger: str) -> dict[str, Any]:
+    def _run_in_background(self, run_id: str, started_at: datetime, trigger: str, adapters: list[Any]) -> None:
+        try:
+            self._execute_run(run_id=run_id, started_at=started_at, trigger=trigger, adapters=adapters)
+        except Exception:  # pragma: no cover - _execute_run finalizes its own failures
+            logger.exception("ingestion_run_failed run_id=%s", run_id)
+        finally:
+            self._end_run()
+
+    def _execute_run(
+        self, *, run_id: str, started_at: datetime, trigger: str, adapters: list[Any]
+    ) -> dict[str, Any]:
         now_utc = utc_now()
         cutoff = now_utc - timedelta(hours=self.settings.ingestion_window_hours)
 
@@ -56,42 +190,89 @@ class IngestionService:
         updated_count = 0
         skipped_count = 0
         error_count = 0
+        sources_done = 0
         warnings: list[str] = []
+        not_modified: list[str] = []
+        polled: dict[str, str] = {}
 
         try:
-            with db.connection(self.settings.db_path) as conn:
-                for adapter in self.adapters:
-                    try:
-                        fetched, adapter_warnings = adapter.fetch(self.settings)
-                        records_in += len(fetched)
-                        warnings.extend([f"{adapter.source.id}: {w}" for w in adapter_warnings])
-
-                        for raw in fetched:
-                            action = self._upsert_if_in_window(
-                                conn=conn,
-                                raw=raw,
-                                now_utc=now_utc,
-                                cutoff_utc=cutoff,
-                            )
-                            if action == "inserted":
-                                new_count += 1
-                                records_out += 1
-                            elif action == "updated":
-                                updated_count += 1
-                                records_out += 1
-                            else:
-                                skipped_count += 1
-                    except Exception as exc:
-                        error_count += 1
-                        warnings.append(f"{adapter.source.id}: ingestion_error={exc}")
+            # Each source is written in its own short transaction so the writer is never
+            # held while sources are still downloading (fetch threads persist validators).
+            for adapter, pending in self._fetch_sources(adapters):
+                # Another worker may own the lease (and be writing) once ours was lost.
+                self.lease.ensure_held()
+                try:
+                    # Adapters return a FetchResult; a bare (articles, warnings) pair carries no validators.
+                    fetched, adapter_warnings, validators = FetchResult(*pending.result())
+                    records_in += len(fetched)
+                    source_not_modified = False
+                    source_failed = False
+                    for warning in adapter_warnings:
+                        if warning.startswith(NOT_MODIFIED_WARNING):
+                            source_not_modified = True
+                            not_modified.append(f"{adapter.source.id}: {warning.split(': ', 1)[-1]}")
+                        else:
+                            source_failed |= warning.split(":", 1)[0].endswith(FETCH_ERROR_SUFFIX)
+                            warnings.append(f"{adapter.source.id}: {warning}")
+
+                    batch: list[NormalizedArticle] = []
+                    for raw in fetched:
+                        normalized = self._normalize_if_in_window(raw=raw, now_utc=now_utc, cutoff_utc=cutoff)
+                        if normalized is None:
+                            skipped_count += 1
+                        else:
+                            batch.append(normalized)
+
+                    with db.connection(self.settings.db_path) as conn:
+                        inserted, updated = db.upsert_articles(conn, batch, to_iso_utc(now_utc))
+                        # Saved only with the articles, so the next 304 never hides unstored content.
+                        if validators is not None:
+                            validators.save(conn, now_utc=to_iso_utc(now_utc))
+                        written = db.get_articles(conn, [a.id for a in batch]) if self.events is not None else []
+                    if written:
+                        self.events.publish(
+                            ARTICLES_UPSERTED,
+                            {
+                                "source_id": adapter.source.id,
+                                "inserted": inserted,
+                                "updated": updated,
+                                "items": [article_payload(row) for row in written],
+                            },
+                        )
+                    new_count += inserted
+                    updated_count += updated
+                    records_out += inserted + updated
+                    if inserted:
+                        polled[adapter.source.id] = POLL_NEW
+                    elif source_not_modified:
+                        polled[adapter.source.id] = POLL_NOT_MODIFIED
+                    elif source_failed and not fetched:
+                        # The adapter swallowed the failure; back off like any other error.
+                        polled[adapter.source.id] = POLL_ERROR
+                    else:
+                        polled[adapter.source.id] = POLL_UNCHANGED
+                except Exception as exc:
+                    error_count += 1
+                    polled[adapter.source.id] = POLL_ERROR
+                    warnings.append(f"{adapter.source.id}: ingestion_error={exc}")
 
+                sources_done += 1
+                with db.connection(self.settings.db_path) as conn:
+                    db.update_ingestion_progress(
+                        conn, run_id, sources_done=sources_done, records_so_far=records_out
+                    )
+                if self.events is not None:
+                    self._publish_run(self.get_run(run_id))
+
+            self.lease.ensure_held()
+            with db.connection(self.settings.db_path) as conn:
                 removed_count = apply_retention(
                     conn,
                     now_utc=now_utc,
                     window_hours=self.settings.ingestion_window_hours,
                 )
 
-                if error_count >= len(self.adapters):
+                if error_count >= len(adapters):
                     status = "failed"
                 elif error_count > 0:
                     status = "partial_failure"
@@ -103,8 +284,11 @@ class IngestionService:
                     "records_in": records_in,
                     "records_out": records_out,
                     "removed_count": removed_count,
+                    "not_modified": not_modified,
+                    "polled": polled,
                     "warnings": warnings,
                 }
+                self.poll_policy.record_polls(conn, polled, now_utc=now_utc)
 
                 db.complete_ingestion_run(
                     conn,
@@ -118,8 +302,12 @@ class IngestionService:
                     notes=notes,
                 )
 
-                row = db.get_ingestion_run(conn, run_id)
-                return _run_row_to_dict(row)
+                run = _run_row_to_dict(db.get_ingestion_run(conn, run_id))
+
+            if removed_count and self.events is not None:
+                self.events.publish(ARTICLES_PRUNED, {"cutoff_utc": to_iso_utc(cutoff), "removed": removed_count})
+            self._publish_run(run)
+            return run
         except Exception as exc:
             # Ensure run is finalized in DB even if a fatal error occurs.
             with db.connection(self.settings.db_path) as conn:
@@ -134,41 +322,113 @@ class IngestionService:
                     error_count=error_count + 1,
                     notes={"trigger": trigger, "warnings": [f"fatal: {exc}"]},
                 )
-                row = db.get_ingestion_run(conn, run_id)
-                return _run_row_to_dict(row)
+                run = _run_row_to_dict(db.get_ingestion_run(conn, run_id))
+            if isinstance(exc, LeaseLost):
+                # The schedule now belongs to the worker holding the lease.
+                logger.error("ingestion_aborted run_id=%s reason=lease_lost", run_id)
+                self._publish_run(run)
+                return run
+            # Back off every source this run did not finish, so a broken run is not retried each tick.
+            unfinished = {adapter.source.id: POLL_ERROR for adapter in adapters if adapter.source.id not in polled}
+            try:
+                with db.connection(self.settings.db_path) as conn:
+                    self.poll_policy.record_polls(conn, {**polled, **unfinished}, now_utc=now_utc)
+            except Exception:
+                logger.exception("poll_schedule_update_failed run_id=%s", run_id)
+            self._publish_run(run)
+            return run
 
-    def _upsert_if_in_window(
+    def _publish_run(self, run: dict[str, Any] | None) -> None:
+        if self.events is not None and run is not None:
+            self.events.publish(INGESTION_RUN, run)
+
+    def _fetch_sources(self, adapters: list[Any]) -> Iterator[tuple[Any, Future]]:
+        """Fetch ``adapters`` on a bounded worker pool.
+
+        Futures are yielded in registry order so the caller stays the single DB
+        writer and run notes stay deterministic; wall time is bounded by the
+        slowest source rather than the sum of all of them. The async engine yields
+        them in completion order instead.
+        """
+        if self.settings.fetch_engine == "async":
+            yield from self._fetch_sources_on_event_loop(adapters)
+            return
+
+        workers = max(1, min(self.settings.source_fetch_concurrency, len(adapters)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="source-fetch") as executor:
+            pending = [(adapter, executor.submit(adapter.fetch, self.settings)) for adapter in adapters]
+            yield from pending
+
+    def _fetch_sources_on_event_loop(self, adapters: list[Any]) -> Iterator[tuple[Any, Future]]:
+        """Run the fetches on an event loop thread and yield each source as soon as it finishes."""
+        finished: queue.Queue[tuple[Any, Future] | None] = queue.Queue()
+        loop_errors: list[BaseException] = []
+
+        def run_loop() -> None:
+            try:
+                asyncio.run(self.fetch_all_async(adapters, lambda adapter, pending: finished.put((adapter, pending))))
+            except BaseException as exc:
+                loop_errors.append(exc)
+            finally:
+                finished.put(None)
+
+        thread = threading.Thread(target=run_loop, name="source-fetch-loop", daemon=True)
+        thread.start()
+        try:
+            while (item := finished.get()) is not None:
+                yield item
+        finally:
+            thread.join()
+        if loop_errors:
+            raise loop_errors[0]
+
+    async def fetch_all_async(self, adapters: list[Any], deliver: Callable[[Any, Future], None]) -> None:
+        """Fetch ``adapters`` from one event loop, handing each finished fetch to ``deliver``."""
+        limit = asyncio.Semaphore(max(1, self.settings.source_fetch_concurrency))
+
+        async def fetch_one(adapter: Any, async_adapter: AsyncSourceAdapter) -> tuple[Any, Future]:
+            pending: Future = Future()
+            async with limit:
+                try:
+                    pending.set_result(await async_adapter.fetch(self.settings))
+                except Exception as exc:
+                    pending.set_exception(exc)
+            return adapter, pending
+
+        async with AsyncHttpClient(self.settings, politeness=self.http.politeness) as http:
+            fetches = [fetch_one(adapter, AsyncSourceAdapter(adapter, http)) for adapter in adapters]
+            for next_finished in asyncio.as_completed(fetches):
+                deliver(*await next_finished)
+
+    def _normalize_if_in_window(
         self,
         *,
-        conn,
         raw: RawArticle,
         now_utc: datetime,
         cutoff_utc: datetime,
-    ) -> str:
+    ) -> NormalizedArticle | None:
         if raw.published_at_utc is None:
-            return "skipped"
+            return None
 
         published_utc = raw.published_at_utc.astimezone(timezone.utc)
         if published_utc < cutoff_utc:
-            return "skipped"
+            return None
 
-        canonical = canonicalize_url(raw.url)
-        normalized = NormalizedArticle(
-            id=article_id_from_canonical(canonical),
+        return NormalizedArticle(
+            id=raw.article_id,
             source_id=raw.source_id,
             title=raw.title.strip(),
-            url=canonicalize_url(raw.url),
-            canonical_url=canonical,
+            url=raw.url,
+            canonical_url=raw.url,
             published_at_utc=to_iso_utc(published_utc),
             snippet=raw.snippet.strip(),
-            image_url=canonicalize_url(raw.image_url) if raw.image_url else None,
+            image_url=raw.image_url,
             first_seen_at_utc=to_iso_utc(now_utc),
             last_seen_at_utc=to_iso_utc(now_utc),
         )
-        return db.upsert_article(conn, normalized, to_iso_utc(now_utc))
 
     def latest_status(self) -> dict[str, Any]:
-        with db.connection(self.settings.db_path) as conn:
+        with db.connection(self.settings.db_path, readonly=True) as conn:
             row = db.latest_ingestion_run(conn)
         return {
             "running": self.is_running(),
@@ -192,5 +452,8 @@ def _run_row_to_dict(row) -> dict[str, Any]:
         "updated_count": row["updated_count"],
         "skipped_count": row["skipped_count"],
         "error_count": row["error_count"],
+        "sources_total": row["sources_total"],
+        "sources_done": row["sources_done"],
+        "records_so_far": row["records_so_far"],
         "notes": notes,
     }
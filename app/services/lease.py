@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+from uuid import uuid4
+
+from app import db
+from app.utils import to_iso_utc, utc_now
+
+logger = logging.getLogger(__name__)
+
+# Heartbeats renew the lease this many times per TTL, so one or two missed beats
+# (a slow disk, a GC pause) do not let another worker take over.
+HEARTBEATS_PER_TTL = 3
+
+
+class LeaseLost(RuntimeError):
+    """Raised by ``DbLease.ensure_held`` once a heartbeat found the lease taken over."""
+
+
+def default_owner_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+
+
+class DbLease:
+    """A named lease row in SQLite that at most one process holds at a time.
+
+    The holder renews ``expires_at_utc`` from a heartbeat thread; a holder that dies
+    stops renewing, and once the lease expires the next ``acquire`` from any
+    worker takes it over. A holder whose renewal fails has ``lost`` set and must
+    stop writing; ``ensure_held`` raises ``LeaseLost`` for that.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        name: str,
+        *,
+        ttl_seconds: int,
+        owner: Optional[str] = None,
+        clock: Callable[[], datetime] = utc_now,
+    ):
+        self.db_path = db_path
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.owner = owner or default_owner_id()
+        self.clock = clock
+        self.recovered_from: Optional[str] = None
+        self.lost = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def acquire(self) -> bool:
+        now = self.clock()
+        with db.connection(self.db_path) as conn:
+            previous = db.get_lease(conn, self.name)
+            acquired = db.acquire_lease(
+                conn, self.name, self.owner, now_utc=to_iso_utc(now), expires_at_utc=self._expiry(now)
+            )
+        if not acquired:
+            return False
+
+        self.recovered_from = None
+        self.lost.clear()
+        if previous is not None and previous["owner"] != self.owner:
+            self.recovered_from = previous["owner"]
+            logger.warning(
+                "lease_recovered name=%s owner=%s stale_owner=%s expired_at=%s",
+                self.name,
+                self.owner,
+                previous["owner"],
+                previous["expires_at_utc"],
+            )
+        self._start_heartbeat()
+        return True
+
+    def renew(self) -> bool:
+        now = self.clock()
+        with db.connection(self.db_path) as conn:
+            return db.renew_lease(conn, self.name, self.owner, now_utc=to_iso_utc(now), expires_at_utc=self._expiry(now))
+
+    def ensure_held(self) -> None:
+        if self.lost.is_set():
+            raise LeaseLost(f"{self.name} lease lost by {self.owner}")
+
+    def release(self) -> None:
+        self._stop_heartbeat()
+        with db.connection(self.db_path) as conn:
+            db.release_lease(conn, self.name, self.owner)
+
+    def holder(self) -> Optional[str]:
+        """Owner of the unexpired lease, if any (this process included)."""
+        with db.connection(self.db_path, readonly=True) as conn:
+            row = db.get_lease(conn, self.name)
+        if row is None or row["expires_at_utc"] <= to_iso_utc(self.clock()):
+            return None
+        return row["owner"]
+
+    def _expiry(self, now: datetime) -> str:
+        return to_iso_utc(now + timedelta(seconds=self.ttl_seconds))
+
+    def _start_heartbeat(self) -> None:
+        self._stop_heartbeat()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._heartbeat_loop, name=f"lease-{self.name}", daemon=True)
+        self._thread.start()
+
+    def _stop_heartbeat(self) -> None:
+        self._stop_event.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+        self._thread = None
+
+    def _heartbeat_loop(self) -> None:
+        interval = max(1.0, self.ttl_seconds / HEARTBEATS_PER_TTL)
+        while not self._stop_event.wait(timeout=interval):
+            try:
+                if not self.renew():
+                    self.lost.set()
+                    logger.error("lease_lost name=%s owner=%s", self.name, self.owner)
+                    return
+            except Exception:  # pragma: no cover
+                logger.exception("lease_heartbeat_failed name=%s", self.name)
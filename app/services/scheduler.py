@@ -1,14 +1,32 @@
 from __future__ import annotations
 
 import logging
+import random
+import sqlite3
 import threading
 from datetime import datetime, timedelta, timezone
-from typing import Callable
+from typing import TYPE_CHECKING, Callable, Iterable, Mapping, Optional
 
-from app.utils import to_iso_utc
+from app import db
+from app.config import Settings
+from app.utils import parse_datetime_to_utc, to_iso_utc, utc_now
+
+if TYPE_CHECKING:
+    from app.services.ingestion import IngestionService
 
 logger = logging.getLogger(__name__)
 
+# Per-source poll outcomes, recorded in source_schedule.last_outcome.
+POLL_NEW = "new"
+POLL_UNCHANGED = "unchanged"
+POLL_NOT_MODIFIED = "not_modified"
+POLL_ERROR = "error"
+
+# A poll that finds nothing new stretches the interval by this factor (the publish rate
+# alone may still ask for less); a failed poll backs off harder.
+QUIET_BACKOFF = 1.5
+ERROR_BACKOFF = 2.0
+
 
 class DailyUtcScheduler:
     def __init__(self, *, hour_utc: int, minute_utc: int, callback: Callable[[], None]):
@@ -52,3 +70,191 @@ class DailyUtcScheduler:
                 self.callback()
             except Exception:  # pragma: no cover
                 logger.exception("scheduled_ingestion_failed")
+
+
+class AdaptivePollPolicy:
+    """Picks each source's next poll time from its publish rate and recent poll outcomes.
+
+    The base interval is the mean gap between the source's articles over the ingestion
+    window (no articles means the maximum). Polls that come back empty or ``304`` back off
+    from the previous interval, a poll that finds new articles snaps back to the rate, and
+    the result is clamped to the configured bounds. Due times are jittered so sources that
+    share an interval drift apart instead of firing together.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_interval_seconds: int,
+        max_interval_seconds: int,
+        jitter_ratio: float,
+        window_hours: int,
+        rng: Optional[random.Random] = None,
+    ):
+        self.min_interval_seconds = max(1, min_interval_seconds)
+        self.max_interval_seconds = max(self.min_interval_seconds, max_interval_seconds)
+        self.jitter_ratio = max(0.0, jitter_ratio)
+        self.window_hours = window_hours
+        self.rng = rng or random.Random()
+
+    @classmethod
+    def from_settings(cls, settings: Settings, rng: Optional[random.Random] = None) -> "AdaptivePollPolicy":
+        return cls(
+            min_interval_seconds=settings.poll_min_interval_seconds,
+            max_interval_seconds=settings.poll_max_interval_seconds,
+            jitter_ratio=settings.poll_jitter_ratio,
+            window_hours=settings.ingestion_window_hours,
+            rng=rng,
+        )
+
+    def interval(self, *, previous_seconds: Optional[int], published_in_window: int, outcome: str) -> int:
+        if outcome == POLL_ERROR:
+            seconds = (previous_seconds or self.min_interval_seconds) * ERROR_BACKOFF
+        else:
+            if published_in_window > 0:
+                seconds = self.window_hours * 3600 / published_in_window
+            else:
+                seconds = self.max_interval_seconds
+            if outcome != POLL_NEW and previous_seconds:
+                seconds = max(seconds, previous_seconds * QUIET_BACKOFF)
+        return int(min(self.max_interval_seconds, max(self.min_interval_seconds, seconds)))
+
+    def next_due(self, now_utc: datetime, interval_seconds: int) -> datetime:
+        spread = interval_seconds * self.jitter_ratio
+        return now_utc + timedelta(seconds=interval_seconds + self.rng.uniform(-spread, spread))
+
+    def first_due(self, now_utc: datetime) -> datetime:
+        """Spread sources with no usable due time across the first minimum interval."""
+        return now_utc + timedelta(seconds=self.rng.uniform(0, self.min_interval_seconds))
+
+    def record_polls(self, conn: sqlite3.Connection, outcomes: Mapping[str, str], *, now_utc: datetime) -> None:
+        """Reschedule every polled source; call in the transaction that wrote the run's articles."""
+        if not outcomes:
+            return
+        cutoff = now_utc - timedelta(hours=self.window_hours)
+        published = db.count_articles_published_since(conn, to_iso_utc(cutoff))
+        previous = {row["source_id"]: row["interval_seconds"] for row in db.list_source_schedule(conn)}
+        for source_id, outcome in outcomes.items():
+            interval = self.interval(
+                previous_seconds=previous.get(source_id),
+                published_in_window=published.get(source_id, 0),
+                outcome=outcome,
+            )
+            db.save_source_schedule(
+                conn,
+                source_id,
+                interval_seconds=interval,
+                next_due_at_utc=to_iso_utc(self.next_due(now_utc, interval)),
+                last_polled_at_utc=to_iso_utc(now_utc),
+                last_outcome=outcome,
+            )
+
+
+class AdaptivePollScheduler:
+    """Runs ingestion for whichever sources are due, as recorded in ``source_schedule``.
+
+    Due sources found in one check are fetched together as a single run; the ingestion
+    service reschedules them when it completes. Because due times live in the database,
+    a restart resumes the existing schedule rather than polling every source at once.
+    """
+
+    def __init__(
+        self,
+        *,
+        ingestion_service: "IngestionService",
+        policy: AdaptivePollPolicy,
+        tick_seconds: int,
+        clock: Callable[[], datetime] = utc_now,
+    ):
+        self.ingestion_service = ingestion_service
+        self.policy = policy
+        self.tick_seconds = max(1, tick_seconds)
+        self.clock = clock
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def source_ids(self) -> list[str]:
+        return [adapter.source.id for adapter in self.ingestion_service.adapters]
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+
+        self.stagger_overdue()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run_loop, name="adaptive-poll-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+
+    def stagger_overdue(self) -> None:
+        """Spread unscheduled sources, and those that fell due while the app was down, over
+        the next minimum interval so startup does not poll them all in one burst."""
+        now = self.clock()
+        with db.connection(self.ingestion_service.settings.db_path) as conn:
+            self._seed(conn, self.source_ids, now, include_overdue=True)
+
+    def tick(self) -> float:
+        """Run every due source in one ingestion run; returns seconds until the next check."""
+        now = self.clock()
+        settings = self.ingestion_service.settings
+        with db.connection(settings.db_path) as conn:
+            # Sources added to the registry since startup get a staggered first poll.
+            self._seed(conn, self.source_ids, now, include_overdue=False)
+            schedule = self._schedule(conn)
+
+        due = [source_id for source_id, next_due in schedule.items() if next_due <= now]
+        if due:
+            # Due-ness is read again under the lease: another worker may have just polled these.
+            accepted, _, message = self.ingestion_service.run_once(trigger="scheduler", select_sources=self._due_now)
+            if not accepted:
+                logger.info("scheduler_poll_skipped sources=%s reason=%s", len(due), message)
+                return float(self.tick_seconds)
+            with db.connection(settings.db_path, readonly=True) as conn:
+                schedule = self._schedule(conn)
+
+        if not schedule:
+            return float(self.tick_seconds)
+        wait = (min(schedule.values()) - self.clock()).total_seconds()
+        return min(float(self.tick_seconds), max(1.0, wait))
+
+    def _due_now(self) -> list[str]:
+        now = self.clock()
+        with db.connection(self.ingestion_service.settings.db_path, readonly=True) as conn:
+            return [source_id for source_id, next_due in self._schedule(conn).items() if next_due <= now]
+
+    def _schedule(self, conn: sqlite3.Connection) -> dict[str, datetime]:
+        known = set(self.source_ids)
+        return {
+            row["source_id"]: parse_datetime_to_utc(row["next_due_at_utc"])
+            for row in db.list_source_schedule(conn)
+            if row["source_id"] in known
+        }
+
+    def _seed(self, conn: sqlite3.Connection, source_ids: Iterable[str], now: datetime, *, include_overdue: bool) -> None:
+        rows = {row["source_id"]: row for row in db.list_source_schedule(conn)}
+        now_iso = to_iso_utc(now)
+        for source_id in source_ids:
+            row = rows.get(source_id)
+            if row is not None and (not include_overdue or row["next_due_at_utc"] > now_iso):
+                continue
+            db.save_source_schedule(
+                conn,
+                source_id,
+                interval_seconds=row["interval_seconds"] if row else self.policy.min_interval_seconds,
+                next_due_at_utc=to_iso_utc(self.policy.first_due(now)),
+            )
+
+    def _run_loop(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                wait_seconds = self.tick()
+            except Exception:  # pragma: no cover
+                logger.exception("scheduled_ingestion_failed")
+                wait_seconds = float(self.tick_seconds)
+            if self._stop_event.wait(timeout=wait_seconds):
+                break
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Optional
+
+from app.config import Settings
+from app.http_client import AsyncHttpClient, HttpValidators, NotModified
+from app.models import RawArticle, SourceHealth
+from app.source_adapters.base import NOT_MODIFIED_WARNING, BaseSourceAdapter, FetchResult, ListingCard
+from app.source_adapters.streaming import ArticleMetaParser, FeedItemReader
+from app.utils import to_iso_utc, utc_now
+
+
+class AsyncSourceAdapter:
+    """Coroutine-based driver for a :class:`BaseSourceAdapter`.
+
+    Network I/O goes through an :class:`AsyncHttpClient`; parsing is delegated to
+    the wrapped adapter, so feed-then-listing fallback, per-source selector
+    overrides and ``RawArticle`` output are identical to the threaded engine.
+    """
+
+    def __init__(self, adapter: BaseSourceAdapter, http: Optional[AsyncHttpClient] = None):
+        self.adapter = adapter
+        self.source = adapter.source
+        self.http = http
+
+    def use_http_client(self, http: AsyncHttpClient) -> None:
+        self.http = http
+
+    async def fetch(self, settings: Settings) -> FetchResult:
+        warnings: list[str] = []
+
+        if self.source.feed_url:
+            try:
+                feed_articles, validators = await self._fetch_from_feed(settings)
+                if feed_articles:
+                    return FetchResult(feed_articles, warnings, validators)
+            except NotModified:
+                warnings.append(f"{NOT_MODIFIED_WARNING}: feed")
+                return FetchResult([], warnings)
+            except Exception as exc:
+                warnings.append(f"feed_error: {exc}")
+
+        if self.source.scraper_enabled:
+            try:
+                scraped, validators = await self._fetch_from_listing(settings)
+                return FetchResult(scraped, warnings, validators if scraped else None)
+            except NotModified:
+                warnings.append(f"{NOT_MODIFIED_WARNING}: listing")
+            except Exception as exc:
+                warnings.append(f"scrape_error: {exc}")
+
+        return FetchResult([], warnings)
+
+    async def check_health(self, settings: Settings) -> SourceHealth:
+        checked_at = to_iso_utc(utc_now())
+        http = self._require_http()
+
+        feed_error = "feed not configured"
+        if self.source.feed_url:
+            try:
+                await http.probe(self.source.feed_url)
+                return self.adapter._health("ok", checked_at, "feed reachable")
+            except Exception as exc:
+                feed_error = str(exc)
+
+        try:
+            await http.probe(self.source.listing_url)
+        except Exception as exc:
+            return self.adapter._health(
+                "error", checked_at, f"feed/listing unavailable: feed={feed_error}; listing={exc}"
+            )
+        return self.adapter._health("ok", checked_at, "listing reachable (fallback)")
+
+    async def _fetch_from_feed(self, settings: Settings) -> tuple[list[RawArticle], HttpValidators]:
+        reader = FeedItemReader(settings.max_items_per_source)
+        articles: list[RawArticle] = []
+        validators = await self._require_http().stream_bytes(
+            self.source.feed_url,
+            self.adapter._feed_consumer(reader, articles, settings),
+            conditional=True,
+        )
+        return self.adapter._finish_feed(reader, articles, settings), validators
+
+    async def _fetch_from_listing(self, settings: Settings) -> tuple[list[RawArticle], HttpValidators]:
+        html, validators = await self._require_http().get_conditional(self.source.listing_url)
+        cards = self.adapter._parse_listing_cards(html, settings)
+        await self._enrich_cards(cards, settings)
+        return self.adapter._listing_articles(cards), validators
+
+    async def _enrich_cards(self, cards: list[ListingCard], settings: Settings) -> None:
+        pending = self.adapter._cards_needing_meta(cards, settings)
+        if not pending:
+            return
+
+        limit = asyncio.Semaphore(max(1, settings.article_meta_concurrency))
+
+        async def enrich(card: ListingCard) -> None:
+            async with limit:
+                card.apply_meta(await self._fetch_article_meta(card.url, settings))
+
+        tasks = [asyncio.create_task(enrich(card)) for card in pending]
+        done, unfinished = await asyncio.wait(tasks, timeout=settings.article_meta_deadline_seconds)
+        for task in unfinished:
+            task.cancel()
+        for task in done:
+            # A failed enrichment leaves the card as scraped, same as the threaded engine.
+            task.exception()
+
+    async def _fetch_article_meta(self, article_url: str, settings: Settings) -> dict:
+        parser = ArticleMetaParser()
+        try:
+            await self._require_http().stream_text(
+                article_url,
+                self.adapter._meta_consumer(parser),
+                max_bytes=settings.article_meta_max_bytes,
+            )
+        except Exception:
+            return {}
+        return parser.result()
+
+    def _require_http(self) -> AsyncHttpClient:
+        if self.http is None:
+            raise RuntimeError("AsyncSourceAdapter used without an AsyncHttpClient")
+        return self.http
@@ -1,104 +1,160 @@
 from __future__ import annotations
 
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Iterator, NamedTuple, Optional
 from urllib.parse import urljoin
 import xml.etree.ElementTree as ET
 
-import requests
-from bs4 import BeautifulSoup
-from requests.adapters import HTTPAdapter
-from urllib3.util import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 
 from app.config import Settings
+from app.http_client import HttpClient, HttpValidators, NotModified
 from app.models import RawArticle, SourceConfig, SourceHealth
+from app.source_adapters.parsing import (
+    DEFAULT_HTML_PARSER,
+    build_card_filter,
+    compile_selectors,
+    resolve_html_parser,
+)
+from app.source_adapters.streaming import ArticleMetaParser, FeedItemReader
 from app.utils import canonicalize_url, parse_datetime_to_utc, pick_first, strip_html, to_iso_utc, utc_now
 
+# Warning prefix for sources whose feed/listing answered 304; nothing to parse this run.
+NOT_MODIFIED_WARNING = "not_modified"
+# Warnings whose kind ends in this (feed_error, scrape_error) mean that fetch step raised.
+FETCH_ERROR_SUFFIX = "_error"
+
+
+class FetchResult(NamedTuple):
+    """What a source fetch returns.
+
+    ``validators`` belong to the feed or listing response the articles came from; the
+    ingestion service saves them with the articles, so the next run's conditional GET
+    only gets a 304 once this content is stored. They are None when nothing should be
+    replayed (no articles, a 304, or an error).
+    """
+
+    articles: list[RawArticle]
+    warnings: list[str]
+    validators: Optional[HttpValidators] = None
+
+
+@dataclass
+class ListingCard:
+    """A listing card extracted from HTML, before optional article-page enrichment."""
+
+    title: str
+    url: str
+    published_at_utc: Optional[datetime]
+    snippet: str
+    image_url: Optional[str]
+
+    def needs_meta(self) -> bool:
+        return self.published_at_utc is None or not self.snippet or not self.image_url
+
+    def apply_meta(self, meta: dict) -> None:
+        if self.published_at_utc is None:
+            self.published_at_utc = meta.get("published_at_utc")
+        if not self.snippet:
+            self.snippet = meta.get("snippet") or ""
+        if not self.image_url:
+            self.image_url = meta.get("image_url")
+
 
 class BaseSourceAdapter:
     def __init__(self, source_config: SourceConfig):
         self.source = source_config
+        self.http: Optional[HttpClient] = None
+        # Compiled here so a bad selector fails adapter construction (i.e. app startup), not a run.
+        self.selectors = compile_selectors(source_config)
+        self._card_filter = build_card_filter(source_config.article_selector)
+
+    def use_http_client(self, http: HttpClient) -> None:
+        self.http = http
 
-    def fetch(self, settings: Settings) -> tuple[list[RawArticle], list[str]]:
+    def fetch(self, settings: Settings) -> FetchResult:
         warnings: list[str] = []
 
-        feed_articles: list[RawArticle] = []
         if self.source.feed_url:
             try:
-                feed_articles = self._fetch_from_feed(settings)
+                feed_articles, validators = self._fetch_from_feed(settings)
+                if feed_articles:
+                    return FetchResult(feed_articles, warnings, validators)
+            except NotModified:
+                # Feed validators are only saved when that 200 produced articles, so a 304
+                # means the feed still has them and the listing fallback is not needed.
+                warnings.append(f"{NOT_MODIFIED_WARNING}: feed")
+                return FetchResult([], warnings)
             except Exception as exc:
                 warnings.append(f"feed_error: {exc}")
 
-        if feed_articles:
-            return feed_articles, warnings
-
         if self.source.scraper_enabled:
             try:
-                scraped = self._fetch_from_listing(settings)
-                return scraped, warnings
+                scraped, validators = self._fetch_from_listing(settings)
+                return FetchResult(scraped, warnings, validators if scraped else None)
+            except NotModified:
+                warnings.append(f"{NOT_MODIFIED_WARNING}: listing")
             except Exception as exc:
                 warnings.append(f"scrape_error: {exc}")
 
-        return [], warnings
+        return FetchResult([], warnings)
 
     def check_health(self, settings: Settings) -> SourceHealth:
+        """Probe the feed, then the listing page, without downloading either body."""
         checked_at = to_iso_utc(utc_now())
+        http = self._http_client(settings)
 
+        feed_error = "feed not configured"
         if self.source.feed_url:
             try:
-                text = self._request_text(self.source.feed_url, settings)
-                if text.strip():
-                    return SourceHealth(
-                        source_id=self.source.id,
-                        source_name=self.source.name,
-                        status="ok",
-                        checked_at_utc=checked_at,
-                        detail="feed reachable",
-                    )
+                http.probe(self.source.feed_url)
+                return self._health("ok", checked_at, "feed reachable")
             except Exception as exc:
                 feed_error = str(exc)
-            else:
-                feed_error = "empty feed response"
-        else:
-            feed_error = "feed not configured"
 
         try:
-            html = self._request_text(self.source.listing_url, settings)
-            if html.strip():
-                return SourceHealth(
-                    source_id=self.source.id,
-                    source_name=self.source.name,
-                    status="ok",
-                    checked_at_utc=checked_at,
-                    detail="listing reachable (fallback)",
-                )
+            http.probe(self.source.listing_url)
         except Exception as exc:
-            return SourceHealth(
-                source_id=self.source.id,
-                source_name=self.source.name,
-                status="error",
-                checked_at_utc=checked_at,
-                detail=f"feed/listing unavailable: feed={feed_error}; listing={exc}",
-            )
+            return self._health("error", checked_at, f"feed/listing unavailable: feed={feed_error}; listing={exc}")
+        return self._health("ok", checked_at, "listing reachable (fallback)")
 
+    def _health(self, status: str, checked_at: str, detail: str) -> SourceHealth:
         return SourceHealth(
             source_id=self.source.id,
             source_name=self.source.name,
-            status="error",
+            status=status,
             checked_at_utc=checked_at,
-            detail=f"feed/listing unavailable: feed={feed_error}; listing=empty",
+            detail=detail,
         )
 
-    def _fetch_from_feed(self, settings: Settings) -> list[RawArticle]:
-        if not self.source.feed_url:
-            return []
-        xml_text = self._request_text(self.source.feed_url, settings)
+    def _fetch_from_feed(self, settings: Settings) -> tuple[list[RawArticle], HttpValidators]:
+        reader = FeedItemReader(settings.max_items_per_source)
+        articles: list[RawArticle] = []
+        validators = self._http_client(settings).stream_bytes(
+            self.source.feed_url,
+            self._feed_consumer(reader, articles, settings),
+            conditional=True,
+        )
+        return self._finish_feed(reader, articles, settings), validators
 
-        root = ET.fromstring(xml_text)
-        items = self._extract_feed_items(root)
+    def _feed_consumer(self, reader: FeedItemReader, articles: list[RawArticle], settings: Settings):
+        html_parser = self._html_parser(settings)
 
-        articles: list[RawArticle] = []
-        for item in items[: settings.max_items_per_source]:
+        def consume(chunk: bytes) -> bool:
+            articles.extend(self._feed_articles(reader.feed(chunk), html_parser))
+            return reader.done
+
+        return consume
+
+    def _finish_feed(self, reader: FeedItemReader, articles: list[RawArticle], settings: Settings) -> list[RawArticle]:
+        articles.extend(self._feed_articles(reader.close(), self._html_parser(settings)))
+        return self._dedupe_by_url(articles)
+
+    def _feed_articles(self, items: Iterable[ET.Element], html_parser: str) -> Iterator[RawArticle]:
+        for item in items:
             title = self._item_title(item)
             link = self._item_link(item)
             if not title or not link:
@@ -106,33 +162,62 @@ class BaseSourceAdapter:
 
             published_raw = self._item_published(item)
             snippet_raw = self._item_snippet(item)
-            image_url = self._item_image(item)
+            image_url = self._item_image(item, html_parser=html_parser)
 
-            articles.append(
-                RawArticle(
-                    source_id=self.source.id,
-                    title=title,
-                    url=canonicalize_url(link, self.source.base_url),
-                    published_at_utc=parse_datetime_to_utc(published_raw),
-                    snippet=strip_html(snippet_raw or ""),
-                    image_url=canonicalize_url(image_url, self.source.base_url)
-                    if image_url
-                    else None,
-                )
+            yield RawArticle(
+                source_id=self.source.id,
+                title=title,
+                url=canonicalize_url(link, self.source.base_url),
+                published_at_utc=parse_datetime_to_utc(published_raw),
+                snippet=strip_html(snippet_raw or ""),
+                image_url=canonicalize_url(image_url, self.source.base_url)
+                if image_url
+                else None,
             )
 
-        return self._dedupe_by_url(articles)
+    def _fetch_from_listing(self, settings: Settings) -> tuple[list[RawArticle], HttpValidators]:
+        html, validators = self._http_client(settings).get_conditional(self.source.listing_url)
+        cards = self._parse_listing_cards(html, settings)
+        self._enrich_cards(cards, settings)
+        return self._listing_articles(cards), validators
+
+    def _enrich_cards(self, cards: list[ListingCard], settings: Settings) -> None:
+        pending = self._cards_needing_meta(cards, settings)
+        if not pending:
+            return
+
+        workers = max(1, min(settings.article_meta_concurrency, len(pending)))
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"meta-{self.source.id}")
+        # Threads cannot be cancelled: fetches still running at the deadline see this flag on
+        # their next chunk and close the connection, as the async engine's cancelled tasks do.
+        stop = threading.Event()
+        futures = {executor.submit(self._fetch_article_meta, card.url, settings, stop): card for card in pending}
+        try:
+            # Cards whose page is still loading at the deadline keep their listing values.
+            done, _ = wait(futures, timeout=settings.article_meta_deadline_seconds)
+            for future in done:
+                if future.exception() is None:
+                    futures[future].apply_meta(future.result())
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _cards_needing_meta(cards: list[ListingCard], settings: Settings) -> list[ListingCard]:
+        # Budget semantics: the first N cards (in listing order) that miss metadata.
+        budget = max(0, settings.article_meta_fetch_budget)
+        return [card for card in cards if card.needs_meta()][:budget]
 
-    def _fetch_from_listing(self, settings: Settings) -> list[RawArticle]:
-        html = self._request_text(self.source.listing_url, settings)
-        soup = BeautifulSoup(html, "html.parser")
+    def _parse_listing_cards(self, html: str, settings: Settings) -> list[ListingCard]:
+        if settings.max_items_per_source <= 0:
+            return []
+        soup = BeautifulSoup(html, self._html_parser(settings), parse_only=self._card_filter)
 
-        articles: list[RawArticle] = []
-        meta_fetch_budget = settings.article_meta_fetch_budget
+        selectors = self.selectors
 
-        cards = soup.select(self.source.article_selector)
-        for card in cards[: settings.max_items_per_source]:
-            link_node = card.select_one(self.source.link_selector)
+        cards: list[ListingCard] = []
+        for card in selectors.article.select(soup, limit=settings.max_items_per_source):
+            link_node = selectors.link.select_one(card)
             if not link_node:
                 continue
 
@@ -144,115 +229,86 @@ class BaseSourceAdapter:
             if not title:
                 continue
 
-            raw_url = canonicalize_url(urljoin(self.source.base_url, href))
-            time_node = card.select_one(self.source.time_selector)
+            time_node = selectors.time.select_one(card)
             time_raw = (
                 time_node.get("datetime")
                 if time_node and time_node.has_attr("datetime")
                 else (time_node.get_text(" ", strip=True) if time_node else None)
             )
-            published_at = parse_datetime_to_utc(time_raw)
-
-            snippet_node = card.select_one(self.source.snippet_selector)
-            snippet = snippet_node.get_text(" ", strip=True) if snippet_node else ""
-
-            image_node = card.select_one(self.source.image_selector)
-            image_url = image_node.get("src") if image_node else None
-
-            if (published_at is None or not snippet or not image_url) and meta_fetch_budget > 0:
-                meta_fetch_budget -= 1
-                meta = self._fetch_article_meta(raw_url, settings)
-                if published_at is None:
-                    published_at = meta.get("published_at_utc")
-                if not snippet:
-                    snippet = meta.get("snippet") or ""
-                if not image_url:
-                    image_url = meta.get("image_url")
-
-            articles.append(
-                RawArticle(
-                    source_id=self.source.id,
+
+            snippet_node = selectors.snippet.select_one(card)
+            image_node = selectors.image.select_one(card)
+
+            cards.append(
+                ListingCard(
                     title=title,
-                    url=raw_url,
-                    published_at_utc=published_at,
-                    snippet=strip_html(snippet),
-                    image_url=canonicalize_url(image_url, self.source.base_url)
-                    if image_url
-                    else None,
+                    url=canonicalize_url(urljoin(self.source.base_url, href)),
+                    published_at_utc=parse_datetime_to_utc(time_raw),
+                    snippet=snippet_node.get_text(" ", strip=True) if snippet_node else "",
+                    image_url=image_node.get("src") if image_node else None,
                 )
             )
 
+        return cards
+
+    def _listing_articles(self, cards: list[ListingCard]) -> list[RawArticle]:
+        articles = [
+            RawArticle(
+                source_id=self.source.id,
+                title=card.title,
+                url=card.url,
+                published_at_utc=card.published_at_utc,
+                snippet=strip_html(card.snippet),
+                image_url=canonicalize_url(card.image_url, self.source.base_url)
+                if card.image_url
+                else None,
+            )
+            for card in cards
+        ]
         return self._dedupe_by_url(articles)
 
-    def _fetch_article_meta(self, article_url: str, settings: Settings) -> dict:
+    def _fetch_article_meta(
+        self, article_url: str, settings: Settings, stop: Optional[threading.Event] = None
+    ) -> dict:
+        if stop is not None and stop.is_set():
+            return {}
+        parser = ArticleMetaParser()
         try:
-            html = self._request_text(article_url, settings)
+            self._http_client(settings).stream_text(
+                article_url,
+                self._meta_consumer(parser, stop),
+                max_bytes=settings.article_meta_max_bytes,
+            )
         except Exception:
             return {}
+        return parser.result()
 
-        soup = BeautifulSoup(html, "html.parser")
-
-        published_raw = None
-        for selector in (
-            "meta[property='article:published_time']",
-            "meta[name='pubdate']",
-            "meta[name='publish-date']",
-            "time[datetime]",
-        ):
-            node = soup.select_one(selector)
-            if not node:
-                continue
-            if node.name == "time":
-                published_raw = node.get("datetime") or node.get_text(" ", strip=True)
-            else:
-                published_raw = node.get("content")
-            if published_raw:
-                break
-
-        snippet = ""
-        snippet_node = soup.select_one("meta[name='description']")
-        if snippet_node and snippet_node.get("content"):
-            snippet = snippet_node.get("content", "")
-        elif soup.select_one("p"):
-            snippet = soup.select_one("p").get_text(" ", strip=True)
-
-        image_url = None
-        image_node = soup.select_one("meta[property='og:image']")
-        if image_node and image_node.get("content"):
-            image_url = image_node.get("content")
-
-        return {
-            "published_at_utc": parse_datetime_to_utc(published_raw),
-            "snippet": strip_html(snippet),
-            "image_url": image_url,
-        }
-
-    def _request_text(self, url: str, settings: Settings) -> str:
-        session = self._build_session(settings)
-        response = session.get(
-            url,
-            headers={"User-Agent": settings.user_agent},
-            timeout=settings.request_timeout_seconds,
-        )
-        response.raise_for_status()
-        return response.text
+    @staticmethod
+    def _meta_consumer(parser: ArticleMetaParser, stop: Optional[threading.Event] = None):
+        def consume(chunk: str) -> bool:
+            if stop is not None and stop.is_set():
+                return True
+            parser.feed(chunk)
+            return parser.done
+
+        return consume
 
     @staticmethod
-    def _build_session(settings: Settings) -> requests.Session:
-        retries = Retry(
-            total=settings.request_retries,
-            connect=settings.request_retries,
-            read=settings.request_retries,
-            status=settings.request_retries,
-            backoff_factor=0.4,
-            status_forcelist=(429, 500, 502, 503, 504),
-            allowed_methods=("GET", "HEAD"),
-        )
-        adapter = HTTPAdapter(max_retries=retries)
-        session = requests.Session()
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        return session
+    def _parse_article_meta(html: str) -> dict:
+        parser = ArticleMetaParser()
+        parser.feed(html)
+        parser.close()
+        return parser.result()
+
+    def _html_parser(self, settings: Settings) -> str:
+        return resolve_html_parser(self.source.html_parser or settings.html_parser)
+
+    def _http_client(self, settings: Settings) -> HttpClient:
+        # Standalone callers (tools, tests) get a private client on first use;
+        # the API and ingestion service inject one shared client for all adapters.
+        if self.http is None:
+            self.http = HttpClient(settings)
+        return self.http
 
     @staticmethod
     def _dedupe_by_url(articles: list[RawArticle]) -> list[RawArticle]:
@@ -261,13 +317,6 @@ class BaseSourceAdapter:
             deduped[article.url] = article
         return list(deduped.values())
 
-    @staticmethod
-    def _extract_feed_items(root: ET.Element) -> list[ET.Element]:
-        channel = root.find("channel")
-        if channel is not None:
-            return channel.findall("item")
-        return [node for node in root.iter() if BaseSourceAdapter._local_name(node.tag) == "entry"]
-
     @staticmethod
     def _local_name(tag: str) -> str:
         if "}" in tag:
@@ -301,7 +350,7 @@ class BaseSourceAdapter:
     def _item_snippet(self, item: ET.Element) -> Optional[str]:
         return self._direct_text(item, {"description", "summary", "content", "content:encoded"})
 
-    def _item_image(self, item: ET.Element) -> Optional[str]:
+    def _item_image(self, item: ET.Element, *, html_parser: str = DEFAULT_HTML_PARSER) -> Optional[str]:
         for child in item.iter():
             name = self._local_name(child.tag)
             if name in {"content", "thumbnail", "enclosure"}:
@@ -311,8 +360,8 @@ class BaseSourceAdapter:
 
         snippet = self._item_snippet(item)
         if snippet:
-            soup = BeautifulSoup(snippet, "html.parser")
-            img = soup.select_one("img")
+            soup = BeautifulSoup(snippet, html_parser, parse_only=SoupStrainer("img"))
+            img = soup.find("img")
             if img and img.get("src"):
                 return img.get("src")
 
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+import soupsieve
+from bs4.builder import builder_registry
+
+from app.models import SourceConfig
+
+try:
+    from bs4.filter import ElementFilter
+except Exception:  # pragma: no cover - beautifulsoup4 < 4.13
+    ElementFilter = None
+
+DEFAULT_HTML_PARSER = "html.parser"
+logger = logging.getLogger(__name__)
+
+# `tag`, `.class` or `tag.class` - the selector shapes a parse-time filter can evaluate
+# from a start tag alone, without knowing the element's ancestors or siblings.
+_SIMPLE_SELECTOR_RE = re.compile(r"^(?P<tag>[a-zA-Z][\w-]*)?(?:\.(?P<cls>[\w-]+))?$")
+
+
+@dataclass(frozen=True)
+class CompiledSelectors:
+    """A source's listing selectors, compiled once and matched against every card."""
+
+    article: soupsieve.SoupSieve
+    link: soupsieve.SoupSieve
+    time: soupsieve.SoupSieve
+    snippet: soupsieve.SoupSieve
+    image: soupsieve.SoupSieve
+
+
+class InvalidSelector(ValueError):
+    def __init__(self, source_id: str, field_name: str, selector: str, reason: str):
+        super().__init__(f"invalid {field_name} for source {source_id}: {selector!r} ({reason})")
+        self.source_id = source_id
+        self.field_name = field_name
+        self.selector = selector
+
+
+def compile_selectors(source: SourceConfig) -> CompiledSelectors:
+    """Compile every ``*_selector`` of ``source``; raises :class:`InvalidSelector` on bad syntax."""
+    compiled = {}
+    for name in ("article", "link", "time", "snippet", "image"):
+        field_name = f"{name}_selector"
+        selector = getattr(source, field_name)
+        try:
+            compiled[name] = soupsieve.compile(selector)
+        except soupsieve.SelectorSyntaxError as exc:
+            raise InvalidSelector(source.id, field_name, selector, str(exc).splitlines()[0]) from exc
+    return CompiledSelectors(**compiled)
+
+
+@lru_cache(maxsize=None)
+def resolve_html_parser(name: Optional[str]) -> str:
+    """Map a configured backend name to an installed BeautifulSoup tree builder."""
+    candidate = (name or DEFAULT_HTML_PARSER).strip()
+    if builder_registry.lookup(candidate) is not None:
+        return candidate
+    logger.warning("html_parser_unavailable requested=%s fallback=%s", candidate, DEFAULT_HTML_PARSER)
+    return DEFAULT_HTML_PARSER
+
+
+def build_card_filter(selector: str):
+    """Parse-time filter keeping only subtrees that match ``selector``.
+
+    Returns None (build the full tree) when the selector uses anything beyond
+    comma-separated ``tag`` / ``.class`` / ``tag.class`` parts, or when the
+    installed BeautifulSoup cannot filter at parse time.
+    """
+    if ElementFilter is None:
+        return None
+
+    rules: list[tuple[Optional[str], Optional[str]]] = []
+    for part in selector.split(","):
+        match = _SIMPLE_SELECTOR_RE.match(part.strip())
+        if not match or not (match.group("tag") or match.group("cls")):
+            return None
+        tag = match.group("tag")
+        rules.append((tag.lower() if tag else None, match.group("cls")))
+
+    return _CardFilter(rules)
+
+
+if ElementFilter is not None:
+
+    class _CardFilter(ElementFilter):
+        def __init__(self, rules: list[tuple[Optional[str], Optional[str]]]):
+            super().__init__()
+            self.rules = rules
+
+        def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+            raw_classes = (attrs or {}).get("class") or ""
+            classes = raw_classes if isinstance(raw_classes, list) else raw_classes.split()
+            for tag, cls in self.rules:
+                if (tag is None or tag == name.lower()) and (cls is None or cls in classes):
+                    return True
+            return False
+
+        def allow_string_creation(self, string: str) -> bool:
+            # Strings inside kept cards are created with their card; stray page text is not needed.
+            return False
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+from html.parser import HTMLParser
+from typing import Iterator, Optional
+
+from app.utils import parse_datetime_to_utc, strip_html
+
+PUBLISHED_META_KEYS = (
+    ("property", "article:published_time"),
+    ("name", "pubdate"),
+    ("name", "publish-date"),
+)
+DESCRIPTION_META_KEY = ("name", "description")
+IMAGE_META_KEY = ("property", "og:image")
+TRACKED_META_KEYS = {*PUBLISHED_META_KEYS, DESCRIPTION_META_KEY, IMAGE_META_KEY}
+
+
+class ArticleMetaParser(HTMLParser):
+    """Incremental article-page meta extractor.
+
+    Fed chunk by chunk as the page downloads, it reads the published date,
+    description and ``og:image`` from ``<head>`` and sets ``done`` as soon as the
+    rest of the page cannot change the result: at ``</head>`` when the head had
+    everything, otherwise after the first ``<p>`` / ``<time datetime>`` in the
+    body. Results match the first-match selector semantics of the old full-tree
+    extraction.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.done = False
+        self._metas: dict[tuple[str, str], str] = {}
+        self._head_closed = False
+        self._time_value: Optional[str] = None
+        self._time_text: Optional[list[str]] = None
+        self._paragraph: Optional[str] = None
+        self._paragraph_text: Optional[list[str]] = None
+        # Text between two tags may arrive split across chunks; it is joined before use.
+        self._pending_text: list[str] = []
+
+    def feed(self, data: str) -> None:
+        if not self.done:
+            super().feed(data)
+
+    def result(self) -> dict:
+        self._flush_text()
+        published_raw = None
+        for key in PUBLISHED_META_KEYS:
+            if key in self._metas:
+                published_raw = self._metas[key]
+                if published_raw:
+                    break
+        if not published_raw:
+            published_raw = self._time_value
+
+        snippet = self._metas.get(DESCRIPTION_META_KEY) or self._paragraph or ""
+        if not snippet and self._paragraph_text is not None:
+            snippet = " ".join(self._paragraph_text)
+
+        return {
+            "published_at_utc": parse_datetime_to_utc(published_raw),
+            "snippet": strip_html(snippet),
+            "image_url": self._metas.get(IMAGE_META_KEY) or None,
+        }
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        self._flush_text()
+        if tag == "meta":
+            self._handle_meta(dict(attrs))
+        elif tag == "body":
+            self._close_head()
+        elif tag == "time" and self._time_value is None and self._time_text is None:
+            attributes = dict(attrs)
+            if "datetime" in attributes:
+                if attributes["datetime"]:
+                    self._time_value = attributes["datetime"]
+                else:
+                    self._time_text = []
+        elif tag == "p":
+            # Paragraphs only live in <body>, even when the page omits the tags.
+            self._close_head()
+            if self._paragraph_text is not None:
+                self._finish_paragraph()
+            elif self._paragraph is None:
+                self._paragraph_text = []
+        self._update_done()
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        self._flush_text()
+        if tag == "meta":
+            self._handle_meta(dict(attrs))
+            self._update_done()
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush_text()
+        if tag == "head":
+            self._close_head()
+        elif tag == "time" and self._time_text is not None:
+            self._time_value = " ".join(self._time_text)
+            self._time_text = None
+        elif tag == "p" and self._paragraph_text is not None:
+            self._finish_paragraph()
+        self._update_done()
+
+    def handle_data(self, data: str) -> None:
+        if self._paragraph_text is not None or self._time_text is not None:
+            self._pending_text.append(data)
+
+    def _flush_text(self) -> None:
+        text = "".join(self._pending_text).strip()
+        self._pending_text.clear()
+        if not text:
+            return
+        if self._paragraph_text is not None:
+            self._paragraph_text.append(text)
+        if self._time_text is not None:
+            self._time_text.append(text)
+
+    def _handle_meta(self, attributes: dict[str, Optional[str]]) -> None:
+        for attribute in ("property", "name"):
+            key = (attribute, attributes.get(attribute) or "")
+            if key in TRACKED_META_KEYS and key not in self._metas:
+                self._metas[key] = attributes.get("content") or ""
+
+    def _close_head(self) -> None:
+        self._head_closed = True
+
+    def _finish_paragraph(self) -> None:
+        self._paragraph = " ".join(self._paragraph_text or [])
+        self._paragraph_text = None
+
+    def _update_done(self) -> None:
+        if not self._head_closed:
+            return
+        has_published = any(self._metas.get(key) for key in PUBLISHED_META_KEYS) or self._time_value is not None
+        has_snippet = bool(self._metas.get(DESCRIPTION_META_KEY)) or self._paragraph is not None
+        self.done = has_published and has_snippet
+
+
+def _local_name(tag: str) -> str:
+    return tag.split("}", 1)[1] if "}" in tag else tag
+
+
+class FeedItemReader:
+    """Incremental RSS/Atom reader that yields ``<item>``/``<entry>`` elements as they close.
+
+    Same item selection as the old whole-document parse: RSS ``channel/item``
+    children when the root has a ``channel``, otherwise every Atom ``entry``.
+    Each yielded element is cleared and detached once the caller moves on, and
+    ``done`` is set after ``max_items`` so the download can stop early.
+    """
+
+    def __init__(self, max_items: int):
+        self.max_items = max_items
+        self.done = max_items <= 0
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._stack: list[ET.Element] = []
+        self._channel: Optional[ET.Element] = None
+        self._yielded = 0
+
+    def feed(self, chunk: bytes) -> Iterator[ET.Element]:
+        if self.done:
+            return
+        self._parser.feed(chunk)
+        yield from self._drain()
+
+    def close(self) -> Iterator[ET.Element]:
+        if self.done:
+            return
+        self._parser.close()
+        yield from self._drain()
+
+    def _drain(self) -> Iterator[ET.Element]:
+        for event, element in self._parser.read_events():
+            if event == "start":
+                if len(self._stack) == 1 and self._channel is None and element.tag == "channel":
+                    self._channel = element
+                self._stack.append(element)
+                continue
+
+            self._stack.pop()
+            parent = self._stack[-1] if self._stack else None
+            if not self._is_item(element, parent):
+                continue
+
+            yield element
+            self._yielded += 1
+            element.clear()
+            if parent is not None:
+                parent.remove(element)
+            if self._yielded >= self.max_items:
+                self.done = True
+                return
+
+    def _is_item(self, element: ET.Element, parent: Optional[ET.Element]) -> bool:
+        if self._channel is not None:
+            return element.tag == "item" and parent is self._channel
+        return _local_name(element.tag) == "entry"
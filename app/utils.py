@@ -3,6 +3,8 @@ from __future__ import annotations
 import hashlib
 import re
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from html import unescape
 from typing import Iterable, Optional
 from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
@@ -21,6 +23,21 @@ TRACKING_PARAM_PREFIXES = (
     "mkt_tok",
 )
 
+# Feed items in one run share a handful of timestamps; cache parsed results by raw string.
+DATETIME_CACHE_SIZE = 4096
+
+# Article and image URLs repeat across runs (feeds re-list the same items for days).
+URL_CACHE_SIZE = 8192
+
+# Shapes the stdlib parses exactly like dateutil does. Anything else (named zones such as
+# "EST", two-digit years, free text) goes to dateutil so results never change.
+_ISO_DATETIME_RE = re.compile(
+    r"^\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?(?:Z|[+-]\d{2}:?\d{2})?)?$"
+)
+_RFC2822_DATETIME_RE = re.compile(
+    r"^(?:[A-Za-z]{3},\s*)?\d{1,2}\s+[A-Za-z]{3}\s+\d{4}\s+\d{2}:\d{2}(?::\d{2})?\s+(?:[+-]\d{4}|GMT|UTC|Z)$"
+)
+
 
 def utc_now() -> datetime:
     return datetime.now(timezone.utc)
@@ -36,13 +53,36 @@ def parse_datetime_to_utc(raw: Optional[str]) -> Optional[datetime]:
     value = raw.strip()
     if not value:
         return None
+    return _parse_datetime_cached(value)
+
+
+@lru_cache(maxsize=DATETIME_CACHE_SIZE)
+def _parse_datetime_cached(value: str) -> Optional[datetime]:
+    dt = _parse_datetime_fast(value)
+    if dt is None:
+        dt = _parse_datetime_slow(value)
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def _parse_datetime_fast(value: str) -> Optional[datetime]:
+    try:
+        if _ISO_DATETIME_RE.match(value):
+            return datetime.fromisoformat(value)
+        if _RFC2822_DATETIME_RE.match(value):
+            return parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        pass
+    return None
+
 
+def _parse_datetime_slow(value: str) -> Optional[datetime]:
     if date_parser is not None:
         try:
-            dt = date_parser.parse(value)
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt.astimezone(timezone.utc)
+            return date_parser.parse(value)
         except Exception:
             return None
 
@@ -50,14 +90,12 @@ def parse_datetime_to_utc(raw: Optional[str]) -> Optional[datetime]:
     try:
         if value.endswith("Z"):
             value = value[:-1] + "+00:00"
-        dt = datetime.fromisoformat(value)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt.astimezone(timezone.utc)
+        return datetime.fromisoformat(value)
     except Exception:
         return None
 
 
+@lru_cache(maxsize=URL_CACHE_SIZE)
 def canonicalize_url(url: str, base_url: Optional[str] = None) -> str:
     absolute = urljoin(base_url, url) if base_url else url
     parsed = urlparse(absolute)
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import os
+import random
+import tempfile
+import unittest
+from dataclasses import replace
+from datetime import timedelta
+from unittest.mock import patch
+
+from app import db
+from app.config import load_settings
+from app.models import RawArticle, SourceConfig
+from app.services.ingestion import IngestionService
+from app.services.scheduler import (
+    POLL_ERROR,
+    POLL_NEW,
+    POLL_NOT_MODIFIED,
+    POLL_UNCHANGED,
+    AdaptivePollPolicy,
+    AdaptivePollScheduler,
+)
+from app.utils import parse_datetime_to_utc, to_iso_utc, utc_now
+
+
+def _policy(jitter_ratio: float = 0.0, seed: int = 7) -> AdaptivePollPolicy:
+    return AdaptivePollPolicy(
+        min_interval_seconds=900,
+        max_interval_seconds=86400,
+        jitter_ratio=jitter_ratio,
+        window_hours=24,
+        rng=random.Random(seed),
+    )
+
+
+class CountingAdapter:
+    """Publishes ``published`` articles spread over the last few hours; records each fetch."""
+
+    def __init__(self, source_id: str, *, published: int = 0, warnings=()):
+        self.source = SourceConfig(
+            id=source_id,
+            name=source_id,
+            base_url="https://example.com",
+            feed_url=None,
+            listing_url="https://example.com/news",
+        )
+        self.published = published
+        self.warnings = list(warnings)
+        self.fetches = 0
+
+    def use_http_client(self, http) -> None:
+        self.http = http
+
+    def fetch(self, settings):
+        self.fetches += 1
+        now = utc_now()
+        articles = [
+            RawArticle(
+                source_id=self.source.id,
+                title=f"{self.source.id} story {index}",
+                url=f"https://example.com/{self.source.id}/{index}",
+                published_at_utc=now - timedelta(minutes=30 * (index + 1)),
+            )
+            for index in range(self.published)
+        ]
+        return articles, list(self.warnings)
+
+
+class AdaptivePollPolicyTestCase(unittest.TestCase):
+    def test_interval_follows_publish_rate_and_backs_off_when_quiet(self) -> None:
+        policy = _policy()
+
+        # 12 stories in 24h: poll about every two hours.
+        self.assertEqual(policy.interval(previous_seconds=None, published_in_window=12, outcome=POLL_NEW), 7200)
+        # Busier than the floor allows, or silent for the whole window: clamped.
+        self.assertEqual(policy.interval(previous_seconds=None, published_in_window=500, outcome=POLL_NEW), 900)
+        self.assertEqual(policy.interval(previous_seconds=900, published_in_window=0, outcome=POLL_UNCHANGED), 86400)
+
+        # Nothing new (or a 304) stretches the previous interval; new stories snap back to the rate.
+        self.assertEqual(policy.interval(previous_seconds=7200, published_in_window=12, outcome=POLL_UNCHANGED), 10800)
+        self.assertEqual(policy.interval(previous_seconds=10800, published_in_window=12, outcome=POLL_NOT_MODIFIED), 16200)
+        self.assertEqual(policy.interval(previous_seconds=16200, published_in_window=12, outcome=POLL_NEW), 7200)
+
+        self.assertEqual(policy.interval(previous_seconds=7200, published_in_window=12, outcome=POLL_ERROR), 14400)
+        self.assertEqual(policy.interval(previous_seconds=60000, published_in_window=12, outcome=POLL_ERROR), 86400)
+
+    def test_due_times_are_jittered_within_bounds(self) -> None:
+        policy = _policy(jitter_ratio=0.1)
+        now = utc_now()
+
+        offsets = [(policy.next_due(now, 3600) - now).total_seconds() for _ in range(200)]
+        self.assertTrue(all(3240 <= offset <= 3960 for offset in offsets))
+        self.assertGreater(len({round(offset) for offset in offsets}), 100)
+
+        first = [(policy.first_due(now) - now).total_seconds() for _ in range(200)]
+        self.assertTrue(all(0 <= offset <= 900 for offset in first))
+
+
+class AdaptivePollSchedulerTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        with patch.dict(os.environ, {"DB_PATH": f"{self._tmp.name}/test.db"}, clear=True):
+            self.settings = replace(load_settings(env_path=".env.missing"), poll_jitter_ratio=0.0)
+        self.adapters = [
+            CountingAdapter("busy", published=12),
+            CountingAdapter("quiet", warnings=["not_modified: feed"]),
+            CountingAdapter("down", warnings=["feed_error: 503 Service Unavailable", "scrape_error: timed out"]),
+        ]
+        db.bootstrap_database(
+            db_path=self.settings.db_path,
+            sources=[adapter.source for adapter in self.adapters],
+            now_iso_utc=to_iso_utc(utc_now()),
+        )
+        self.policy = _policy()
+        self.service = IngestionService(settings=self.settings, adapters=self.adapters, poll_policy=self.policy)
+
+    def tearDown(self) -> None:
+        self.service.shutdown()
+        db.close_pools()
+        self._tmp.cleanup()
+
+    def _scheduler(self) -> AdaptivePollScheduler:
+        return AdaptivePollScheduler(ingestion_service=self.service, policy=self.policy, tick_seconds=60)
+
+    def _schedule(self) -> dict:
+        with db.connection(self.settings.db_path, readonly=True) as conn:
+            return {row["source_id"]: dict(row) for row in db.list_source_schedule(conn)}
+
+    def _make_due(self, source_id: str) -> None:
+        with db.connection(self.settings.db_path) as conn:
+            row = self._schedule()[source_id]
+            db.save_source_schedule(
+                conn,
+                source_id,
+                interval_seconds=row["interval_seconds"],
+                next_due_at_utc=to_iso_utc(utc_now() - timedelta(seconds=1)),
+            )
+
+    def test_startup_staggers_first_polls_instead_of_running_everything(self) -> None:
+        scheduler = self._scheduler()
+        before = utc_now().replace(microsecond=0)
+        scheduler.stagger_overdue()
+
+        schedule = self._schedule()
+        self.assertEqual(set(schedule), {"busy", "quiet", "down"})
+        for row in schedule.values():
+            due = parse_datetime_to_utc(row["next_due_at_utc"])
+            self.assertTrue(before <= due <= before + timedelta(seconds=901))
+            self.assertEqual(row["interval_seconds"], 900)
+
+        wait = scheduler.tick()
+        self.assertTrue(1.0 <= wait <= 60.0)
+        self.assertEqual([adapter.fetches for adapter in self.adapters], [0, 0, 0])
+
+    def test_tick_polls_only_due_sources_and_reschedules_them(self) -> None:
+        scheduler = self._scheduler()
+        scheduler.stagger_overdue()
+        quiet_due = self._schedule()["quiet"]["next_due_at_utc"]
+
+        self._make_due("busy")
+        scheduler.tick()
+
+        self.assertEqual([adapter.fetches for adapter in self.adapters], [1, 0, 0])
+        run = self.service.latest_status()["last_run"]
+        self.assertEqual((run["status"], run["sources_total"], run["new_count"]), ("success", 1, 12))
+        self.assertEqual(run["notes"]["polled"], {"busy": POLL_NEW})
+
+        schedule = self._schedule()
+        busy = schedule["busy"]
+        self.assertEqual((busy["interval_seconds"], busy["last_outcome"]), (7200, POLL_NEW))
+        polled_at = parse_datetime_to_utc(busy["last_polled_at_utc"])
+        self.assertEqual(parse_datetime_to_utc(busy["next_due_at_utc"]) - polled_at, timedelta(seconds=7200))
+        self.assertEqual(schedule["quiet"]["next_due_at_utc"], quiet_due)
+        self.assertIsNone(schedule["quiet"]["last_outcome"])
+
+        # A restart keeps the persisted due times rather than re-polling.
+        self._scheduler().stagger_overdue()
+        self.assertEqual(self._schedule()["busy"]["next_due_at_utc"], busy["next_due_at_utc"])
+
+    def test_due_sources_are_read_again_once_the_lease_is_held(self) -> None:
+        scheduler = self._scheduler()
+        scheduler.stagger_overdue()
+        self._make_due("busy")
+        acquire = self.service.lease.acquire
+
+        def acquire_after_another_worker_polled():
+            # Between this tick's check and the lease, another worker polled "busy".
+            with db.connection(self.settings.db_path) as conn:
+                db.save_source_schedule(
+                    conn, "busy", interval_seconds=900, next_due_at_utc=to_iso_utc(utc_now() + timedelta(seconds=900))
+                )
+            return acquire()
+
+        with patch.object(self.service.lease, "acquire", side_effect=acquire_after_another_worker_polled):
+            scheduler.tick()
+
+        self.assertEqual([adapter.fetches for adapter in self.adapters], [0, 0, 0])
+        self.assertIsNone(self.service.latest_status()["last_run"])
+        self.assertIsNone(self.service.lease.holder())
+
+    def test_not_modified_source_backs_off_to_the_maximum(self) -> None:
+        scheduler = self._scheduler()
+        scheduler.stagger_overdue()
+
+        self._make_due("quiet")
+        scheduler.tick()
+
+        quiet = self._schedule()["quiet"]
+        self.assertEqual((quiet["interval_seconds"], quiet["last_outcome"]), (86400, POLL_NOT_MODIFIED))
+        self.assertEqual([adapter.fetches for adapter in self.adapters], [0, 1, 0])
+
+    def test_source_whose_feed_and_listing_fail_backs_off_as_an_error(self) -> None:
+        scheduler = self._scheduler()
+        scheduler.stagger_overdue()
+
+        for expected in (1800, 3600):
+            self._make_due("down")
+            scheduler.tick()
+            down = self._schedule()["down"]
+            self.assertEqual((down["interval_seconds"], down["last_outcome"]), (expected, POLL_ERROR))
+
+        run = self.service.latest_status()["last_run"]
+        self.assertEqual(run["notes"]["polled"], {"down": POLL_ERROR})
+        self.assertEqual([adapter.fetches for adapter in self.adapters], [0, 0, 2])
+
+    def test_manual_run_reschedules_every_source(self) -> None:
+        accepted, run, _ = self.service.run_once(trigger="manual")
+
+        self.assertTrue(accepted)
+        self.assertEqual(run["notes"]["polled"], {"busy": POLL_NEW, "quiet": POLL_NOT_MODIFIED, "down": POLL_ERROR})
+        self.assertEqual(
+            {k: v["interval_seconds"] for k, v in self._schedule().items()},
+            {"busy": 7200, "quiet": 86400, "down": 1800},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
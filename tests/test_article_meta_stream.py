@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import unittest
+
+from bs4 import BeautifulSoup
+
+from app.source_adapters.streaming import ArticleMetaParser
+from app.utils import parse_datetime_to_utc, strip_html
+
+PAGES = {
+    "full_head": """<html><head>
+<meta property="article:published_time" content="2026-02-21T10:00:00Z">
+<meta name="description" content="A &amp; B description">
+<meta property="og:image" content="https://example.com/cover.jpg">
+</head><body><time datetime="2020-01-01">old</time><p>Body text</p></body></html>""",
+    "body_fallbacks": """<html><head><title>T</title><meta name="pubdate" content=""></head>
+<body><div><time datetime="">Feb 21, 2026</time></div>
+<p>First <strong>para</strong> graph</p><p>Second</p></body></html>""",
+    "no_head_tags": """<meta name="publish-date" content="2026-02-20T08:00:00+02:00">
+<p>Only paragraph</p>""",
+    "nothing": "<html><head></head><body><div>No paragraphs</div></body></html>",
+}
+
+
+def bs4_reference(html: str) -> dict:
+    """Full-tree extraction the streaming parser replaced."""
+    soup = BeautifulSoup(html, "html.parser")
+    published_raw = None
+    for selector in (
+        "meta[property='article:published_time']",
+        "meta[name='pubdate']",
+        "meta[name='publish-date']",
+        "time[datetime]",
+    ):
+        node = soup.select_one(selector)
+        if not node:
+            continue
+        if node.name == "time":
+            published_raw = node.get("datetime") or node.get_text(" ", strip=True)
+        else:
+            published_raw = node.get("content")
+        if published_raw:
+            break
+
+    snippet = ""
+    snippet_node = soup.select_one("meta[name='description']")
+    if snippet_node and snippet_node.get("content"):
+        snippet = snippet_node.get("content", "")
+    elif soup.select_one("p"):
+        snippet = soup.select_one("p").get_text(" ", strip=True)
+
+    image_node = soup.select_one("meta[property='og:image']")
+    return {
+        "published_at_utc": parse_datetime_to_utc(published_raw),
+        "snippet": strip_html(snippet),
+        "image_url": image_node.get("content") if image_node and image_node.get("content") else None,
+    }
+
+
+def stream(html: str, chunk_size: int = 7) -> tuple[dict, int]:
+    parser = ArticleMetaParser()
+    consumed = 0
+    for start in range(0, len(html), chunk_size):
+        parser.feed(html[start : start + chunk_size])
+        consumed = start + chunk_size
+        if parser.done:
+            break
+    parser.close()
+    return parser.result(), consumed
+
+
+class ArticleMetaParserTestCase(unittest.TestCase):
+    def test_matches_full_tree_extraction(self) -> None:
+        for name, html in PAGES.items():
+            with self.subTest(page=name):
+                result, _ = stream(html)
+                self.assertEqual(result, bs4_reference(html))
+
+    def test_stops_at_end_of_head_when_head_is_complete(self) -> None:
+        html = PAGES["full_head"] + "<p>filler</p>" * 10_000
+        _, consumed = stream(html, chunk_size=64)
+        self.assertLess(consumed, html.index("<body>") + 64)
+
+    def test_stops_after_first_paragraph_when_snippet_is_needed(self) -> None:
+        html = PAGES["body_fallbacks"] + "<p>filler</p>" * 10_000
+        _, consumed = stream(html, chunk_size=64)
+        self.assertLess(consumed, html.index("<p>Second") + 64)
+
+
+if __name__ == "__main__":
+    unittest.main()
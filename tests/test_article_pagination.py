@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from datetime import timedelta
+
+from fastapi import HTTPException
+
+from app import db
+from app.api.routes_articles import decode_cursor, encode_cursor
+from app.models import NormalizedArticle, SourceConfig
+from app.utils import article_id_from_canonical, to_iso_utc, utc_now
+
+
+class ArticlePaginationTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = f"{self._tmp.name}/test.db"
+        self.now = utc_now()
+        source = SourceConfig(
+            id="test_source",
+            name="Test Source",
+            base_url="https://example.com",
+            feed_url=None,
+            listing_url="https://example.com/news",
+        )
+        db.bootstrap_database(db_path=self.db_path, sources=[source], now_iso_utc=to_iso_utc(self.now))
+
+        articles = []
+        for n in range(25):
+            canonical = f"https://example.com/story-{n}"
+            # Pairs share a publish time so the id tie-breaker is exercised.
+            published = to_iso_utc(self.now - timedelta(minutes=n // 2))
+            articles.append(
+                NormalizedArticle(
+                    id=article_id_from_canonical(canonical),
+                    source_id="test_source",
+                    title=f"Story {n}",
+                    url=canonical,
+                    canonical_url=canonical,
+                    published_at_utc=published,
+                    snippet="",
+                    image_url=None,
+                    first_seen_at_utc=published,
+                    last_seen_at_utc=published,
+                )
+            )
+        with db.connection(self.db_path) as conn:
+            db.upsert_articles(conn, articles, to_iso_utc(self.now))
+
+    def tearDown(self) -> None:
+        db.close_pools()
+        self._tmp.cleanup()
+
+    def _page(self, conn, **kwargs):
+        return db.list_articles(
+            conn,
+            cutoff_iso_utc=to_iso_utc(self.now - timedelta(hours=24)),
+            saved="all",
+            source_id=None,
+            **kwargs,
+        )
+
+    def test_keyset_pages_match_offset_pages(self) -> None:
+        with db.connection(self.db_path, readonly=True) as conn:
+            total, everything = self._page(conn, limit=100)
+            self.assertEqual(total, 25)
+
+            seen = []
+            after = None
+            while True:
+                page_total, rows = self._page(conn, limit=10, after=after, include_total=False)
+                self.assertIsNone(page_total)
+                seen.extend(row["id"] for row in rows)
+                if len(rows) < 10:
+                    break
+                after = decode_cursor(encode_cursor(rows[-1]))
+
+        self.assertEqual(seen, [row["id"] for row in everything])
+
+    def test_offset_is_still_supported(self) -> None:
+        with db.connection(self.db_path, readonly=True) as conn:
+            _, everything = self._page(conn, limit=100)
+            _, rows = self._page(conn, limit=5, offset=10)
+        self.assertEqual([row["id"] for row in rows], [row["id"] for row in everything[10:15]])
+
+    def test_malformed_cursor_is_rejected(self) -> None:
+        for cursor in ("not-base64!", "e30", encode_cursor({"published_at_utc": 1, "updated_at_utc": 2, "id": 3})):
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(HTTPException) as ctx:
+                    decode_cursor(cursor)
+                self.assertEqual(ctx.exception.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
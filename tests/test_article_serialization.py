@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import unittest
+
+from app.schemas import ArticleListResponse, ArticleOut
+from app.serialization import article_list_body
+
+
+def _rows() -> list[sqlite3.Row]:
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    return conn.execute(
+        """
+        SELECT 'id1' AS id, 'src' AS source_id, 'Café Source' AS source_name, 'Title "quoted" — ☕' AS title,
+               'https://example.com/a' AS url, 'https://example.com/a' AS canonical_url,
+               '2026-02-21T12:00:00Z' AS published_at_utc, NULL AS snippet, NULL AS image_url, 1 AS is_saved,
+               '2026-02-21T12:00:00Z' AS first_seen_at_utc, '2026-02-21T12:05:00Z' AS last_seen_at_utc,
+               '2026-02-21T12:05:00Z' AS updated_at_utc
+        UNION ALL
+        SELECT 'id2', 'src', 'Café Source', 'Line\nbreak', 'https://example.com/b', 'https://example.com/b',
+               '2026-02-20T12:00:00Z', 'Snippet', 'https://example.com/b.jpg', 0,
+               '2026-02-20T12:00:00Z', '2026-02-20T12:00:00Z', '2026-02-20T12:00:00Z'
+        """
+    ).fetchall()
+
+
+def _pydantic_body(total, rows, next_cursor) -> bytes:
+    items = [
+        ArticleOut(
+            id=row["id"],
+            source_id=row["source_id"],
+            source_name=row["source_name"],
+            title=row["title"],
+            url=row["url"],
+            canonical_url=row["canonical_url"],
+            published_at_utc=row["published_at_utc"],
+            snippet=row["snippet"] or "",
+            image_url=row["image_url"],
+            is_saved=bool(row["is_saved"]),
+            first_seen_at_utc=row["first_seen_at_utc"],
+            last_seen_at_utc=row["last_seen_at_utc"],
+        )
+        for row in rows
+    ]
+    return ArticleListResponse(total=total, items=items, next_cursor=next_cursor).model_dump_json().encode("utf-8")
+
+
+class ArticleSerializationTestCase(unittest.TestCase):
+    def test_fast_path_matches_pydantic_output(self) -> None:
+        rows = _rows()
+        for total, next_cursor in ((2, "abc"), (None, None)):
+            with self.subTest(total=total, next_cursor=next_cursor):
+                fast = article_list_body(total, rows, next_cursor)
+                reference = _pydantic_body(total, rows, next_cursor)
+                self.assertEqual(json.loads(fast), json.loads(reference))
+                self.assertEqual(fast, reference)
+
+    def test_payload_validates_against_response_model(self) -> None:
+        ArticleListResponse.model_validate_json(article_list_body(None, _rows(), None))
+
+
+if __name__ == "__main__":
+    unittest.main()
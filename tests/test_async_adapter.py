@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from app.config import load_settings
+from app.http_client import AsyncHttpClient, HttpValidators
+from app.models import SourceConfig
+from app.source_adapters.async_base import AsyncSourceAdapter
+from app.source_adapters.base import BaseSourceAdapter
+
+FEED_XML = """<?xml version="1.0"?>
+<rss><channel>
+<item><title>Feed Story</title><link>https://example.com/feed-story?utm_source=rss</link>
+<pubDate>Sat, 21 Feb 2026 12:00:00 GMT</pubDate><description>&lt;p&gt;Hello&lt;/p&gt;</description></item>
+</channel></rss>"""
+
+LISTING_HTML = """<html><body>
+<article><h2><a href="/listing-story">Listing Story</a></h2><p>Card text</p></article>
+</body></html>"""
+
+ARTICLE_HTML = """<html><head>
+<meta property="article:published_time" content="2026-02-21T10:00:00Z" />
+<meta property="og:image" content="https://example.com/cover.jpg" />
+</head><body><p>Body</p></body></html>"""
+
+
+class FakeHttpClient:
+    def __init__(self, pages: dict[str, str]):
+        self.pages = pages
+
+    def get_text(self, url: str) -> str:
+        if url not in self.pages:
+            raise RuntimeError("404")
+        return self.pages[url]
+
+    def get_conditional(self, url: str):
+        return self.get_text(url), HttpValidators(url)
+
+    def stream_text(self, url: str, consume, *, max_bytes: int) -> None:
+        consume(self.get_text(url))
+
+    def stream_bytes(self, url: str, consume, *, conditional: bool = False, max_bytes=None) -> HttpValidators:
+        consume(self.get_text(url).encode("utf-8"))
+        return HttpValidators(url)
+
+
+def _adapter(feed_url: str | None) -> BaseSourceAdapter:
+    return BaseSourceAdapter(
+        SourceConfig(
+            id="test_source",
+            name="Test Source",
+            base_url="https://example.com",
+            feed_url=feed_url,
+            listing_url="https://example.com/news",
+        )
+    )
+
+
+class AsyncSourceAdapterTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        with patch.dict(os.environ, {"REQUEST_RETRIES": "0"}, clear=True):
+            self.settings = load_settings(env_path=".env.missing")
+        self.pages = {
+            "https://example.com/feed/": FEED_XML,
+            "https://example.com/news": LISTING_HTML,
+            "https://example.com/listing-story": ARTICLE_HTML,
+        }
+
+    def _fetch_async(self, adapter: BaseSourceAdapter):
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = self.pages.get(str(request.url))
+            return httpx.Response(200, text=body) if body is not None else httpx.Response(404)
+
+        async def run():
+            async with AsyncHttpClient(self.settings) as http:
+                http._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+                return await AsyncSourceAdapter(adapter, http).fetch(self.settings)
+
+        return asyncio.run(run())
+
+    def _fetch_sync(self, adapter: BaseSourceAdapter):
+        adapter.use_http_client(FakeHttpClient(self.pages))
+        return adapter.fetch(self.settings)
+
+    def test_feed_output_matches_sync_engine(self) -> None:
+        with patch("app.http_client.load_validator_headers", return_value={}):
+            async_articles, async_warnings, async_validators = self._fetch_async(_adapter("https://example.com/feed/"))
+        sync_articles, sync_warnings, sync_validators = self._fetch_sync(_adapter("https://example.com/feed/"))
+
+        self.assertEqual(async_articles, sync_articles)
+        self.assertEqual(async_articles[0].url, "https://example.com/feed-story")
+        self.assertEqual(async_warnings, sync_warnings)
+        self.assertEqual(async_validators.url, sync_validators.url)
+
+    def test_listing_fallback_with_meta_matches_sync_engine(self) -> None:
+        with patch("app.http_client.load_validator_headers", return_value={}):
+            async_articles, async_warnings, _ = self._fetch_async(_adapter("https://example.com/missing-feed"))
+        sync_articles, _, _ = self._fetch_sync(_adapter("https://example.com/missing-feed"))
+
+        self.assertEqual(async_articles, sync_articles)
+        self.assertEqual(async_articles[0].image_url, "https://example.com/cover.jpg")
+        self.assertTrue(async_warnings[0].startswith("feed_error"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import gzip
+import os
+import tempfile
+import unittest
+import warnings
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, StreamingResponse
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore")
+    from fastapi.testclient import TestClient
+
+from app import db
+from app.compression import CompressionMiddleware, negotiate_encoding
+from app.main import app
+
+
+def _small_app() -> FastAPI:
+    small = FastAPI()
+    small.add_middleware(CompressionMiddleware, min_bytes=100)
+
+    @small.get("/big")
+    def big():
+        return JSONResponse({"text": "coffee " * 100}, headers={"ETag": '"abc"'})
+
+    @small.get("/tiny")
+    def tiny():
+        return {"ok": True}
+
+    @small.get("/stream")
+    def stream():
+        return StreamingResponse(iter([b"data: one\n\n", b"data: two\n\n"]), media_type="text/event-stream")
+
+    return small
+
+
+class NegotiationTestCase(unittest.TestCase):
+    def test_negotiate_encoding(self) -> None:
+        self.assertEqual(negotiate_encoding("gzip, deflate", ("br", "gzip")), "gzip")
+        self.assertEqual(negotiate_encoding("br;q=1.0, gzip;q=0.5", ("br", "gzip")), "br")
+        self.assertIsNone(negotiate_encoding("gzip;q=0", ("gzip",)))
+        self.assertEqual(negotiate_encoding("*", ("gzip",)), "gzip")
+        self.assertIsNone(negotiate_encoding(None, ("gzip",)))
+
+
+class CompressionMiddlewareTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = TestClient(_small_app())
+
+    def test_large_responses_are_compressed_with_weak_etag(self) -> None:
+        response = self.client.get("/big", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertEqual(response.headers["Vary"], "Accept-Encoding")
+        self.assertEqual(response.headers["ETag"], 'W/"abc"')
+        self.assertEqual(response.json(), {"text": "coffee " * 100})
+
+    def test_small_identity_and_streaming_responses_pass_through(self) -> None:
+        self.assertNotIn("Content-Encoding", self.client.get("/tiny", headers={"Accept-Encoding": "gzip"}).headers)
+        self.assertNotIn("Content-Encoding", self.client.get("/big", headers={"Accept-Encoding": "identity"}).headers)
+
+        streamed = self.client.get("/stream", headers={"Accept-Encoding": "gzip"})
+        self.assertNotIn("Content-Encoding", streamed.headers)
+        self.assertEqual(streamed.text, "data: one\n\ndata: two\n\n")
+
+
+class DashboardBundleTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        env = {"DB_PATH": f"{self._tmp.name}/test.db", "SCHEDULER_ENABLED": "false"}
+        self._env = patch.dict(os.environ, env, clear=True)
+        self._env.start()
+        self.client = TestClient(app)
+        self.client.__enter__()
+
+    def tearDown(self) -> None:
+        self.client.__exit__(None, None, None)
+        self._env.stop()
+        db.close_pools()
+        self._tmp.cleanup()
+
+    def test_dashboard_is_precompressed_and_assets_are_hashed(self) -> None:
+        response = self.client.get("/dashboard", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertEqual(response.headers["Cache-Control"], "no-cache")
+
+        bundle = app.state.dashboard
+        logo = bundle.assets["222-logo-negro.png"]
+        self.assertIn(f"/dashboard-assets/222-logo-negro.png?v={logo.content_hash}", response.text)
+        self.assertEqual(gzip.decompress(bundle.html.variants["gzip"]).decode("utf-8"), response.text)
+
+        again = self.client.get("/dashboard", headers={"If-None-Match": response.headers["ETag"]})
+        self.assertEqual(again.status_code, 304)
+
+        versioned = self.client.get(f"/dashboard-assets/222-logo-negro.png?v={logo.content_hash}")
+        self.assertEqual(versioned.headers["Cache-Control"], "public, max-age=31536000, immutable")
+        self.assertEqual(versioned.headers["Content-Type"], "image/png")
+        self.assertNotIn("Content-Encoding", versioned.headers)
+
+        unversioned = self.client.get("/dashboard-assets/222-logo-negro.png")
+        self.assertEqual(unversioned.headers["Cache-Control"], "no-cache")
+        self.assertEqual(self.client.get("/dashboard-assets/missing.png").status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+from app import db
+from app.config import load_settings
+from app.http_client import HttpClient, NotModified
+from app.models import SourceConfig
+from app.services.ingestion import IngestionService
+from app.source_adapters.base import BaseSourceAdapter
+from app.utils import to_iso_utc, utc_now
+
+FEED_XML = """<?xml version="1.0"?>
+<rss><channel><item><title>Story</title><link>https://example.com/story</link>
+<pubDate>Sat, 21 Feb 2026 12:00:00 GMT</pubDate></item></channel></rss>"""
+
+SOURCE = SourceConfig(
+    id="test_source",
+    name="Test Source",
+    base_url="https://example.com",
+    feed_url="https://example.com/feed/",
+    listing_url="https://example.com/news",
+)
+
+
+def _response(status_code: int, text: str = "", headers: dict | None = None) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.text = text
+    response.encoding = "utf-8"
+    response.headers = headers or {}
+    response.iter_content.return_value = [text.encode("utf-8")]
+    response.__enter__.return_value = response
+    return response
+
+
+class FakeServer:
+    """Answers ``session.get`` from ``pages`` and honours If-None-Match like a real server."""
+
+    def __init__(self, pages: dict[str, tuple[str, str]]):
+        self.pages = pages
+        self.requests: list[tuple[str, str | None]] = []
+
+    def get(self, url, headers, **kwargs):
+        self.requests.append((url, headers.get("If-None-Match")))
+        if url not in self.pages:
+            return _response(404)
+        body, etag = self.pages[url]
+        if headers.get("If-None-Match") == etag:
+            return _response(304)
+        return _response(200, body, {"ETag": etag})
+
+
+def _settings(tmp: str):
+    with patch.dict(os.environ, {"DB_PATH": f"{tmp}/test.db", "RESPECT_ROBOTS_TXT": "false"}, clear=True):
+        settings = load_settings(env_path=".env.missing")
+    db.bootstrap_database(db_path=settings.db_path, sources=[SOURCE], now_iso_utc=to_iso_utc(utc_now()))
+    return settings
+
+
+def _listing_html() -> str:
+    published = to_iso_utc(utc_now() - timedelta(hours=1))
+    return (
+        f'<html><body><article><h2><a href="/listed">Listed</a></h2><time datetime="{published}"></time>'
+        '<p>Card text</p><img src="/listed.jpg"></article></body></html>'
+    )
+
+
+class ConditionalGetTestCase(unittest.TestCase):
+    def tearDown(self) -> None:
+        db.close_pools()
+
+    def test_validators_are_returned_to_the_caller_and_replayed_once_saved(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            settings = _settings(tmp)
+            client = HttpClient(settings)
+            session = MagicMock()
+            session.get.side_effect = [
+                _response(200, FEED_XML, {"ETag": '"v1"', "Last-Modified": "Sat, 21 Feb 2026 12:00:00 GMT"}),
+                _response(200, FEED_XML, {"ETag": '"v1"'}),
+                _response(304),
+            ]
+
+            with patch.object(client, "session_for", return_value=session):
+                body, validators = client.get_conditional("https://example.com/feed/")
+                self.assertEqual(body, FEED_XML)
+                self.assertEqual(validators.etag, '"v1"')
+
+                # Nothing is persisted until the caller has stored what it parsed.
+                client.get_conditional("https://example.com/feed/")
+                with db.connection(settings.db_path) as conn:
+                    validators.save(conn, now_utc=to_iso_utc(utc_now()))
+                with self.assertRaises(NotModified):
+                    client.get_conditional("https://example.com/feed/")
+
+            sent = [call.kwargs["headers"] for call in session.get.call_args_list]
+            self.assertNotIn("If-None-Match", sent[0])
+            self.assertNotIn("If-None-Match", sent[1])
+            self.assertEqual(sent[2]["If-None-Match"], '"v1"')
+            self.assertEqual(sent[2]["If-Modified-Since"], "Sat, 21 Feb 2026 12:00:00 GMT")
+
+    def test_not_modified_feed_short_circuits_fetch(self) -> None:
+        with patch.dict(os.environ, {}, clear=True):
+            settings = load_settings(env_path=".env.missing")
+        adapter = BaseSourceAdapter(SOURCE)
+
+        http = MagicMock()
+        http.stream_bytes.side_effect = NotModified("https://example.com/feed/")
+        adapter.use_http_client(http)
+        articles, warnings, validators = adapter.fetch(settings)
+
+        self.assertEqual((articles, warnings, validators), ([], ["not_modified: feed"], None))
+        self.assertEqual(http.stream_bytes.call_count, 1)
+        self.assertTrue(http.stream_bytes.call_args.kwargs["conditional"])
+        http.get_conditional.assert_not_called()
+
+    def test_broken_feed_keeps_the_listing_fallback_across_runs(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            settings = _settings(tmp)
+            server = FakeServer(
+                {
+                    "https://example.com/feed/": ("<rss><channel><item><title>Broken", '"feed-1"'),
+                    "https://example.com/news": (_listing_html(), '"news-1"'),
+                }
+            )
+            http = HttpClient(settings)
+            session = MagicMock()
+            session.get.side_effect = server.get
+            service = IngestionService(settings=settings, adapters=[BaseSourceAdapter(SOURCE)], http=http)
+
+            with patch.object(http, "session_for", return_value=session):
+                _, first, _ = service.run_once(trigger="test")
+                _, second, _ = service.run_once(trigger="test")
+            service.shutdown()
+
+        self.assertEqual(first["new_count"], 1)
+        self.assertEqual(
+            server.requests,
+            [
+                ("https://example.com/feed/", None),
+                ("https://example.com/news", None),
+                # The feed's ETag was never saved: it is refetched and the listing is still checked.
+                ("https://example.com/feed/", None),
+                ("https://example.com/news", '"news-1"'),
+            ],
+        )
+        self.assertEqual(second["notes"]["not_modified"], ["test_source: listing"])
+
+    def test_validators_are_not_saved_when_the_source_fails_to_store(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            settings = _settings(tmp)
+            server = FakeServer({"https://example.com/feed/": (FEED_XML, '"feed-1"')})
+            http = HttpClient(settings)
+            session = MagicMock()
+            session.get.side_effect = server.get
+            service = IngestionService(settings=settings, adapters=[BaseSourceAdapter(SOURCE)], http=http)
+
+            with patch.object(http, "session_for", return_value=session):
+                with patch("app.services.ingestion.db.upsert_articles", side_effect=RuntimeError("disk full")):
+                    _, failed, _ = service.run_once(trigger="test")
+                _, retried, _ = service.run_once(trigger="test")
+            service.shutdown()
+
+            with db.connection(settings.db_path, readonly=True) as conn:
+                saved = db.get_http_validator(conn, "https://example.com/feed/")
+
+        self.assertEqual(failed["status"], "failed")
+        self.assertEqual([etag for _, etag in server.requests], [None, None])
+        self.assertEqual(retried["status"], "success")
+        self.assertEqual(saved["etag"], '"feed-1"')
+
+
+if __name__ == "__main__":
+    unittest.main()
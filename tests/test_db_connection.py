@@ -9,6 +9,13 @@ from app import db
 
 
 class DbConnectionFallbackTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        # Pools are cached per configured path; each test must open its own connection.
+        db.close_pools()
+
+    def tearDown(self) -> None:
+        db.close_pools()
+
     def test_falls_back_to_tmp_on_read_only_data_dir(self) -> None:
         # First mkdir call is for configured path (fails read-only), second is for /tmp (succeeds).
         with patch(
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+
+from app import db
+from app.models import SourceConfig
+from app.services.retention import apply_retention
+from app.utils import to_iso_utc, utc_now
+
+SOURCE = SourceConfig(
+    id="test_source",
+    name="Test Source",
+    base_url="https://example.com",
+    feed_url=None,
+    listing_url="https://example.com/news",
+)
+
+
+class DbMigrationsTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = f"{self._tmp.name}/test.db"
+        self.now = utc_now()
+        db.bootstrap_database(db_path=self.db_path, sources=[SOURCE], now_iso_utc=to_iso_utc(self.now))
+
+    def tearDown(self) -> None:
+        db.close_pools()
+        self._tmp.cleanup()
+
+    def _traced_plans(self, conn, call) -> list[str]:
+        """Run ``call`` and return the EXPLAIN QUERY PLAN details of every statement it issued."""
+        statements: list[str] = []
+        conn.set_trace_callback(statements.append)
+        try:
+            call()
+        finally:
+            conn.set_trace_callback(None)
+
+        plans = []
+        for sql in statements:
+            if not sql.lstrip().upper().startswith(("SELECT", "DELETE", "UPDATE")):
+                continue  # implicit BEGIN etc.
+            rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+            plans.append(" | ".join(row["detail"] for row in rows))
+        return plans
+
+    def assertIndexed(self, plan: str) -> None:
+        self.assertNotRegex(plan, r"SCAN (a|articles|ingestion_runs)(?! USING)", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_fresh_database_is_at_latest_version(self) -> None:
+        with db.connection(self.db_path) as conn:
+            self.assertEqual(db.schema_version(conn), db.SCHEMA_VERSION)
+            indexes = {row["name"] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertTrue({"idx_articles_listing", "idx_ingestion_runs_started"} <= indexes)
+
+    def test_current_schema_skips_migrations(self) -> None:
+        with db.connection(self.db_path) as conn:
+            statements: list[str] = []
+            conn.set_trace_callback(statements.append)
+            db.init_db(conn)
+            conn.set_trace_callback(None)
+        self.assertEqual(statements, ["PRAGMA user_version"])
+
+    def test_outdated_database_is_upgraded_in_place(self) -> None:
+        with db.connection(self.db_path) as conn:
+            conn.execute("DROP INDEX idx_articles_listing")
+            # Pretend migration 3 (which creates the listing index) never ran.
+            conn.execute("PRAGMA user_version = 2")
+        db.bootstrap_database(db_path=self.db_path, sources=[SOURCE], now_iso_utc=to_iso_utc(self.now))
+        with db.connection(self.db_path) as conn:
+            self.assertEqual(db.schema_version(conn), db.SCHEMA_VERSION)
+            self.assertIsNotNone(
+                conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'idx_articles_listing'").fetchone()
+            )
+
+    def test_list_articles_query_plans_use_indexes(self) -> None:
+        cutoff = to_iso_utc(self.now)
+        cases = [
+            dict(saved="all", source_id=None),
+            dict(saved="false", source_id=None),
+            dict(saved="true", source_id=None),
+            dict(saved="false", source_id="test_source"),
+            dict(saved="all", source_id=None, after=(cutoff, cutoff, "z"), include_total=False),
+            dict(saved="all", source_id="test_source", after=(cutoff, cutoff, "z")),
+        ]
+        with db.connection(self.db_path) as conn:
+            for case in cases:
+                with self.subTest(saved=case["saved"], source_id=case["source_id"], keyset="after" in case):
+                    plans = self._traced_plans(
+                        conn,
+                        lambda: db.list_articles(conn, cutoff_iso_utc=cutoff, limit=50, offset=0, **case),
+                    )
+                    for plan in plans:
+                        self.assertIndexed(plan)
+
+    def test_retention_and_latest_run_query_plans_use_indexes(self) -> None:
+        with db.connection(self.db_path) as conn:
+            plans = self._traced_plans(conn, lambda: apply_retention(conn, now_utc=self.now, window_hours=24))
+            plans += self._traced_plans(conn, lambda: db.latest_ingestion_run(conn))
+        self.assertEqual(len(plans), 2)
+        for plan in plans:
+            self.assertIndexed(plan)
+
+
+if __name__ == "__main__":
+    unittest.main()
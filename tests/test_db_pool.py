@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+from app import db
+
+
+class ConnectionPoolTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = f"{self._tmp.name}/test.db"
+        with db.connection(self.db_path) as conn:
+            conn.execute("CREATE TABLE items (value TEXT)")
+
+    def tearDown(self) -> None:
+        db.close_pools()
+        self._tmp.cleanup()
+
+    def test_connections_are_reused_and_tuned(self) -> None:
+        with db.connection(self.db_path) as first:
+            pass
+        with db.connection(self.db_path) as second:
+            self.assertIs(first, second)
+            self.assertEqual(second.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            self.assertEqual(second.execute("PRAGMA synchronous").fetchone()[0], 1)
+            self.assertEqual(second.execute("PRAGMA busy_timeout").fetchone()[0], db.BUSY_TIMEOUT_MS)
+
+    def test_readers_are_query_only(self) -> None:
+        with db.connection(self.db_path, readonly=True) as conn:
+            with self.assertRaises(sqlite3.OperationalError):
+                conn.execute("INSERT INTO items VALUES ('x')")
+
+    def test_reads_are_not_blocked_by_open_write_transaction(self) -> None:
+        writing = threading.Event()
+        release = threading.Event()
+
+        def long_write() -> None:
+            with db.connection(self.db_path) as conn:
+                conn.execute("INSERT INTO items VALUES ('pending')")
+                writing.set()
+                release.wait(timeout=5)
+
+        writer = threading.Thread(target=long_write)
+        writer.start()
+        try:
+            self.assertTrue(writing.wait(timeout=5))
+            with db.connection(self.db_path, readonly=True) as conn:
+                self.assertEqual(conn.execute("SELECT COUNT(*) FROM items").fetchone()[0], 0)
+        finally:
+            release.set()
+            writer.join()
+
+        with db.connection(self.db_path, readonly=True) as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM items").fetchone()[0], 1)
+
+    def test_nested_writer_commits_once_at_outermost_block(self) -> None:
+        with self.assertRaises(RuntimeError):
+            with db.connection(self.db_path) as outer:
+                with db.connection(self.db_path) as inner:
+                    self.assertIs(inner, outer)
+                    inner.execute("INSERT INTO items VALUES ('rolled back')")
+                raise RuntimeError("abort")
+
+        with db.connection(self.db_path, readonly=True) as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM items").fetchone()[0], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sqlite3
 import tempfile
 import unittest
 
@@ -8,6 +9,48 @@ from app.models import NormalizedArticle, SourceConfig
 from app.utils import article_id_from_canonical, to_iso_utc, utc_now
 
 
+class RacingConnection:
+    """Has another worker run ``racer_sql`` right after ``upsert_articles`` reads max(rowid)."""
+
+    def __init__(self, conn: sqlite3.Connection, db_path: str, racer_sql: str):
+        self._conn = conn
+        self.db_path = db_path
+        self.racer_sql = racer_sql
+        self.racer_error: str | None = None
+
+    def execute(self, sql, *args):
+        cursor = self._conn.execute(sql, *args)
+        if "MAX(rowid)" in sql:
+            racer = sqlite3.connect(self.db_path, timeout=0)
+            try:
+                racer.execute(self.racer_sql)
+                racer.commit()
+            except sqlite3.OperationalError as exc:
+                self.racer_error = str(exc)
+            finally:
+                racer.close()
+        return cursor
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+def _article(path: str, title: str, now: str) -> NormalizedArticle:
+    canonical = f"https://example.com/{path}"
+    return NormalizedArticle(
+        id=article_id_from_canonical(canonical),
+        source_id="test_source",
+        title=title,
+        url=canonical,
+        canonical_url=canonical,
+        published_at_utc=now,
+        snippet="",
+        image_url=None,
+        first_seen_at_utc=now,
+        last_seen_at_utc=now,
+    )
+
+
 class DedupeTestCase(unittest.TestCase):
     def test_upsert_by_canonical_url(self) -> None:
         now = utc_now()
@@ -64,6 +107,65 @@ class DedupeTestCase(unittest.TestCase):
                 self.assertEqual(article_row["snippet"], "B")
                 self.assertEqual(article_row["image_url"], "https://example.com/image.jpg")
 
+    def test_bulk_upsert_counts_inserts_and_updates(self) -> None:
+        now = to_iso_utc(utc_now())
+
+        def article(path: str, title: str) -> NormalizedArticle:
+            return _article(path, title, now)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = f"{tmp}/test.db"
+            source = SourceConfig(
+                id="test_source",
+                name="Test Source",
+                base_url="https://example.com",
+                feed_url=None,
+                listing_url="https://example.com/news",
+            )
+            db.bootstrap_database(db_path=db_path, sources=[source], now_iso_utc=now)
+
+            with db.connection(db_path) as conn:
+                self.assertEqual(db.upsert_articles(conn, [], now), (0, 0))
+                self.assertEqual(db.upsert_articles(conn, [article("a", "A"), article("b", "B")], now), (2, 0))
+
+                # Existing row, new row, and a URL repeated within the batch (insert, then update).
+                batch = [article("a", "A2"), article("c", "C"), article("c", "C2")]
+                self.assertEqual(db.upsert_articles(conn, batch, now), (1, 2))
+
+                rows = conn.execute("SELECT canonical_url, title FROM articles ORDER BY canonical_url").fetchall()
+                self.assertEqual(
+                    [(row["canonical_url"], row["title"]) for row in rows],
+                    [
+                        ("https://example.com/a", "A2"),
+                        ("https://example.com/b", "B"),
+                        ("https://example.com/c", "C2"),
+                    ],
+                )
+
+    def test_bulk_upsert_counts_are_not_skewed_by_another_worker(self) -> None:
+        now = to_iso_utc(utc_now())
+
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = f"{tmp}/test.db"
+            source = SourceConfig(
+                id="test_source",
+                name="Test Source",
+                base_url="https://example.com",
+                feed_url=None,
+                listing_url="https://example.com/news",
+            )
+            db.bootstrap_database(db_path=db_path, sources=[source], now_iso_utc=now)
+            with db.connection(db_path) as conn:
+                db.upsert_articles(conn, [_article("a", "A", now), _article("b", "B", now)], now)
+
+            # Deleting the newest row would let the new one reuse its rowid and count as an update.
+            with db.connection(db_path) as conn:
+                racing = RacingConnection(conn, db_path, "DELETE FROM articles WHERE canonical_url = 'https://example.com/b'")
+                self.assertEqual(db.upsert_articles(racing, [_article("c", "C", now)], now), (1, 0))
+
+            self.assertIn("locked", racing.racer_error)
+            db.close_pools()
+
 
 if __name__ == "__main__":
     unittest.main()
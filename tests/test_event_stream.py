@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+import warnings
+from datetime import timedelta
+from unittest.mock import patch
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore")
+    from fastapi.testclient import TestClient
+
+from app import db
+from app.api.routes_events import event_stream
+from app.main import app
+from app.models import RawArticle, SourceConfig
+from app.services.events import EventBus
+from app.services.ingestion import IngestionService
+from app.utils import to_iso_utc, utc_now
+
+
+def _replayed(bus: EventBus, since: int = 0) -> list:
+    """Every event a client resuming from ``since`` would receive right now."""
+
+    async def collect():
+        subscription = bus.subscribe(since)
+        events = []
+        while (event := await subscription.get(timeout=0.01)) is not None:
+            events.append(event)
+        subscription.close()
+        return events
+
+    return asyncio.run(collect())
+
+
+class FakeRequest:
+    def __init__(self, disconnect_after: int):
+        self.checks = 0
+        self.disconnect_after = disconnect_after
+
+    async def is_disconnected(self) -> bool:
+        self.checks += 1
+        return self.checks > self.disconnect_after
+
+
+class OneArticleAdapter:
+    def __init__(self):
+        self.source = SourceConfig(
+            id="test_source",
+            name="Test Source",
+            base_url="https://example.com",
+            feed_url=None,
+            listing_url="https://example.com/news",
+        )
+
+    def use_http_client(self, http) -> None:
+        self.http = http
+
+    def fetch(self, settings):
+        article = RawArticle(
+            source_id=self.source.id,
+            title="Fresh",
+            url="https://example.com/fresh",
+            published_at_utc=utc_now() - timedelta(hours=1),
+        )
+        return [article], []
+
+
+class EventBusTestCase(unittest.TestCase):
+    def test_events_published_from_other_threads_reach_subscribers(self) -> None:
+        bus = EventBus()
+
+        async def run():
+            subscription = bus.subscribe()
+            publisher = threading.Thread(target=bus.publish, args=("articles.deleted", {"ids": ["a"]}))
+            publisher.start()
+            event = await subscription.get(timeout=2)
+            publisher.join()
+            self.assertEqual(bus.subscriber_count(), 1)
+            subscription.close()
+            return event
+
+        event = asyncio.run(run())
+        self.assertEqual((event.id, event.type, event.data), (1, "articles.deleted", {"ids": ["a"]}))
+        self.assertEqual(bus.subscriber_count(), 0)
+
+    def test_concurrent_publishers_get_distinct_ids_delivered_in_order(self) -> None:
+        bus = EventBus(replay_size=1000, max_pending=1000)
+        publishers, per_publisher = 8, 50
+
+        async def run():
+            subscription = bus.subscribe()
+            threads = [
+                threading.Thread(target=lambda: [bus.publish("ingestion.run", {}) for _ in range(per_publisher)])
+                for _ in range(publishers)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            events = []
+            while (event := await subscription.get(timeout=0.05)) is not None:
+                events.append(event)
+            subscription.close()
+            return events
+
+        events = asyncio.run(run())
+        self.assertEqual([event.id for event in events], list(range(1, publishers * per_publisher + 1)))
+
+    def test_reconnect_replays_missed_events_or_asks_for_resync(self) -> None:
+        bus = EventBus(replay_size=3)
+        for index in range(5):
+            bus.publish("ingestion.run", {"n": index})
+
+        self.assertEqual([event.id for event in _replayed(bus, since=3)], [4, 5])
+        self.assertEqual(_replayed(bus, since=5), [])
+        self.assertEqual([event.type for event in _replayed(bus, since=1)], ["resync"])
+        # Ids from before a restart are ahead of this process.
+        self.assertEqual([event.type for event in _replayed(bus, since=99)], ["resync"])
+
+    def test_stalled_subscriber_gets_resync_instead_of_backlog(self) -> None:
+        bus = EventBus(max_pending=2)
+
+        async def run():
+            subscription = bus.subscribe()
+            for index in range(3):
+                bus.publish("ingestion.run", {"n": index})
+            await asyncio.sleep(0)
+            events = []
+            while (event := await subscription.get(timeout=0.01)) is not None:
+                events.append(event)
+            return events
+
+        events = asyncio.run(run())
+        self.assertEqual([(event.id, event.type) for event in events], [(3, "resync")])
+
+    def test_stream_frames_events_and_heartbeats_until_disconnect(self) -> None:
+        bus = EventBus()
+        bus.publish("articles.deleted", {"ids": ["a"]})
+
+        async def run():
+            chunks = []
+            async for chunk in event_stream(FakeRequest(disconnect_after=1), bus, 0, heartbeat_seconds=0.01):
+                chunks.append(chunk)
+            return chunks
+
+        chunks = asyncio.run(run())
+        self.assertEqual(
+            chunks,
+            [
+                b"retry: 3000\n\n",
+                b'id: 1\nevent: articles.deleted\ndata: {"ids":["a"]}\n\n',
+                b": keepalive\n\n",
+            ],
+        )
+        self.assertEqual(bus.subscriber_count(), 0)
+
+
+class SharedEventBusTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = f"{self._tmp.name}/test.db"
+        db.bootstrap_database(db_path=self.db_path, sources=[], now_iso_utc=to_iso_utc(utc_now()))
+
+    def tearDown(self) -> None:
+        db.close_pools()
+        self._tmp.cleanup()
+
+    def test_workers_on_one_database_see_each_others_events(self) -> None:
+        first = EventBus(db_path=self.db_path)
+        second = EventBus(db_path=self.db_path)
+
+        first.publish("ingestion.run", {"n": 0})
+        second.publish("articles.deleted", {"ids": ["a"]})
+        first.publish("ingestion.run", {"n": 1})
+
+        # The second worker only learns of the last event when it next polls.
+        self.assertEqual([event.id for event in _replayed(second)], [1, 2])
+        self.assertEqual(second.poll(), 1)
+        self.assertEqual(
+            [(event.id, event.type) for event in _replayed(second, since=0)],
+            [(1, "ingestion.run"), (2, "articles.deleted"), (3, "ingestion.run")],
+        )
+        # Ids are global, so a client can resume on whichever worker it reconnects to.
+        self.assertEqual([event.id for event in _replayed(first, since=2)], [3])
+        restarted = EventBus(db_path=self.db_path)
+        self.assertEqual([event.data for event in _replayed(restarted, since=1)], [{"ids": ["a"]}, {"n": 1}])
+
+    def test_client_ahead_of_this_worker_waits_for_the_relay(self) -> None:
+        first = EventBus(db_path=self.db_path)
+        second = EventBus(db_path=self.db_path, poll_seconds=0.01)
+        first.publish("ingestion.run", {"n": 0})
+        first.publish("ingestion.run", {"n": 1})
+        second.start()
+
+        async def run():
+            # Resumed from an id this worker may not have polled yet: no resync, no duplicates.
+            subscription = second.subscribe(1)
+            first.publish("ingestion.run", {"n": 2})
+            events = []
+            while (event := await subscription.get(timeout=0.5)) is not None:
+                events.append(event)
+            subscription.close()
+            return events
+
+        try:
+            events = asyncio.run(run())
+        finally:
+            second.stop()
+        self.assertEqual([(event.id, event.type) for event in events], [(2, "ingestion.run"), (3, "ingestion.run")])
+
+    def test_worker_that_missed_trimmed_events_asks_for_resync(self) -> None:
+        first = EventBus(replay_size=2, db_path=self.db_path)
+        second = EventBus(replay_size=2, db_path=self.db_path)
+        first.publish("ingestion.run", {"n": 0})
+        second.poll()
+
+        async def run():
+            subscription = second.subscribe(1)
+            for index in range(1, 4):
+                first.publish("ingestion.run", {"n": index})
+            second.poll()
+            await asyncio.sleep(0)
+            events = []
+            while (event := await subscription.get(timeout=0.01)) is not None:
+                events.append(event)
+            subscription.close()
+            return events
+
+        events = asyncio.run(run())
+        self.assertEqual([(event.id, event.type) for event in events], [(1, "resync"), (3, "ingestion.run"), (4, "ingestion.run")])
+
+
+class EventPublishersTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        env = {"DB_PATH": f"{self._tmp.name}/test.db", "SCHEDULER_ENABLED": "false"}
+        self._env = patch.dict(os.environ, env, clear=True)
+        self._env.start()
+        self.client = TestClient(app)
+        self.client.__enter__()
+        adapter = OneArticleAdapter()
+        db.bootstrap_database(
+            db_path=app.state.settings.db_path, sources=[adapter.source], now_iso_utc=to_iso_utc(utc_now())
+        )
+        self.bus = app.state.events
+        self.service = IngestionService(settings=app.state.settings, adapters=[adapter], events=self.bus)
+
+    def tearDown(self) -> None:
+        self.service.shutdown()
+        self.client.__exit__(None, None, None)
+        self._env.stop()
+        db.close_pools()
+        self._tmp.cleanup()
+
+    def test_ingestion_and_article_routes_publish_changes(self) -> None:
+        _, run, _ = self.service.run_once(trigger="test")
+        events = _replayed(self.bus)
+        self.assertEqual(
+            [(event.type, event.data.get("status")) for event in events],
+            [("ingestion.run", "running"), ("articles.upserted", None), ("ingestion.run", "running"), ("ingestion.run", "success")],
+        )
+        upserted = events[1].data
+        self.assertEqual((upserted["inserted"], upserted["updated"]), (1, 0))
+        article = upserted["items"][0]
+        self.assertEqual(article["title"], "Fresh")
+        self.assertEqual(events[2].data["sources_done"], 1)
+        self.assertEqual(events[-1].data["id"], run["id"])
+
+        last_id = events[-1].id
+        self.client.post(f"/api/articles/{article['id']}/save")
+        self.client.delete(f"/api/articles/{article['id']}")
+        saved, deleted = _replayed(self.bus, since=last_id)
+        self.assertEqual((saved.type, saved.data["items"][0]["is_saved"]), ("articles.upserted", True))
+        self.assertEqual((deleted.type, deleted.data), ("articles.deleted", {"ids": [article["id"]]}))
+
+
+if __name__ == "__main__":
+    unittest.main()
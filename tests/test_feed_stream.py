@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import unittest
+
+from app.source_adapters.streaming import FeedItemReader
+
+RSS_ITEM = "<item><title>Story {n}</title><link>https://example.com/{n}</link></item>"
+ATOM = """<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Feed</title>
+  <entry><title>One</title><link href="https://example.com/1"/></entry>
+  <entry><title>Two</title><link href="https://example.com/2"/></entry>
+</feed>"""
+
+
+def read_all(document: bytes, max_items: int, chunk_size: int = 50) -> tuple[list[str], int, FeedItemReader]:
+    reader = FeedItemReader(max_items)
+    titles: list[str] = []
+    consumed = 0
+    for start in range(0, len(document), chunk_size):
+        for item in reader.feed(document[start : start + chunk_size]):
+            titles.append(item.findtext("{http://www.w3.org/2005/Atom}title") or item.findtext("title"))
+        consumed = start + chunk_size
+        if reader.done:
+            break
+    else:
+        for item in reader.close():
+            titles.append(item.findtext("{http://www.w3.org/2005/Atom}title") or item.findtext("title"))
+    return titles, consumed, reader
+
+
+class FeedItemReaderTestCase(unittest.TestCase):
+    def test_rss_items_stop_at_cap_without_reading_rest(self) -> None:
+        items = "".join(RSS_ITEM.format(n=n) for n in range(5000))
+        document = f"<rss><channel><title>Feed</title>{items}</channel></rss>".encode("utf-8")
+
+        titles, consumed, reader = read_all(document, max_items=3)
+
+        self.assertEqual(titles, ["Story 0", "Story 1", "Story 2"])
+        self.assertTrue(reader.done)
+        self.assertLess(consumed, 500)
+        # Yielded items are detached; at most the partially read next item remains.
+        self.assertLessEqual(len(reader._channel.findall("item")), 1)
+
+    def test_atom_entries(self) -> None:
+        titles, _, reader = read_all(ATOM.encode("utf-8"), max_items=50)
+        self.assertEqual(titles, ["One", "Two"])
+        self.assertFalse(reader.done)
+
+    def test_rss_ignores_items_outside_channel(self) -> None:
+        document = b"<rss><channel><item><title>Kept</title></item></channel><item><title>Dropped</title></item></rss>"
+        titles, _, _ = read_all(document, max_items=50, chunk_size=7)
+        self.assertEqual(titles, ["Kept"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+import threading
+import time
+import unittest
+import warnings
+from dataclasses import replace
+from unittest.mock import MagicMock, patch
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore")
+    from fastapi.testclient import TestClient
+
+from app import db
+from app.config import load_settings
+from app.http_client import HttpClient
+from app.main import app
+from app.models import SourceConfig
+from app.services.health_monitor import SourceHealthMonitor
+from app.source_adapters.base import BaseSourceAdapter
+
+
+class SlowProbeClient:
+    def __init__(self, delay: float, failing: set[str] = frozenset()):
+        self.delay = delay
+        self.failing = failing
+        self.calls: list[str] = []
+        self._lock = threading.Lock()
+
+    def probe(self, url: str) -> int:
+        with self._lock:
+            self.calls.append(url)
+        time.sleep(self.delay)
+        if url in self.failing:
+            raise RuntimeError("404 Client Error")
+        return 200
+
+
+class AsyncProbeClient:
+    """Stands in for AsyncHttpClient; records which event loop each probe ran on."""
+
+    instances: list["AsyncProbeClient"] = []
+
+    def __init__(self, settings, politeness=None):
+        self.politeness = politeness
+        self.loops: set[int] = set()
+        self.calls: list[str] = []
+        AsyncProbeClient.instances.append(self)
+
+    async def probe(self, url: str) -> int:
+        self.loops.add(id(asyncio.get_running_loop()))
+        self.calls.append(url)
+        await asyncio.sleep(0.2)
+        return 200
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+def _adapters(count: int, http) -> list[BaseSourceAdapter]:
+    adapters = []
+    for index in range(count):
+        adapter = BaseSourceAdapter(
+            SourceConfig(
+                id=f"source_{index}",
+                name=f"Source {index}",
+                base_url=f"https://site{index}.example.com",
+                feed_url=f"https://site{index}.example.com/feed/",
+                listing_url=f"https://site{index}.example.com/news",
+            )
+        )
+        adapter.use_http_client(http)
+        adapters.append(adapter)
+    return adapters
+
+
+def _response(status_code: int) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    return response
+
+
+class SourceHealthMonitorTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        with patch.dict(os.environ, {}, clear=True):
+            base = load_settings(env_path=".env.missing")
+        self.settings = replace(base, health_cache_ttl_seconds=60, health_check_concurrency=8)
+
+    def test_probes_run_concurrently_and_snapshot_is_cached(self) -> None:
+        http = SlowProbeClient(delay=0.2)
+        monitor = SourceHealthMonitor(self.settings, _adapters(8, http))
+
+        started = time.perf_counter()
+        first = monitor.snapshot()
+        elapsed = time.perf_counter() - started
+
+        self.assertLess(elapsed, 0.2 * 4)
+        self.assertEqual([check.status for check in first.checks], ["ok"] * 8)
+        self.assertEqual(first.checks[0].detail, "feed reachable")
+
+        self.assertIs(monitor.snapshot(), first)
+        self.assertEqual(len(http.calls), 8)
+
+        forced = monitor.snapshot(refresh=True)
+        self.assertIsNot(forced, first)
+        self.assertEqual(len(http.calls), 16)
+
+    def test_expired_snapshot_is_reprobed(self) -> None:
+        http = SlowProbeClient(delay=0)
+        monitor = SourceHealthMonitor(replace(self.settings, health_cache_ttl_seconds=0), _adapters(2, http))
+        first = monitor.snapshot()
+        time.sleep(0.01)
+        self.assertIsNot(monitor.snapshot(), first)
+
+    def test_concurrent_callers_share_one_refresh(self) -> None:
+        http = SlowProbeClient(delay=0.1)
+        monitor = SourceHealthMonitor(self.settings, _adapters(3, http))
+
+        threads = [threading.Thread(target=monitor.snapshot) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(http.calls), 3)
+
+    def test_listing_fallback_and_failure_detail(self) -> None:
+        http = SlowProbeClient(
+            delay=0,
+            failing={"https://site0.example.com/feed/", "https://site1.example.com/feed/", "https://site1.example.com/news"},
+        )
+        checks = SourceHealthMonitor(self.settings, _adapters(2, http)).refresh().checks
+
+        self.assertEqual((checks[0].status, checks[0].detail), ("ok", "listing reachable (fallback)"))
+        self.assertEqual(checks[1].status, "error")
+        self.assertIn("listing=404 Client Error", checks[1].detail)
+
+    def test_async_engine_probes_on_one_event_loop(self) -> None:
+        AsyncProbeClient.instances.clear()
+        sync_http = SlowProbeClient(delay=0)
+        politeness = object()
+        monitor = SourceHealthMonitor(replace(self.settings, fetch_engine="async"), _adapters(8, sync_http), politeness)
+
+        with patch("app.services.health_monitor.AsyncHttpClient", AsyncProbeClient):
+            started = time.perf_counter()
+            checks = monitor.refresh().checks
+            elapsed = time.perf_counter() - started
+
+        self.assertLess(elapsed, 0.2 * 4)
+        self.assertEqual([check.detail for check in checks], ["feed reachable"] * 8)
+        (client,) = AsyncProbeClient.instances
+        self.assertEqual((len(client.calls), len(client.loops)), (8, 1))
+        self.assertIs(client.politeness, politeness)
+        self.assertEqual(sync_http.calls, [])
+
+    def test_probe_falls_back_to_ranged_get_when_head_is_refused(self) -> None:
+        client = HttpClient(replace(self.settings, respect_robots_txt=False))
+        session = MagicMock()
+        session.head.return_value = _response(405)
+        session.get.return_value = _response(206)
+
+        with patch.object(client, "session_for", return_value=session):
+            self.assertEqual(client.probe("https://example.com/feed/"), 206)
+
+        self.assertEqual(session.get.call_args.kwargs["headers"]["Range"], "bytes=0-0")
+        self.assertTrue(session.get.call_args.kwargs["stream"])
+        session.get.return_value.close.assert_called_once()
+
+        session.reset_mock()
+        session.head.return_value = _response(200)
+        with patch.object(client, "session_for", return_value=session):
+            self.assertEqual(client.probe("https://example.com/feed/"), 200)
+        session.get.assert_not_called()
+
+
+class SourceHealthEndpointTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        env = {"DB_PATH": f"{self._tmp.name}/test.db", "SCHEDULER_ENABLED": "false"}
+        self._env = patch.dict(os.environ, env, clear=True)
+        self._env.start()
+        self.client = TestClient(app)
+        self.client.__enter__()
+        self.http = SlowProbeClient(delay=0)
+        app.state.health_monitor = SourceHealthMonitor(app.state.settings, _adapters(2, self.http))
+
+    def tearDown(self) -> None:
+        self.client.__exit__(None, None, None)
+        self._env.stop()
+        db.close_pools()
+        self._tmp.cleanup()
+
+    def test_returns_cached_snapshot_with_age(self) -> None:
+        first = self.client.get("/api/sources/health").json()
+        self.assertEqual([source["status"] for source in first["sources"]], ["ok", "ok"])
+        self.assertGreaterEqual(first["age_seconds"], 0)
+
+        second = self.client.get("/api/sources/health").json()
+        self.assertEqual(second["checked_at_utc"], first["checked_at_utc"])
+        self.assertEqual(len(self.http.calls), 2)
+
+        self.client.get("/api/sources/health?refresh=true")
+        self.assertEqual(len(self.http.calls), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import os
+import unittest
+from unittest.mock import patch
+
+from app.config import load_settings
+from app.http_client import HttpClient, host_key
+
+
+class HttpClientTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        with patch.dict(os.environ, {"HTTP_POOL_MAXSIZE": "3"}, clear=True):
+            self.settings = load_settings(env_path=".env.missing")
+
+    def test_sessions_are_reused_per_host(self) -> None:
+        client = HttpClient(self.settings)
+        feed = client.session_for("https://Example.com/feed/")
+        article = client.session_for("https://example.com/news/story")
+        other = client.session_for("https://other.example.com/")
+
+        self.assertIs(feed, article)
+        self.assertIsNot(feed, other)
+        self.assertIs(client.session_for("https://example.com:443/"), feed)
+        self.assertEqual(feed.get_adapter("https://example.com")._pool_maxsize, 3)
+        client.close()
+
+    def test_host_key_normalizes_scheme_and_host(self) -> None:
+        self.assertEqual(host_key("HTTPS://Example.COM/a?b=1"), "https://example.com")
+        self.assertEqual(host_key("http://example.com:8080/"), "http://example.com:8080")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+import warnings
+from unittest.mock import patch
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore")
+    from fastapi.testclient import TestClient
+
+from app import db
+from app.main import app
+
+
+class HttpEtagTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        env = {"DB_PATH": f"{self._tmp.name}/test.db", "SCHEDULER_ENABLED": "false"}
+        self._env = patch.dict(os.environ, env, clear=True)
+        self._env.start()
+        self.client = TestClient(app)
+        self.client.__enter__()
+
+    def tearDown(self) -> None:
+        self.client.__exit__(None, None, None)
+        self._env.stop()
+        db.close_pools()
+        self._tmp.cleanup()
+
+    def test_articles_revalidate_until_data_changes(self) -> None:
+        first = self.client.get("/api/articles?limit=5")
+        self.assertEqual(first.status_code, 200)
+        etag = first.headers["ETag"]
+        self.assertEqual(first.headers["Cache-Control"], "no-cache")
+
+        cached = self.client.get("/api/articles?limit=5", headers={"If-None-Match": etag})
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.content, b"")
+        self.assertEqual(cached.headers["ETag"], etag)
+
+        other_query = self.client.get("/api/articles?limit=6", headers={"If-None-Match": etag})
+        self.assertEqual(other_query.status_code, 200)
+
+        with db.connection(os.environ["DB_PATH"]) as conn:
+            db.bump_data_version(conn)
+        changed = self.client.get("/api/articles?limit=5", headers={"If-None-Match": etag})
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed.headers["ETag"], etag)
+
+    def test_ingestion_status_etag(self) -> None:
+        first = self.client.get("/api/ingestion/status")
+        self.assertEqual(first.json(), {"running": False, "last_run": None})
+
+        etag = first.headers["ETag"]
+        weak = self.client.get("/api/ingestion/status", headers={"If-None-Match": f'"other", W/{etag}'})
+        self.assertEqual(weak.status_code, 304)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+import warnings
+from dataclasses import replace
+from datetime import timedelta
+from unittest.mock import patch
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore")
+    from fastapi.testclient import TestClient
+
+from app import db
+from app.config import load_settings
+from app.main import app
+from app.models import RawArticle, SourceConfig
+from app.services.ingestion import IngestionService
+from app.utils import to_iso_utc, utc_now
+
+
+class GatedAdapter:
+    """Returns one fresh article once ``gate`` is set, so tests can observe a run mid-flight."""
+
+    def __init__(self, source_id: str, gate: threading.Event):
+        self.source = SourceConfig(
+            id=source_id,
+            name=source_id,
+            base_url="https://example.com",
+            feed_url=None,
+            listing_url="https://example.com/news",
+        )
+        self.gate = gate
+
+    def use_http_client(self, http) -> None:
+        self.http = http
+
+    def fetch(self, settings):
+        self.gate.wait(timeout=5)
+        article = RawArticle(
+            source_id=self.source.id,
+            title=f"{self.source.id} story",
+            url=f"https://example.com/{self.source.id}",
+            published_at_utc=utc_now() - timedelta(hours=1),
+        )
+        return [article], []
+
+
+def _wait_for(fetch, until=bool, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        value = fetch()
+        if until(value):
+            return value
+        time.sleep(0.01)
+    raise AssertionError("condition not met in time")
+
+
+class IngestionJobsTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        with patch.dict(os.environ, {"DB_PATH": f"{self._tmp.name}/test.db"}, clear=True):
+            # One fetch worker, so the second source only starts after the first is written.
+            self.settings = replace(load_settings(env_path=".env.missing"), source_fetch_concurrency=1)
+        self.gates = [threading.Event(), threading.Event()]
+        self.adapters = [GatedAdapter("a", self.gates[0]), GatedAdapter("b", self.gates[1])]
+        db.bootstrap_database(
+            db_path=self.settings.db_path,
+            sources=[adapter.source for adapter in self.adapters],
+            now_iso_utc=to_iso_utc(utc_now()),
+        )
+        self.service = IngestionService(settings=self.settings, adapters=self.adapters)
+
+    def tearDown(self) -> None:
+        for gate in self.gates:
+            gate.set()
+        _wait_for(lambda: not self.service.is_running())
+        self.service.shutdown()
+        db.close_pools()
+        self._tmp.cleanup()
+
+    def test_start_run_returns_immediately_and_publishes_progress(self) -> None:
+        accepted, run, message = self.service.start_run(trigger="test")
+
+        self.assertTrue(accepted)
+        self.assertEqual(message, "started")
+        self.assertEqual((run["status"], run["sources_total"], run["sources_done"]), ("running", 2, 0))
+        self.assertTrue(self.service.is_running())
+        self.assertEqual(self.service.start_run(trigger="test")[:2], (False, None))
+
+        self.gates[0].set()
+        halfway = _wait_for(lambda: self.service.get_run(run["id"]), lambda r: r["sources_done"] == 1)
+        self.assertEqual((halfway["status"], halfway["records_so_far"]), ("running", 1))
+
+        self.gates[1].set()
+        done = _wait_for(lambda: self.service.get_run(run["id"]), lambda r: r["status"] != "running")
+        self.assertEqual(done["status"], "success")
+        self.assertEqual((done["sources_done"], done["records_so_far"], done["new_count"]), (2, 2, 2))
+        _wait_for(lambda: not self.service.is_running())
+
+    def test_unknown_run_is_none(self) -> None:
+        self.assertIsNone(self.service.get_run("missing"))
+
+
+class IngestionJobsEndpointTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        env = {"DB_PATH": f"{self._tmp.name}/test.db", "SCHEDULER_ENABLED": "false"}
+        self._env = patch.dict(os.environ, env, clear=True)
+        self._env.start()
+        self.client = TestClient(app)
+        self.client.__enter__()
+        self.gate = threading.Event()
+        adapter = GatedAdapter("a", self.gate)
+        db.bootstrap_database(
+            db_path=app.state.settings.db_path, sources=[adapter.source], now_iso_utc=to_iso_utc(utc_now())
+        )
+        app.state.ingestion_service = IngestionService(settings=app.state.settings, adapters=[adapter])
+
+    def tearDown(self) -> None:
+        self.gate.set()
+        _wait_for(lambda: not app.state.ingestion_service.is_running())
+        self.client.__exit__(None, None, None)
+        self._env.stop()
+        db.close_pools()
+        self._tmp.cleanup()
+
+    def test_trigger_returns_202_and_run_can_be_polled(self) -> None:
+        response = self.client.post("/api/ingestion/run")
+        self.assertEqual(response.status_code, 202)
+        run_id = response.json()["run"]["id"]
+        self.assertEqual(response.headers["Location"], f"/api/ingestion/runs/{run_id}")
+
+        self.assertEqual(self.client.post("/api/ingestion/run").status_code, 409)
+
+        polled = self.client.get(f"/api/ingestion/runs/{run_id}")
+        self.assertEqual(polled.json()["status"], "running")
+        unchanged = self.client.get(f"/api/ingestion/runs/{run_id}", headers={"If-None-Match": polled.headers["ETag"]})
+        self.assertEqual(unchanged.status_code, 304)
+
+        self.gate.set()
+        final = _wait_for(
+            lambda: self.client.get(f"/api/ingestion/runs/{run_id}").json(), lambda r: r["status"] != "running"
+        )
+        self.assertEqual((final["status"], final["sources_done"], final["records_so_far"]), ("success", 1, 1))
+        self.assertEqual(self.client.get("/api/ingestion/runs/missing").status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
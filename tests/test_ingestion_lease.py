@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+from datetime import timedelta
+from unittest.mock import patch
+
+from app import db
+from app.config import load_settings
+from app.models import RawArticle, SourceConfig
+from app.services.ingestion import INGESTION_LEASE, IngestionService
+from app.services.lease import DbLease, LeaseLost
+from app.utils import to_iso_utc, utc_now
+
+SOURCE = SourceConfig(
+    id="test_source",
+    name="Test Source",
+    base_url="https://example.com",
+    feed_url=None,
+    listing_url="https://example.com/news",
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = utc_now().replace(microsecond=0)
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds: int) -> None:
+        self.now += timedelta(seconds=seconds)
+
+
+class GatedAdapter:
+    def __init__(self, gate: threading.Event):
+        self.source = SOURCE
+        self.gate = gate
+
+    def use_http_client(self, http) -> None:
+        self.http = http
+
+    def fetch(self, settings):
+        self.gate.wait(timeout=5)
+        return [], []
+
+
+class LeaseStolenAdapter:
+    """Returns an article, but by then a heartbeat has found the lease taken over."""
+
+    def __init__(self):
+        self.source = SOURCE
+        self.service: IngestionService | None = None
+
+    def use_http_client(self, http) -> None:
+        self.http = http
+
+    def fetch(self, settings):
+        self.service.lease.lost.set()
+        article = RawArticle(
+            source_id=SOURCE.id,
+            title="Late",
+            url="https://example.com/late",
+            published_at_utc=utc_now() - timedelta(hours=1),
+        )
+        return [article], []
+
+
+class DbLeaseTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = f"{self._tmp.name}/test.db"
+        db.bootstrap_database(db_path=self.db_path, sources=[SOURCE], now_iso_utc=to_iso_utc(utc_now()))
+        self.clock = FakeClock()
+
+    def tearDown(self) -> None:
+        db.close_pools()
+        self._tmp.cleanup()
+
+    def _lease(self, owner: str) -> DbLease:
+        return DbLease(self.db_path, INGESTION_LEASE, ttl_seconds=60, owner=owner, clock=self.clock)
+
+    def test_only_one_owner_holds_the_lease(self) -> None:
+        first, second = self._lease("worker-1"), self._lease("worker-2")
+
+        self.assertTrue(first.acquire())
+        self.assertFalse(second.acquire())
+        self.assertEqual(second.holder(), "worker-1")
+
+        first.release()
+        self.assertIsNone(second.holder())
+        self.assertTrue(second.acquire())
+        self.assertIsNone(second.recovered_from)
+        second.release()
+
+    def test_expired_lease_is_recovered_and_heartbeat_extends_it(self) -> None:
+        crashed, survivor = self._lease("worker-1"), self._lease("worker-2")
+        self.assertTrue(crashed.acquire())
+        crashed._stop_heartbeat()  # the process died; nobody renews any more
+
+        self.clock.advance(30)
+        self.assertTrue(crashed.renew())
+        self.clock.advance(59)  # past the original expiry, inside the renewed one
+        self.assertFalse(survivor.acquire())
+        self.clock.advance(2)
+        self.assertIsNone(survivor.holder())
+
+        self.assertTrue(survivor.acquire())
+        self.assertEqual(survivor.recovered_from, "worker-1")
+        self.assertFalse(crashed.renew())
+        survivor.release()
+
+    def test_heartbeat_marks_a_taken_over_lease_as_lost(self) -> None:
+        stalled = DbLease(self.db_path, INGESTION_LEASE, ttl_seconds=3, owner="worker-1", clock=self.clock)
+        self.assertTrue(stalled.acquire())
+        stalled.ensure_held()
+
+        # The holder stalled past its expiry and another worker took over before the next beat.
+        self.clock.advance(5)
+        self.assertTrue(self._lease("worker-2").acquire())
+        self.assertTrue(stalled.lost.wait(timeout=5))
+        with self.assertRaises(LeaseLost):
+            stalled.ensure_held()
+        stalled._stop_heartbeat()
+
+
+class IngestionLeaseTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        with patch.dict(os.environ, {"DB_PATH": f"{self._tmp.name}/test.db"}, clear=True):
+            self.settings = load_settings(env_path=".env.missing")
+        db.bootstrap_database(db_path=self.settings.db_path, sources=[SOURCE], now_iso_utc=to_iso_utc(utc_now()))
+        self.gate = threading.Event()
+
+    def tearDown(self) -> None:
+        self.gate.set()
+        db.close_pools()
+        self._tmp.cleanup()
+
+    def _worker(self, owner: str, clock=utc_now) -> IngestionService:
+        lease = DbLease(self.settings.db_path, INGESTION_LEASE, ttl_seconds=60, owner=owner, clock=clock)
+        return IngestionService(settings=self.settings, adapters=[GatedAdapter(self.gate)], lease=lease)
+
+    def test_second_worker_skips_while_first_runs(self) -> None:
+        first, second = self._worker("worker-1"), self._worker("worker-2")
+
+        accepted, run, _ = first.start_run(trigger="scheduler")
+        self.assertTrue(accepted)
+        self.assertTrue(second.is_running())
+        self.assertEqual(second.run_once(trigger="scheduler"), (False, None, "ingestion already running"))
+
+        self.gate.set()
+        deadline = time.monotonic() + 5
+        while first.is_running() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(first.get_run(run["id"])["status"], "success")
+
+        accepted, _, _ = second.run_once(trigger="scheduler")
+        self.assertTrue(accepted)
+        first.shutdown()
+
+    def test_run_aborts_without_writing_once_the_lease_is_lost(self) -> None:
+        adapter = LeaseStolenAdapter()
+        service = IngestionService(settings=self.settings, adapters=[adapter])
+        adapter.service = service
+
+        accepted, run, _ = service.run_once(trigger="scheduler")
+
+        self.assertTrue(accepted)
+        self.assertEqual(run["status"], "failed")
+        self.assertEqual(run["notes"]["warnings"], [f"fatal: {INGESTION_LEASE} lease lost by {service.lease.owner}"])
+        with db.connection(self.settings.db_path, readonly=True) as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0], 0)
+            # The schedule belongs to whichever worker holds the lease now.
+            self.assertEqual(db.list_source_schedule(conn), [])
+        service.shutdown()
+
+    def test_runs_orphaned_by_a_dead_worker_are_closed_on_takeover(self) -> None:
+        clock = FakeClock()
+        dead = DbLease(self.settings.db_path, INGESTION_LEASE, ttl_seconds=60, owner="worker-1", clock=clock)
+        self.assertTrue(dead.acquire())
+        dead._stop_heartbeat()
+        with db.connection(self.settings.db_path) as conn:
+            db.create_ingestion_run(conn, "orphan", to_iso_utc(clock.now), notes={"trigger": "scheduler"})
+
+        clock.advance(120)
+        self.gate.set()
+        accepted, run, _ = self._worker("worker-2", clock=clock).run_once(trigger="scheduler")
+
+        self.assertTrue(accepted)
+        self.assertEqual(run["status"], "success")
+        with db.connection(self.settings.db_path, readonly=True) as conn:
+            orphan = db.get_ingestion_run(conn, "orphan")
+            self.assertIsNone(db.get_lease(conn, INGESTION_LEASE))
+        self.assertEqual(orphan["status"], "failed")
+        self.assertIn("lease expired: worker-1", orphan["notes"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+from dataclasses import replace
+from datetime import timedelta
+from unittest.mock import patch
+
+from app import db
+from app.config import load_settings
+from app.models import RawArticle, SourceConfig
+from app.services.ingestion import IngestionService
+from app.utils import to_iso_utc, utc_now
+
+
+class FakeAdapter:
+    def __init__(self, source_id: str, *, delay: float = 0.0, articles=None, fail: bool = False):
+        self.source = SourceConfig(
+            id=source_id,
+            name=source_id,
+            base_url="https://example.com",
+            feed_url=None,
+            listing_url="https://example.com/news",
+        )
+        self.delay = delay
+        self.articles = articles or []
+        self.fail = fail
+
+    def use_http_client(self, http) -> None:
+        self.http = http
+
+    def fetch(self, settings):
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("boom")
+        return list(self.articles), ["feed_error: slow"] if self.delay else []
+
+
+class WaitForOtherSourceAdapter:
+    """Async stand-in whose ``slow`` source only finishes once the fast one has been stored."""
+
+    def __init__(self, adapter: FakeAdapter, http):
+        self.adapter = adapter
+        self.source = adapter.source
+
+    async def fetch(self, settings):
+        if self.source.id == "slow":
+            deadline = time.monotonic() + 5
+            while time.monotonic() < deadline and not self._fast_stored(settings):
+                await asyncio.sleep(0.01)
+        return list(self.adapter.articles), []
+
+    @staticmethod
+    def _fast_stored(settings) -> bool:
+        with db.connection(settings.db_path, readonly=True) as conn:
+            return conn.execute("SELECT COUNT(*) FROM articles WHERE source_id = 'fast'").fetchone()[0] > 0
+
+
+class IngestionServiceTestCase(unittest.TestCase):
+    def test_sources_are_fetched_concurrently_with_error_isolation(self) -> None:
+        now = utc_now()
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch.dict(os.environ, {"DB_PATH": f"{tmp}/test.db"}, clear=True):
+                settings = replace(load_settings(env_path=".env.missing"), source_fetch_concurrency=4)
+
+            fresh = RawArticle(
+                source_id="a",
+                title="Fresh",
+                url="https://example.com/fresh",
+                published_at_utc=now - timedelta(hours=1),
+            )
+            stale = RawArticle(
+                source_id="b",
+                title="Stale",
+                url="https://example.com/stale",
+                published_at_utc=now - timedelta(hours=48),
+            )
+            adapters = [
+                FakeAdapter("a", delay=0.3, articles=[fresh]),
+                FakeAdapter("b", delay=0.3, articles=[stale]),
+                FakeAdapter("c", delay=0.3, fail=True),
+            ]
+            db.bootstrap_database(
+                db_path=settings.db_path,
+                sources=[adapter.source for adapter in adapters],
+                now_iso_utc=to_iso_utc(now),
+            )
+
+            service = IngestionService(settings=settings, adapters=adapters)
+            started = time.perf_counter()
+            accepted, run, _ = service.run_once(trigger="test")
+            elapsed = time.perf_counter() - started
+
+        self.assertTrue(accepted)
+        self.assertLess(elapsed, 0.8)
+        self.assertEqual(run["status"], "partial_failure")
+        self.assertEqual(run["new_count"], 1)
+        self.assertEqual(run["skipped_count"], 1)
+        self.assertEqual(run["error_count"], 1)
+        self.assertEqual(
+            run["notes"]["warnings"],
+            ["a: feed_error: slow", "b: feed_error: slow", "c: ingestion_error=boom"],
+        )
+
+    def test_async_engine_stores_each_source_as_soon_as_it_finishes(self) -> None:
+        now = utc_now()
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch.dict(os.environ, {"DB_PATH": f"{tmp}/test.db", "FETCH_ENGINE": "async"}, clear=True):
+                settings = load_settings(env_path=".env.missing")
+
+            def article(source_id: str) -> RawArticle:
+                return RawArticle(
+                    source_id=source_id,
+                    title=source_id,
+                    url=f"https://example.com/{source_id}",
+                    published_at_utc=now - timedelta(hours=1),
+                )
+
+            adapters = [FakeAdapter("slow", articles=[article("slow")]), FakeAdapter("fast", articles=[article("fast")])]
+            db.bootstrap_database(
+                db_path=settings.db_path,
+                sources=[adapter.source for adapter in adapters],
+                now_iso_utc=to_iso_utc(now),
+            )
+
+            service = IngestionService(settings=settings, adapters=adapters)
+            started = time.perf_counter()
+            with patch("app.services.ingestion.AsyncSourceAdapter", WaitForOtherSourceAdapter):
+                accepted, run, _ = service.run_once(trigger="test")
+            elapsed = time.perf_counter() - started
+            service.shutdown()
+            db.close_pools()
+
+        self.assertTrue(accepted)
+        # "slow" waits (up to 5s) for "fast" to be written, which only a streaming engine allows.
+        self.assertLess(elapsed, 2)
+        self.assertEqual((run["status"], run["new_count"]), ("success", 2))
+        self.assertEqual(list(run["notes"]["polled"]), ["fast", "slow"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+import unittest
+from dataclasses import replace
+from datetime import timezone
+from unittest.mock import MagicMock, patch
+
+from app.config import load_settings
+from app.http_client import HttpValidators
+from app.models import SourceConfig
+from app.source_adapters.base import BaseSourceAdapter
+
+LISTING_HTML = "<html><body>" + "".join(
+    f'<article><h2><a href="/story-{n}">Story {n}</a></h2></article>' for n in range(6)
+) + "</body></html>"
+
+
+class SlowArticleHttp:
+    """Serves the listing at once, then trickles an endless ``<head>`` for every article page."""
+
+    CHUNKS = 40
+
+    def __init__(self):
+        self.chunks_read = 0
+        self.finished = threading.Event()
+
+    def get_conditional(self, url: str):
+        return LISTING_HTML, HttpValidators(url)
+
+    def stream_text(self, url: str, consume, *, max_bytes: int) -> None:
+        try:
+            if consume("<html><head>"):
+                return
+            for _ in range(self.CHUNKS):
+                time.sleep(0.05)
+                self.chunks_read += 1
+                if consume("<!-- still loading -->"):
+                    return
+        finally:
+            self.finished.set()
+
+
+class ListingEnrichmentTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        with patch.dict(os.environ, {}, clear=True):
+            base = load_settings(env_path=".env.missing")
+        self.settings = replace(
+            base,
+            article_meta_fetch_budget=4,
+            article_meta_concurrency=4,
+            article_meta_deadline_seconds=1,
+        )
+        self.adapter = BaseSourceAdapter(
+            SourceConfig(
+                id="test_source",
+                name="Test Source",
+                base_url="https://example.com",
+                feed_url=None,
+                listing_url="https://example.com/news",
+            )
+        )
+
+    def test_meta_is_fetched_concurrently_within_budget_and_deadline(self) -> None:
+        fetched_urls: list[str] = []
+
+        def fetch_meta(url, settings, stop=None):
+            fetched_urls.append(url)
+            time.sleep(3 if url.endswith("story-0") else 0.3)
+            return {"snippet": f"meta for {url}", "image_url": "https://example.com/i.jpg"}
+
+        http = MagicMock()
+        http.get_conditional.return_value = (LISTING_HTML, HttpValidators("https://example.com/news"))
+        self.adapter.use_http_client(http)
+        with patch.object(self.adapter, "_fetch_article_meta", side_effect=fetch_meta):
+            started = time.perf_counter()
+            articles, _ = self.adapter._fetch_from_listing(self.settings)
+            elapsed = time.perf_counter() - started
+
+        self.assertLess(elapsed, 2)
+        self.assertEqual(
+            sorted(fetched_urls),
+            [f"https://example.com/story-{n}" for n in range(4)],
+        )
+        by_url = {article.url: article for article in articles}
+        self.assertEqual(len(articles), 6)
+        self.assertEqual(by_url["https://example.com/story-0"].snippet, "")
+        self.assertEqual(by_url["https://example.com/story-1"].snippet, "meta for https://example.com/story-1")
+        self.assertIsNone(by_url["https://example.com/story-5"].image_url)
+
+    def test_meta_fetches_still_streaming_at_the_deadline_are_stopped(self) -> None:
+        http = SlowArticleHttp()
+        self.adapter.use_http_client(http)
+
+        started = time.perf_counter()
+        articles, _ = self.adapter._fetch_from_listing(replace(self.settings, article_meta_fetch_budget=1))
+        self.assertLess(time.perf_counter() - started, 2)
+        self.assertEqual(articles[0].snippet, "")
+
+        self.assertTrue(http.finished.wait(timeout=2))
+        self.assertLess(http.chunks_read, SlowArticleHttp.CHUNKS)
+
+    def test_article_meta_published_time_is_utc(self) -> None:
+        meta = self.adapter._parse_article_meta(
+            '<html><head><meta property="article:published_time" content="2026-02-21T07:00:00-05:00">'
+            "</head><body><p>First paragraph</p></body></html>"
+        )
+        self.assertEqual(meta["published_at_utc"].tzinfo, timezone.utc)
+        self.assertEqual(meta["snippet"], "First paragraph")
+
+
+if __name__ == "__main__":
+    unittest.main()
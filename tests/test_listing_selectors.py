@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import os
+import unittest
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import patch
+
+from bs4 import BeautifulSoup
+
+from app.config import load_settings
+from app.models import SourceConfig
+from app.source_adapters.base import BaseSourceAdapter
+from app.source_adapters.parsing import InvalidSelector
+from app.source_adapters.registry import build_source_adapters
+
+FIXTURE = (Path(__file__).parent / "fixtures" / "listing_sample.html").read_text(encoding="utf-8")
+
+
+def _source(**overrides) -> SourceConfig:
+    values = dict(
+        id="test_source",
+        name="Test Source",
+        base_url="https://www.example.com",
+        feed_url=None,
+        listing_url="https://www.example.com/news/",
+        article_selector="article, .news-item, .post",
+        time_selector="time, .date",
+    )
+    values.update(overrides)
+    return SourceConfig(**values)
+
+
+class ListingSelectorsTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        with patch.dict(os.environ, {}, clear=True):
+            self.settings = load_settings(env_path=".env.missing")
+
+    def test_registered_sources_compile(self) -> None:
+        for adapter in build_source_adapters():
+            with self.subTest(source=adapter.source.id):
+                self.assertIsNotNone(adapter.selectors.link)
+
+    def test_invalid_selector_fails_adapter_construction(self) -> None:
+        with self.assertRaises(InvalidSelector) as ctx:
+            BaseSourceAdapter(_source(snippet_selector="p:not("))
+        self.assertEqual(ctx.exception.field_name, "snippet_selector")
+        self.assertIn("test_source", str(ctx.exception))
+
+    def test_compiled_selectors_match_string_selectors(self) -> None:
+        source = _source()
+        adapter = BaseSourceAdapter(source)
+        soup = BeautifulSoup(FIXTURE, "html.parser")
+
+        cards = soup.select(source.article_selector)
+        self.assertEqual(adapter.selectors.article.select(soup), cards)
+        for card in cards:
+            for name in ("link", "time", "snippet", "image"):
+                with self.subTest(selector=name):
+                    expected = card.select_one(getattr(source, f"{name}_selector"))
+                    self.assertIs(getattr(adapter.selectors, name).select_one(card), expected)
+
+    def test_card_limit_is_applied(self) -> None:
+        adapter = BaseSourceAdapter(_source())
+        # The first of the two card nodes is skipped: its first link wraps an image and has no title.
+        cards = adapter._parse_listing_cards(FIXTURE, replace(self.settings, max_items_per_source=2))
+        self.assertEqual([card.title for card in cards], ["Origin Report: Huila"])
+        self.assertEqual(adapter._parse_listing_cards(FIXTURE, replace(self.settings, max_items_per_source=0)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import os
+import unittest
+from dataclasses import replace
+from unittest.mock import patch
+
+from app.config import load_settings
+from app.politeness import HostPoliteness, HostThrottled, RobotsDisallowed, parse_retry_after
+
+HOST = "https://example.com"
+ROBOTS_TXT = """User-agent: *
+Crawl-delay: 5
+Disallow: /private/
+"""
+
+
+class HostPolitenessTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        with patch.dict(os.environ, {}, clear=True):
+            base = load_settings(env_path=".env.missing")
+        self.settings = replace(base, host_requests_per_second=2.0, host_burst=2, politeness_max_delay_seconds=30)
+
+    def test_token_bucket_allows_burst_then_spaces_requests(self) -> None:
+        politeness = HostPoliteness(self.settings)
+        with patch("app.politeness.time.monotonic", return_value=100.0):
+            waits = [politeness.reserve(HOST) for _ in range(4)]
+            other_host = politeness.reserve("https://other.example.com")
+
+        self.assertEqual(waits, [0.0, 0.0, 0.5, 1.0])
+        self.assertEqual(other_host, 0.0)
+
+    def test_retry_after_blocks_host(self) -> None:
+        politeness = HostPoliteness(self.settings)
+        with patch("app.politeness.time.monotonic", return_value=100.0):
+            politeness.penalize(HOST, 10)
+            self.assertEqual(politeness.reserve(HOST), 10.0)
+            politeness.penalize(HOST, 120)
+            with self.assertRaises(HostThrottled):
+                politeness.reserve(HOST)
+
+    def test_robots_crawl_delay_and_disallow(self) -> None:
+        politeness = HostPoliteness(self.settings)
+        with patch("app.politeness.time.monotonic", return_value=100.0):
+            self.assertTrue(politeness.needs_robots(HOST))
+            politeness.set_robots(HOST, ROBOTS_TXT)
+            self.assertFalse(politeness.needs_robots(HOST))
+            waits = [politeness.reserve(HOST) for _ in range(3)]
+        self.assertEqual(waits, [0.0, 5.0, 10.0])
+
+        politeness.check_allowed(HOST, f"{HOST}/news/story")
+        with self.assertRaises(RobotsDisallowed):
+            politeness.check_allowed(HOST, f"{HOST}/private/page")
+
+    def test_parse_retry_after(self) -> None:
+        self.assertEqual(parse_retry_after({"Retry-After": "7"}), 7.0)
+        self.assertEqual(parse_retry_after({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}), 0.0)
+        self.assertIsNone(parse_retry_after({}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from app import db
+from app.api.routes_articles import window_cutoff
+from app.models import NormalizedArticle, SourceConfig
+from app.services.result_cache import ResultCache
+from app.utils import article_id_from_canonical, to_iso_utc, utc_now
+
+
+class ResultCacheTestCase(unittest.TestCase):
+    def test_lru_eviction_and_counters(self) -> None:
+        cache = ResultCache(max_entries=2)
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+        self.assertEqual(cache.get("a"), b"1")
+        cache.put("c", b"3")  # evicts "b", the least recently used
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), b"3")
+        self.assertEqual(cache.stats(), {"entries": 2, "max_entries": 2, "hits": 2, "misses": 1})
+
+    def test_zero_size_disables_caching(self) -> None:
+        cache = ResultCache(max_entries=0)
+        cache.put("a", b"1")
+        self.assertIsNone(cache.get("a"))
+
+    def test_window_cutoff_is_stable_within_a_bucket(self) -> None:
+        base = datetime(2026, 2, 21, 12, 0, 0, tzinfo=timezone.utc)
+        cutoffs = {window_cutoff(base + timedelta(seconds=s), 24, 30) for s in range(30)}
+        self.assertEqual(cutoffs, {base - timedelta(hours=24)})
+        self.assertEqual(window_cutoff(base + timedelta(seconds=30), 24, 30), base - timedelta(hours=24, seconds=-30))
+
+
+class DataVersionTestCase(unittest.TestCase):
+    def test_article_writes_bump_data_version(self) -> None:
+        now = utc_now()
+        canonical = "https://example.com/story"
+        article = NormalizedArticle(
+            id=article_id_from_canonical(canonical),
+            source_id="test_source",
+            title="Story",
+            url=canonical,
+            canonical_url=canonical,
+            published_at_utc=to_iso_utc(now - timedelta(hours=48)),
+            snippet="",
+            image_url=None,
+            first_seen_at_utc=to_iso_utc(now),
+            last_seen_at_utc=to_iso_utc(now),
+        )
+        source = SourceConfig(
+            id="test_source",
+            name="Test Source",
+            base_url="https://example.com",
+            feed_url=None,
+            listing_url="https://example.com/news",
+        )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = f"{tmp}/test.db"
+            db.bootstrap_database(db_path=db_path, sources=[source], now_iso_utc=to_iso_utc(now))
+            try:
+                with db.connection(db_path) as conn:
+                    versions = [db.data_version(conn)]
+                    db.upsert_articles(conn, [article], to_iso_utc(now))
+                    versions.append(db.data_version(conn))
+                    db.set_article_saved(conn, article.id, True)
+                    versions.append(db.data_version(conn))
+                    db.set_article_saved(conn, article.id, False)
+                    db.cleanup_unsaved_older_than(conn, to_iso_utc(now))
+                    versions.append(db.data_version(conn))
+                    db.upsert_articles(conn, [article], to_iso_utc(now))
+                    db.delete_article(conn, article.id)
+                    versions.append(db.data_version(conn))
+
+                    # No-op writes leave the version alone.
+                    self.assertFalse(db.delete_article(conn, article.id))
+                    self.assertEqual(db.cleanup_unsaved_older_than(conn, to_iso_utc(now)), 0)
+                    versions.append(db.data_version(conn))
+            finally:
+                db.close_pools()
+
+        self.assertEqual(versions, [0, 1, 2, 4, 6, 6])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,26 @@
 from __future__ import annotations
 
 import unittest
+import warnings
+from datetime import timezone
+from pathlib import Path
 
-from app.utils import article_id_from_canonical, canonicalize_url, parse_datetime_to_utc
+from dateutil import parser as date_parser
+
+from app.models import RawArticle
+from app.utils import _parse_datetime_cached, article_id_from_canonical, canonicalize_url, parse_datetime_to_utc
+
+DATE_CORPUS = (Path(__file__).parent / "fixtures" / "date_strings.txt").read_text(encoding="utf-8").splitlines()
+
+
+def _dateutil_reference(value: str):
+    try:
+        dt = date_parser.parse(value)
+    except Exception:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
 
 
 class UtilsTestCase(unittest.TestCase):
@@ -10,6 +28,19 @@ class UtilsTestCase(unittest.TestCase):
         url = "https://Example.com/news/story/?utm_source=x&utm_medium=y&id=42#top"
         self.assertEqual(canonicalize_url(url), "https://example.com/news/story?id=42")
 
+    def test_canonicalize_url_is_idempotent_and_memoized(self) -> None:
+        canonicalize_url.cache_clear()
+        url = "/news/story/?utm_campaign=x"
+        first = canonicalize_url(url, "https://Example.com")
+        self.assertEqual(canonicalize_url(first), first)
+        self.assertIs(canonicalize_url(url, "https://Example.com"), first)
+        self.assertEqual(canonicalize_url.cache_info().hits, 1)
+
+    def test_raw_article_carries_article_id(self) -> None:
+        canonical = canonicalize_url("https://example.com/news/story/")
+        raw = RawArticle(source_id="s", title="T", url=canonical, published_at_utc=None)
+        self.assertEqual(raw.article_id, article_id_from_canonical(canonical))
+
     def test_article_id_is_deterministic(self) -> None:
         canonical = "https://example.com/news/story"
         self.assertEqual(article_id_from_canonical(canonical), article_id_from_canonical(canonical))
@@ -19,6 +50,21 @@ class UtilsTestCase(unittest.TestCase):
         self.assertIsNotNone(parsed)
         self.assertEqual(parsed.isoformat(), "2026-02-21T17:30:00+00:00")
 
+    def test_parse_datetime_matches_dateutil_on_corpus(self) -> None:
+        _parse_datetime_cached.cache_clear()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for value in DATE_CORPUS:
+                with self.subTest(value=value):
+                    self.assertEqual(parse_datetime_to_utc(value), _dateutil_reference(value))
+
+    def test_parse_datetime_is_memoized(self) -> None:
+        _parse_datetime_cached.cache_clear()
+        first = parse_datetime_to_utc("Sat, 21 Feb 2026 12:30:00 +0000")
+        second = parse_datetime_to_utc("  Sat, 21 Feb 2026 12:30:00 +0000 ")
+        self.assertIs(first, second)
+        self.assertEqual(_parse_datetime_cached.cache_info().hits, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
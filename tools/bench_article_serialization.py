@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app import db
+from app.models import NormalizedArticle, SourceConfig
+from app.schemas import ArticleListResponse, ArticleOut
+from app.serialization import article_list_body, orjson
+from app.utils import article_id_from_canonical, to_iso_utc, utc_now
+
+ITEM_COUNT = 200
+ROUNDS = 50
+
+
+def _pydantic_body(total, rows, next_cursor) -> bytes:
+    """The pre-fast-path route body: one ArticleOut per row, then the list model."""
+    items = [
+        ArticleOut(
+            id=row["id"],
+            source_id=row["source_id"],
+            source_name=row["source_name"],
+            title=row["title"],
+            url=row["url"],
+            canonical_url=row["canonical_url"],
+            published_at_utc=row["published_at_utc"],
+            snippet=row["snippet"] or "",
+            image_url=row["image_url"],
+            is_saved=bool(row["is_saved"]),
+            first_seen_at_utc=row["first_seen_at_utc"],
+            last_seen_at_utc=row["last_seen_at_utc"],
+        )
+        for row in rows
+    ]
+    return ArticleListResponse(total=total, items=items, next_cursor=next_cursor).model_dump_json().encode("utf-8")
+
+
+def _seed_rows(db_path: str):
+    now = utc_now()
+    source = SourceConfig(
+        id="bench",
+        name="Bench Source",
+        base_url="https://bench.example",
+        feed_url=None,
+        listing_url="https://bench.example/news",
+    )
+    db.bootstrap_database(db_path=db_path, sources=[source], now_iso_utc=to_iso_utc(now))
+    articles = []
+    for n in range(ITEM_COUNT):
+        canonical = f"https://bench.example/news/story-{n}"
+        published = to_iso_utc(now - timedelta(minutes=n))
+        articles.append(
+            NormalizedArticle(
+                id=article_id_from_canonical(canonical),
+                source_id="bench",
+                title=f"Roaster {n} expands into new markets",
+                url=canonical,
+                canonical_url=canonical,
+                published_at_utc=published,
+                snippet="A specialty roaster doubles capacity and opens a training lab. " * 4,
+                image_url=f"https://bench.example/img/{n}.jpg",
+                first_seen_at_utc=published,
+                last_seen_at_utc=published,
+            )
+        )
+    with db.connection(db_path) as conn:
+        db.upsert_articles(conn, articles, to_iso_utc(now))
+    with db.connection(db_path, readonly=True) as conn:
+        return db.list_articles(
+            conn,
+            cutoff_iso_utc=None,
+            saved="all",
+            source_id=None,
+            limit=ITEM_COUNT,
+        )
+
+
+def _measure(fn) -> dict:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"best_ms": round(best * 1000, 3), "peak_alloc_kib": round(peak / 1024, 1)}
+
+
+def main() -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        total, rows = _seed_rows(f"{tmp}/bench.db")
+        db.close_pools()
+
+    if _pydantic_body(total, rows, None) != article_list_body(total, rows, None):
+        print("serialized bodies differ", file=sys.stderr)
+        return 1
+
+    print(
+        json.dumps(
+            {
+                "items": len(rows),
+                "encoder": "orjson" if orjson is not None else "json",
+                "pydantic_models": _measure(lambda: _pydantic_body(total, rows, None)),
+                "fast_path": _measure(lambda: article_list_body(total, rows, None)),
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import sys
+import time
+import warnings
+from datetime import timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from dateutil import parser as date_parser
+
+from app.utils import _parse_datetime_cached, parse_datetime_to_utc
+
+CORPUS_FILE = ROOT / "tests" / "fixtures" / "date_strings.txt"
+# Roughly one day of ingestion: every source's feed items, each corpus string seen many times.
+REPEAT = 200
+
+
+def _dateutil_only(value: str):
+    try:
+        dt = date_parser.parse(value)
+    except Exception:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def _timed(fn, values) -> tuple[float, list]:
+    started = time.perf_counter()
+    results = [fn(value) for value in values]
+    return time.perf_counter() - started, results
+
+
+def _uncached(value: str):
+    _parse_datetime_cached.cache_clear()
+    return parse_datetime_to_utc(value)
+
+
+def main() -> int:
+    corpus = [line for line in CORPUS_FILE.read_text(encoding="utf-8").splitlines() if line.strip()]
+    values = corpus * REPEAT
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        dateutil_seconds, expected = _timed(_dateutil_only, values)
+        fast_path_seconds, fast_path = _timed(_uncached, values)
+        _parse_datetime_cached.cache_clear()
+        cached_seconds, cached = _timed(parse_datetime_to_utc, values)
+
+    mismatches = [value for value, a, b, c in zip(values, expected, fast_path, cached) if not (a == b == c)]
+    if mismatches:
+        print(json.dumps({"mismatches": sorted(set(mismatches))}, indent=2), file=sys.stderr)
+        return 1
+
+    print(
+        json.dumps(
+            {
+                "corpus_strings": len(corpus),
+                "parses": len(values),
+                "identical_output": True,
+                "dateutil_us_per_parse": round(dateutil_seconds / len(values) * 1e6, 2),
+                "fast_path_us_per_parse": round(fast_path_seconds / len(values) * 1e6, 2),
+                "fast_path_cached_us_per_parse": round(cached_seconds / len(values) * 1e6, 2),
+                "cache": _parse_datetime_cached.cache_info()._asdict(),
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
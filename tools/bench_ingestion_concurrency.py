@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import time
+from dataclasses import replace
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app import db
+from app.config import load_settings
+from app.models import RawArticle, SourceConfig
+from app.services.ingestion import IngestionService
+from app.utils import to_iso_utc, utc_now
+
+SOURCE_LATENCY_SECONDS = 0.2
+SOURCE_COUNTS = (1, 2, 5, 10, 20)
+
+
+class SimulatedAdapter:
+    """Adapter stand-in with fixed network latency and a handful of fresh articles."""
+
+    def __init__(self, index: int):
+        self.source = SourceConfig(
+            id=f"bench_{index}",
+            name=f"Bench {index}",
+            base_url="https://bench.example",
+            feed_url=None,
+            listing_url="https://bench.example/news",
+        )
+
+    def use_http_client(self, http) -> None:
+        self.http = http
+
+    def fetch(self, settings):
+        time.sleep(SOURCE_LATENCY_SECONDS)
+        now = utc_now()
+        return [
+            RawArticle(
+                source_id=self.source.id,
+                title=f"Story {n}",
+                url=f"https://bench.example/{self.source.id}/{n}",
+                published_at_utc=now,
+            )
+            for n in range(10)
+        ], []
+
+
+def _timed_run(settings, source_count: int) -> float:
+    adapters = [SimulatedAdapter(index) for index in range(source_count)]
+    db.bootstrap_database(
+        db_path=settings.db_path,
+        sources=[adapter.source for adapter in adapters],
+        now_iso_utc=to_iso_utc(utc_now()),
+    )
+    service = IngestionService(settings=settings, adapters=adapters)
+    started = time.perf_counter()
+    service.run_once(trigger="benchmark")
+    return time.perf_counter() - started
+
+
+def main() -> int:
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        base = replace(load_settings(), db_path=f"{tmp}/bench.db")
+        concurrent_settings = base
+        serial_settings = replace(base, source_fetch_concurrency=1)
+
+        for source_count in SOURCE_COUNTS:
+            results.append(
+                {
+                    "sources": source_count,
+                    "serial_seconds": round(_timed_run(serial_settings, source_count), 3),
+                    "concurrent_seconds": round(_timed_run(concurrent_settings, source_count), 3),
+                }
+            )
+
+    print(
+        json.dumps(
+            {
+                "source_latency_seconds": SOURCE_LATENCY_SECONDS,
+                "source_fetch_concurrency": concurrent_settings.source_fetch_concurrency,
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
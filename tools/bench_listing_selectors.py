@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from bs4 import BeautifulSoup
+
+from app.source_adapters.sca import SpecialtyCoffeeAssociationAdapter
+
+CARD_COUNT = 500
+ROUNDS = 5
+
+
+def _listing_fixture(card_count: int) -> str:
+    cards = []
+    for n in range(card_count):
+        cards.append(
+            f"""
+    <article class="post">
+      <a href="/news/story-{n}/"><img src="/img/story-{n}.jpg" alt=""></a>
+      <h2><a href="/news/story-{n}/">Story {n}</a></h2>
+      <span class="date">Feb {n % 28 + 1}, 2026</span>
+      <p>Snippet for story {n} with a <strong>bit</strong> of markup.</p>
+    </article>"""
+        )
+    return f"<html><body><main>{''.join(cards)}</main></body></html>"
+
+
+def _extract_with_strings(soup, source) -> int:
+    """Pre-compilation path: every ``select_one`` hands bs4 the raw selector string."""
+    matched = 0
+    for card in soup.select(source.article_selector)[:CARD_COUNT]:
+        nodes = (
+            card.select_one(source.link_selector),
+            card.select_one(source.time_selector),
+            card.select_one(source.snippet_selector),
+            card.select_one(source.image_selector),
+        )
+        matched += sum(node is not None for node in nodes)
+    return matched
+
+
+def _extract_compiled(soup, selectors) -> int:
+    matched = 0
+    for card in selectors.article.select(soup, limit=CARD_COUNT):
+        nodes = (
+            selectors.link.select_one(card),
+            selectors.time.select_one(card),
+            selectors.snippet.select_one(card),
+            selectors.image.select_one(card),
+        )
+        matched += sum(node is not None for node in nodes)
+    return matched
+
+
+def _best_of(fn) -> tuple[float, int]:
+    best = float("inf")
+    result = 0
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main() -> int:
+    adapter = SpecialtyCoffeeAssociationAdapter()
+    soup = BeautifulSoup(_listing_fixture(CARD_COUNT), "html.parser")
+
+    string_seconds, string_matches = _best_of(lambda: _extract_with_strings(soup, adapter.source))
+    compiled_seconds, compiled_matches = _best_of(lambda: _extract_compiled(soup, adapter.selectors))
+    if string_matches != compiled_matches:
+        print(f"match count differs: strings={string_matches} compiled={compiled_matches}", file=sys.stderr)
+        return 1
+
+    print(
+        json.dumps(
+            {
+                "cards": CARD_COUNT,
+                "rounds": ROUNDS,
+                "string_selectors_us_per_card": round(string_seconds / CARD_COUNT * 1e6, 1),
+                "compiled_selectors_us_per_card": round(compiled_seconds / CARD_COUNT * 1e6, 1),
+                "speedup": round(string_seconds / compiled_seconds, 2),
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,6 +11,8 @@ if str(ROOT) not in sys.path:
 
 from app import db
 from app.config import load_settings
+from app.http_client import HttpClient
+from app.services.health_monitor import SourceHealthMonitor
 from app.utils import to_iso_utc, utc_now
 
 
@@ -33,9 +35,12 @@ def main() -> int:
         return 1
 
     adapters = build_source_adapters()
+    http = HttpClient(settings)
+    for adapter in adapters:
+        adapter.use_http_client(http)
 
-    checks = [adapter.check_health(settings) for adapter in adapters]
-    with db.connection(settings.db_path) as conn:
+    checks = SourceHealthMonitor(settings, adapters).refresh().checks
+    with db.connection(settings.db_path, readonly=True) as conn:
         latest = db.latest_ingestion_run(conn)
 
     payload = {
@@ -11,6 +11,7 @@ if str(ROOT) not in sys.path:
 
 from app import db
 from app.config import load_settings
+from app.services.events import EventBus
 from app.services.ingestion import IngestionService
 from app.utils import to_iso_utc, utc_now
 
@@ -40,7 +41,8 @@ def main() -> int:
         now_iso_utc=to_iso_utc(utc_now()),
     )
 
-    service = IngestionService(settings=settings, adapters=adapters)
+    # Events go through the database, so dashboards connected to the API see this run too.
+    service = IngestionService(settings=settings, adapters=adapters, events=EventBus(db_path=settings.db_path))
     accepted, run, message = service.run_once(trigger="cli")
 
     payload = {
@@ -11,6 +11,8 @@ if str(ROOT) not in sys.path:
 
 from app import db
 from app.config import load_settings
+from app.http_client import HttpClient
+from app.services.health_monitor import SourceHealthMonitor
 from app.utils import to_iso_utc, utc_now
 
 
@@ -23,6 +25,9 @@ def main() -> int:
         return 1
 
     adapters = build_source_adapters()
+    http = HttpClient(settings)
+    for adapter in adapters:
+        adapter.use_http_client(http)
 
     db.bootstrap_database(
         db_path=settings.db_path,
@@ -30,7 +35,7 @@ def main() -> int:
         now_iso_utc=to_iso_utc(utc_now()),
     )
 
-    checks = [adapter.check_health(settings) for adapter in adapters]
+    checks = SourceHealthMonitor(settings, adapters).refresh().checks
     failures = [check for check in checks if check.status != "ok"]
 
     payload = {